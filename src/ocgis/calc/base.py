@@ -16,6 +16,7 @@ from ocgis.util.helpers import get_default_or_apply, get_iter
 from ocgis.util.logging_ocgis import ocgis_lh
 from ocgis.util.units import get_are_units_equal_by_string_or_cfunits
 from ocgis.variable.base import Variable, VariableCollection, get_default_fill_value_from_dtype
+from ocgis.variable.temporal import TemporalGroupIndex
 from six.moves import zip_longest
 
 # Standard dimension order for data arrays.
@@ -80,6 +81,11 @@ class AbstractFunction(AbstractOcgisObject):
     #: The output data type is NumPy's default float representation. This may be overloaded by subclasses.
     dtype_default = 'float'
 
+    #: If ``True``, the function overloads :meth:`~ocgis.calc.base.AbstractFunction.calculate_grouped` and all temporal
+    #: groups are reduced in a single call as opposed to calling
+    #: :meth:`~ocgis.calc.base.AbstractFunction.calculate` once per temporal group.
+    has_calculate_grouped = False
+
     #: The calculation's output units. Modify :meth:`get_output_units` for more complex units calculations. If the units
     #: are left as the default '_input_' then the input variable units are maintained. Otherwise, they will be set to
     #: units attribute value. The string flag is used to allow ``None`` units to be applied.
@@ -149,6 +155,24 @@ class AbstractFunction(AbstractOcgisObject):
 
         pass
 
+    def calculate_grouped(self, values, starts, **kwargs):
+        """
+        Optional method to overload for reducing every temporal group in a single call. Set
+        :attr:`~ocgis.calc.base.AbstractFunction.has_calculate_grouped` to ``True`` when overloading. The reduction must
+        match :meth:`~ocgis.calc.base.AbstractFunction.calculate` applied to each group independently.
+
+        :param values: A five-dimensional array with dimensions (realization, time, level, row, column). The time axis is
+         ordered by temporal group with each group occupying a contiguous block.
+        :type values: :class:`numpy.ma.MaskedArray`
+        :param starts: The start index of each temporal group block along the time axis.
+        :type starts: :class:`numpy.ndarray`
+        :param kwargs: Any keyword parameters for the function.
+        :returns: A five-dimensional array with the time axis length equal to the number of temporal groups.
+        :rtype: :class:`numpy.ma.MaskedArray`
+        """
+
+        raise NotImplementedError
+
     def execute(self):
         """
         Execute the computation over the input field.
@@ -285,6 +309,21 @@ class AbstractFunction(AbstractOcgisObject):
         ret = np.ma.array(ret, mask=values.mask[0, :, :])
         return ret
 
+    @staticmethod
+    def get_sample_size_grouped(values, starts):
+        """
+        Calculate the sample size of all temporal groups based on the mask. See
+        :meth:`~ocgis.calc.base.AbstractFunction.calculate_grouped` for a description of the arguments.
+
+        :type values: :class:`numpy.ma.core.MaskedArray`
+        :type starts: :class:`numpy.ndarray`
+        :rtype: :class:`numpy.ma.core.MaskedArray`
+        """
+
+        ret = get_grouped_count(values, starts)
+        ret = np.ma.array(ret, mask=np.ma.getmaskarray(values)[:, starts])
+        return ret
+
     @staticmethod
     def get_variable_value(variable):
         """
@@ -438,11 +477,20 @@ class AbstractFunction(AbstractOcgisObject):
         itr = itertools.product(*izl)
         return itr, src_names_extra_removed
 
+    def _get_group_index_(self, size):
+        # Flat time indices and group start indices used for grouped calculations. Returns None if a temporal group is
+        # empty as this may not be expressed with group start indices.
+        return get_grouped_index(self.tgd.dgroups, size)
+
     def _get_parms_(self):
         return self.parms
 
     def _get_temporal_agg_fill_(self, variable, name, file_only, f=None, parms=None,
                                 add_repeat_record_archetype_name=True):
+        # Reduce all temporal groups in a single call if the calculation supports it. Spatial aggregation is applied to
+        # each group independently and always uses the group loop.
+        use_grouped = f is None and self.has_calculate_grouped and not self.spatial_aggregation
+
         # Depending on the computational class we may be just aggregating temporally or actually executing the
         # calculation.
         f = f or self.calculate
@@ -475,6 +523,11 @@ class AbstractFunction(AbstractOcgisObject):
             else:
                 arr_fill_sample_size = None
 
+            if use_grouped:
+                group_index = self._get_group_index_(variable.shape[time_axis])
+            else:
+                group_index = None
+
             # Extra dimensions are not standard field dimensions.
             for yld in self._iter_conformed_arrays_(crosswalk, variable.shape, arr, arr_fill, arr_fill_sample_size):
                 if not self.calc_sample_size:
@@ -486,33 +539,36 @@ class AbstractFunction(AbstractOcgisObject):
                 # Some variables need access to the entire 5d conformed array.
                 self._current_conformed_array = carr
 
-                # Standard field dimension iterators.
-                standard_itrs = [list(range(carr.shape[ii])) for ii in [0, 2]]
-                standard_itrs.append(list(range(self.tgd.shape[0])))
-
-                # Execute the calculation.
-                for ir, il, it in itertools.product(*standard_itrs):
-                    self._curr_group = self.tgd.dgroups[it]
-                    calculation_value = carr[ir, self._curr_group, il, :, :]
-                    assert calculation_value.ndim == 3
-                    res = f(calculation_value, **parms)
-                    if self.spatial_aggregation:
-                        # Weights are not currently conformed so should not be used.
-                        res = self.aggregate_spatial(res, None)
-                        carr_fill.data[ir, it, il, :, :] = res
-                    else:
-                        try:
-                            carr_fill.data[ir, it, il, :, :] = res.data
-                        except ValueError:
-                            if not hasattr(res, 'mask'):
-                                raise ValueError('Array return from calculation is not a masked array.')
+                if group_index is not None:
+                    self._set_grouped_calculation_(carr, carr_fill, carr_fill_sample_size, group_index, parms)
+                else:
+                    # Standard field dimension iterators.
+                    standard_itrs = [list(range(carr.shape[ii])) for ii in [0, 2]]
+                    standard_itrs.append(list(range(self.tgd.shape[0])))
+
+                    # Execute the calculation.
+                    for ir, il, it in itertools.product(*standard_itrs):
+                        self._curr_group = self.tgd.dgroups[it]
+                        calculation_value = carr[ir, self._curr_group, il, :, :]
+                        assert calculation_value.ndim == 3
+                        res = f(calculation_value, **parms)
+                        if self.spatial_aggregation:
+                            # Weights are not currently conformed so should not be used.
+                            res = self.aggregate_spatial(res, None)
+                            carr_fill.data[ir, it, il, :, :] = res
                         else:
-                            carr_fill.mask[ir, it, il, :, :] = res.mask
-
-                    if self.calc_sample_size:
-                        ss = self.get_sample_size(calculation_value)
-                        carr_fill_sample_size.data[ir, it, il, :, :] = ss.data
-                        carr_fill_sample_size.mask[ir, it, il, :, :] = ss.mask
+                            try:
+                                carr_fill.data[ir, it, il, :, :] = res.data
+                            except ValueError:
+                                if not hasattr(res, 'mask'):
+                                    raise ValueError('Array return from calculation is not a masked array.')
+                            else:
+                                carr_fill.mask[ir, it, il, :, :] = res.mask
+
+                        if self.calc_sample_size:
+                            ss = self.get_sample_size(calculation_value)
+                            carr_fill_sample_size.data[ir, it, il, :, :] = ss.data
+                            carr_fill_sample_size.mask[ir, it, il, :, :] = ss.mask
 
             # Setting the values ensures the mask is updated on the output variables.
             fill.set_value(arr_fill)
@@ -570,6 +626,23 @@ class AbstractFunction(AbstractOcgisObject):
             msg = 'Alias updated to maintain uniqueness. Changing "{0}" to "{1}".'.format(original_alias, dv.alias)
             ocgis_lh(logger='calc.base', level=logging.WARNING, msg=msg)
 
+    def _set_grouped_calculation_(self, carr, carr_fill, carr_fill_sample_size, group_index, parms):
+        indices, starts = group_index
+        # Avoid copying the time axis if the groups are already ordered and contiguous.
+        if indices.shape[0] == carr.shape[1] and np.all(indices[1:] > indices[:-1]):
+            grouped_value = carr
+        else:
+            grouped_value = carr[:, indices, :, :, :]
+
+        res = self.calculate_grouped(grouped_value, starts, **parms)
+        carr_fill.data[:] = res.data
+        carr_fill.mask[:] = np.ma.getmaskarray(res)
+
+        if self.calc_sample_size:
+            ss = self.get_sample_size_grouped(grouped_value, starts)
+            carr_fill_sample_size.data[:] = ss.data
+            carr_fill_sample_size.mask[:] = ss.mask
+
 
 @six.add_metaclass(abc.ABCMeta)
 class AbstractFieldFunction(AbstractFunction):
@@ -928,3 +1001,74 @@ class AbstractKeyedOutputFunction(AbstractOcgisObject):
     @abc.abstractproperty
     def structure_dtype(self):
         dict
+
+
+def get_grouped_count(values, starts, axis=1):
+    """
+    Count the unmasked elements in contiguous groups.
+
+    :param values: The grouped array.
+    :type values: :class:`numpy.ma.MaskedArray`
+    :param starts: The start index of each group along ``axis``.
+    :type starts: :class:`numpy.ndarray`
+    :param int axis: The axis containing the groups.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    return np.add.reduceat(np.invert(np.ma.getmaskarray(values)), starts, axis=axis)
+
+
+def get_grouped_index(dgroups, size):
+    """
+    Convert a sequence of temporal group selections into a flat index array with each group occupying a contiguous
+    block.
+
+    >>> dgroups = [np.array([True, False, True]), np.array([False, True, False])]
+    >>> get_grouped_index(dgroups, 3)
+    (array([0, 2, 1]), array([0, 2]))
+
+    :param dgroups: Sequence of boolean arrays or slices selecting the members of each temporal group or a group index.
+    :type dgroups: sequence or :class:`~ocgis.variable.temporal.TemporalGroupIndex`
+    :param int size: The length of the time axis.
+    :returns: A tuple containing the flat index array and the start index of each group. ``None`` is returned if any
+     group is empty.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    if isinstance(dgroups, TemporalGroupIndex):
+        # Group membership is already stored as contiguous blocks.
+        if len(dgroups) == 0 or dgroups.get_counts().min() == 0:
+            return None
+        return dgroups.indices, dgroups.starts
+
+    arange = np.arange(size)
+    indices = [arange[dgroup] for dgroup in dgroups]
+    lengths = [ii.shape[0] for ii in indices]
+    if len(lengths) == 0 or min(lengths) == 0:
+        return None
+    starts = np.cumsum([0] + lengths[:-1])
+    return np.hstack(indices), starts
+
+
+def get_grouped_reduction(ufunc, values, starts, fill_value, axis=1):
+    """
+    Reduce contiguous groups using a binary NumPy ufunc. Masked elements are replaced by ``fill_value`` which should be
+    the identity for the reduction (i.e. zero for a sum). Groups with all elements masked are not masked by this
+    function.
+
+    Groups are reduced with a single call to the ufunc's ``reduceat`` method. Elements are accumulated in order, so
+    floating point sums may differ in the last bits from :func:`numpy.sum` which uses pairwise summation. Only
+    order-independent reductions (i.e. maximum, minimum, or integer sums) are identical to reducing each group
+    independently along ``axis``.
+
+    :param ufunc: The NumPy ufunc to use for the reduction (i.e. :func:`numpy.add`).
+    :param values: The grouped array.
+    :type values: :class:`numpy.ma.MaskedArray`
+    :param starts: The start index of each group along ``axis``.
+    :type starts: :class:`numpy.ndarray`
+    :param fill_value: Value to use for masked elements.
+    :param int axis: The axis containing the groups.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    return ufunc.reduceat(np.ma.filled(values, fill_value), starts, axis=axis)
@@ -5,6 +5,7 @@ from ocgis.base import get_variable_names
 from ocgis.calc.base import AbstractMultivariateFunction
 from ocgis.calc.eval_function import EvalFunction, MultivariateEvalFunction
 from ocgis.util.logging_ocgis import ocgis_lh
+from ocgis.variable.temporal import TEMPORAL_GROUP_CACHE
 
 
 class CalculationEngine(object):
@@ -45,11 +46,12 @@ class CalculationEngine(object):
         ret = True if any(check) else False
         return ret
 
-    def execute(self, coll, file_only=False, tgds=None):
+    def execute(self, coll, file_only=False, tgds=None, mark_progress=True):
         """
         :param :class:~`ocgis.SpatialCollection` coll:
         :param bool file_only:
         :param dict tgds: {'field_alias': :class:`ocgis.interface.base.dimension.temporal.TemporalGroupDimension`,...}
+        :param bool mark_progress: If ``False``, do not mark progress for each calculation.
         """
         from ocgis import VariableCollection
 
@@ -69,7 +71,10 @@ class CalculationEngine(object):
                     assert field.name in tgds_to_use
                 else:
                     if field.name not in tgds_to_use:
+                        # Groupings for identical time coordinates are retrieved from the temporal group cache.
                         tgds_to_use[field.name] = field.time.get_grouping(self.grouping)
+            ocgis_lh('Temporal group cache: {0}'.format(TEMPORAL_GROUP_CACHE.get_stats()), 'calc.engine',
+                     level=logging.DEBUG)
 
         # Iterate over functions.
         for ugid, container in list(coll.children.items()):
@@ -125,10 +130,11 @@ class CalculationEngine(object):
                     ocgis_lh('calculation finished', logger='calc.engine', level=logging.DEBUG)
 
                     # Try to mark progress. Okay if it is not there.
-                    try:
-                        self._progress.mark()
-                    except AttributeError:
-                        pass
+                    if mark_progress:
+                        try:
+                            self._progress.mark()
+                        except AttributeError:
+                            pass
 
                 out_field = function.field.copy()
                 function_tag = function.tag
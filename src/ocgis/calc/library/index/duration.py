@@ -4,7 +4,6 @@ import numpy as np
 from ocgis import env
 from ocgis.calc import base
 from ocgis.exc import DefinitionValidationError
-from ocgis.util.helpers import iter_array
 
 
 class Duration(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFunction):
@@ -27,36 +26,32 @@ class Duration(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFun
         """
 
         assert (len(values.shape) == 3)
-        # storage array for counts
         shp_out = values.shape[-2:]
-        store = np.zeros(shp_out, dtype=self.dtype).flatten()
-        # get the summary operation from the numpy library
-        summary_operation = getattr(np, summary)
+        size = int(np.prod(shp_out))
 
-        # find longest sequence for each geometry across time dimension
-        for ii, fill in enumerate(self._iter_consecutive_(values, threshold, operation)):
-            # case of only a singular occurrence
-            if len(fill) > 1:
-                fill = summary_operation(fill)
-            else:
-                try:
-                    fill = fill[0]
-                # value is likely masked
-                except IndexError:
-                    fill = 0
-            store[ii] = fill
-
-        store.resize(shp_out)
+        cells, lengths = self._get_spells_(values, threshold, operation)
+        count = np.bincount(cells, minlength=size)
+        total = np.bincount(cells, weights=lengths, minlength=size)
+        # The summary operation is only applied if there is more than one spell. A single spell is its own summary.
+        summarized = get_spell_summary(cells, lengths, size, summary)
+        store = np.zeros(size, dtype=self.dtype)
+        store[:] = np.where(count == 1, total, summarized)
+        store = store.reshape(shp_out)
 
         # update the output mask. this only applies to geometries so pick the
         # first masked time field
-        store = np.ma.array(store, mask=values.mask[0, :, :])
+        store = np.ma.array(store, mask=np.ma.getmaskarray(values)[0, :, :])
 
         return store
 
-    def _iter_consecutive_(self, values, threshold, operation):
-        # time index reference
-        ref = np.arange(0, values.shape[0])
+    @staticmethod
+    def _get_spells_(values, threshold, operation):
+        """
+        :returns: Tuple of flat cell indices and spell lengths ordered by cell and time. Masked values are not
+         included in spells.
+        :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+
         # perform requested logical operation
         if operation == 'gt':
             arr = values > threshold
@@ -66,27 +61,20 @@ class Duration(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFun
             arr = values >= threshold
         elif operation == 'lte':
             arr = values <= threshold
+        arr = np.ma.filled(arr, False)
+
+        cells, _, lengths = get_spells(arr)
 
-        # find longest sequence for each geometry across time dimension
-        for rowidx, colidx in iter_array(values[0, :, :], use_mask=False):
-            vec = arr[:, rowidx, colidx].reshape(-1)
-            # check first if there is a longer series than 1
-            if np.any(np.diff(ref[vec]) == 1):
-                # find locations where the values switch
-                diff_idx = np.diff(vec)
-                if diff_idx.shape != ref.shape:
-                    diff_idx = np.append(diff_idx, [False])
-                split_idx = ref[diff_idx] + 1
-                splits = np.array_split(vec, split_idx)
-                fill = [a.sum() for a in splits if np.all(a)]
-            # case of only a singular occurrence
-            elif np.any(vec):
-                fill = [1]
-            # case for no occurrence
-            else:
-                fill = [0]
-
-            yield (fill)
+        # Cells containing only single time step spells are reported as a single spell with length one.
+        if cells.shape[0] > 0:
+            first = np.ones(cells.shape[0], dtype=bool)
+            first[1:] = cells[1:] != cells[:-1]
+            longest = np.maximum.reduceat(lengths, np.flatnonzero(first))
+            singles = np.repeat(longest == 1, np.diff(np.append(np.flatnonzero(first), cells.shape[0])))
+            keep = first | np.invert(singles)
+            cells, lengths = cells[keep], lengths[keep]
+
+        return cells, lengths
 
     @classmethod
     def validate(cls, ops):
@@ -113,14 +101,30 @@ class FrequencyDuration(base.AbstractKeyedOutputFunction, Duration):
         """
 
         shp_out = values.shape[-2:]
-        store = np.zeros(shp_out, dtype=object).flatten()
-        for ii, duration in enumerate(self._iter_consecutive_(values, threshold, operation)):
-            summary = self._get_summary_(duration)
-            store[ii] = summary
-        store.resize(shp_out)
+        size = int(np.prod(shp_out))
+
+        cells, lengths = self._get_spells_(values, threshold, operation)
+        # Cells without spells have a single duration of zero.
+        empty = np.flatnonzero(np.bincount(cells, minlength=size) == 0)
+        cells = np.append(cells, empty)
+        lengths = np.append(lengths, np.zeros(empty.shape[0], dtype=lengths.dtype))
+
+        # Count unique durations for each cell. Keys are sorted by cell then duration.
+        keys, counts = np.unique(cells * (values.shape[0] + 1) + lengths, return_counts=True)
+        key_cells, key_durations = np.divmod(keys, values.shape[0] + 1)
+        splits = np.flatnonzero(np.diff(key_cells)) + 1
+
+        store = np.zeros(size, dtype=object)
+        for cell, durations, duration_counts in zip(key_cells[np.append(0, splits)], np.split(key_durations, splits),
+                                                    np.split(counts, splits)):
+            summary = np.empty(durations.shape[0], dtype=self.structure_dtype)
+            summary['duration'] = durations
+            summary['count'] = duration_counts
+            store[cell] = summary
+        store = store.reshape(shp_out)
 
         # Update the output mask. this only applies to geometries so pick the first masked time field
-        store = np.ma.array(store, mask=values.mask[0, :, :])
+        store = np.ma.array(store, mask=np.ma.getmaskarray(values)[0, :, :])
 
         return store
 
@@ -151,3 +155,79 @@ class FrequencyDuration(base.AbstractKeyedOutputFunction, Duration):
             ret[ii]['duration'] = sd
             ret[ii]['count'] = count
         return ret
+
+
+def get_spells(arr):
+    """
+    Find spells (runs of consecutive ``True`` values) along the leading axis of a boolean array. All trailing
+    dimensions are searched at once.
+
+    >>> arr = np.array([[True, False], [True, True], [False, True]])
+    >>> get_spells(arr)
+    (array([0, 1]), array([0, 1]), array([2, 2]))
+
+    :param arr: Boolean array with time as the leading axis.
+    :type arr: :class:`numpy.ndarray`
+    :returns: A tuple containing the flat index of the trailing dimensions (cell), the start time index, and the length
+     of each spell. Spells are ordered by cell then start index.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    arr = np.asarray(arr, dtype=bool)
+    arr = arr.reshape(arr.shape[0], -1)
+    # Pad each cell's time series with False so every spell has a start and stop edge.
+    padded = np.zeros((arr.shape[1], arr.shape[0] + 2), dtype=np.int8)
+    padded[:, 1:-1] = arr.T
+    edges = np.diff(padded, axis=1)
+    cells, starts = np.nonzero(edges == 1)
+    stops = np.nonzero(edges == -1)[1]
+    return cells, starts, stops - starts
+
+
+def get_spell_summary(cells, lengths, size, summary):
+    """
+    Summarize spell lengths for each cell using segment reductions.
+
+    :param cells: The cell index for each spell sorted in ascending order.
+    :type cells: :class:`numpy.ndarray`
+    :param lengths: The length of each spell.
+    :type lengths: :class:`numpy.ndarray`
+    :param int size: The total number of cells.
+    :param str summary: The summary operation. One of ``'count'``, ``'sum'``, ``'mean'``, ``'median'``, ``'std'``,
+     ``'max'``, or ``'min'``. Other NumPy function names are applied to each cell's spell lengths.
+    :returns: The summary for each cell. Cells without spells are zero.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    count = np.bincount(cells, minlength=size)
+    has_spells = count > 0
+    offsets = np.cumsum(count) - count
+    ret = np.zeros(size, dtype=float)
+
+    if summary == 'count':
+        ret[:] = count
+    elif summary in ('sum', 'mean', 'std'):
+        total = np.bincount(cells, weights=lengths, minlength=size)
+        if summary == 'sum':
+            ret[:] = total
+        else:
+            ret[has_spells] = total[has_spells] / count[has_spells]
+            if summary == 'std':
+                anomaly = lengths - ret[cells]
+                squares = np.bincount(cells, weights=anomaly * anomaly, minlength=size)
+                ret[has_spells] = np.sqrt(squares[has_spells] / count[has_spells])
+    elif summary in ('max', 'min'):
+        ufunc = np.maximum if summary == 'max' else np.minimum
+        ret[has_spells] = ufunc.reduceat(lengths, offsets[has_spells])
+    elif summary == 'median':
+        # Sort the lengths within each cell. Cells are already sorted.
+        sorted_lengths = lengths[np.lexsort((lengths, cells))]
+        lower = sorted_lengths[(offsets + (count - 1) // 2)[has_spells]]
+        upper = sorted_lengths[(offsets + count // 2)[has_spells]]
+        ret[has_spells] = (lower + upper) / 2.
+    else:
+        summary_operation = getattr(np, summary)
+        for cell, offset in zip(np.flatnonzero(has_spells), offsets[has_spells]):
+            ret[cell] = summary_operation(lengths[offset:offset + count[cell]])
+
+    return ret
@@ -45,7 +45,7 @@ class FreezeThaw(base.AbstractUnivariateSetFunction, base.AbstractParameterizedF
                                                       try_cfunits=env.USE_CFUNITS):
             tas = values - 273.15
 
-        out = np.apply_along_axis(freezethaw1d, 0, tas, threshold=threshold)
+        out = freezethawnd(tas, threshold)
         return np.ma.masked_invalid(out)
 
 
@@ -108,3 +108,107 @@ def freezethaw1d(x, threshold):
 
     # Return the number of transitions from frozen to thawed or vice-versa
     return float(len(cycles) - 2)  # There are two "artificial" transitions
+
+
+def freezethawnd(x, threshold, max_elements=2 ** 22):
+    """
+    Return the number of freeze-thaw transitions for each series along the leading axis of ``x``. The result for each
+    series is equal to :func:`freezethaw1d` but all series are processed together. Series are processed in blocks to
+    bound memory usage.
+
+    Parameters
+    ----------
+    x : ndarray or MaskedArray
+      The daily temperature series (C) with time as the leading axis.
+    threshold : float
+      The threshold in degree-days above or below the freezing point at
+      which we consider the soil thawed or frozen.
+    max_elements : int
+      The maximum number of series elements to process in a block.
+
+    Returns
+    -------
+    out : ndarray
+      The number of times the medium thawed or froze with shape ``x.shape[1:]``. Series with all values masked are
+      NaN.
+    """
+
+    shape = x.shape[1:]
+    ntime = x.shape[0]
+    data = np.ma.getdata(x).reshape(ntime, -1).T
+    mask = np.ma.getmaskarray(x).reshape(ntime, -1).T
+
+    ret = np.empty(data.shape[0], dtype=float)
+    block_size = max(max_elements // max(ntime, 1), 1)
+    for start in range(0, data.shape[0], block_size):
+        stop = start + block_size
+        ret[start:stop] = _get_freezethaw_count_(data[start:stop], mask[start:stop], threshold)
+    return ret.reshape(shape)
+
+
+def _get_freezethaw_count_(data, mask, threshold):
+    # Count freeze-thaw transitions for a block of series with shape (series, time). This follows freezethaw1d: the
+    # outcome of each freezing point crossing is found first and crossings are then accepted in order as events.
+
+    nseries, ntime = data.shape
+
+    # Masked values are compressed by moving valid values to the front of each series. A zero is prepended to avoid
+    # issues when the threshold is reached right at the first value.
+    order = np.argsort(mask, axis=1, kind='stable')
+    length = ntime - mask.sum(axis=1) + 1
+    x = np.zeros((nseries, ntime + 1), dtype=np.result_type(np.array([0]), data))
+    x[:, 1:] = np.take_along_axis(data, order, axis=1)
+    x[np.arange(ntime + 1) >= length[:, np.newaxis]] = 0
+
+    # Compute the cumulative degree days relative to the freezing point.
+    cx = np.cumsum(x, axis=1)
+
+    # Find the places where the temperature crosses the freezing point (FP). The first position is always a crossing.
+    over = x >= 0
+    change = np.diff(over, axis=1) & (np.arange(ntime) < (length - 1)[:, np.newaxis])
+    change_series, change_position = np.nonzero(change)
+    series = np.append(np.arange(nseries), change_series)
+    position = np.append(np.zeros(nseries, dtype=int), change_position)
+    # Sort crossings by series keeping the prepended crossing first.
+    key = np.append(np.zeros(nseries, dtype=int), change_position * 2 + 1)
+    sort = np.lexsort((key, series))
+    series, position = series[sort], position[sort]
+
+    # For each crossing, find the first place where the threshold is exceeded (from above or below) after resetting
+    # the cumulative sum at the crossing.
+    event = np.full(series.shape[0], -1, dtype=int)
+    sign = np.zeros(series.shape[0], dtype=cx.dtype)
+    cx_flat = cx.reshape(-1)
+    # Positions are tracked as flat indices into the cumulative sums for the crossings still searching.
+    active = np.arange(series.shape[0])
+    current = series * (ntime + 1) + position
+    stop = series * (ntime + 1) + length[series]
+    base = cx_flat[current]
+    while active.shape[0] > 0:
+        d = cx_flat[current] - base
+        hit = np.abs(d) >= threshold
+        event[active[hit]] = current[hit] - series[active[hit]] * (ntime + 1)
+        sign[active[hit]] = np.sign(d[hit])
+        current += 1
+        keep = np.invert(hit) & (current < stop)
+        active, current, stop, base = active[keep], current[keep], stop[keep], base[keep]
+
+    # Accept crossings in order. A crossing is skipped if it occurs before the last event and an event is stored only
+    # if it differs from the last.
+    count = np.bincount(series, minlength=nseries)
+    offsets = np.cumsum(count) - count
+    last = np.zeros(nseries, dtype=cx.dtype)
+    nevents = np.zeros(nseries, dtype=int)
+    for rank in range(count.max()):
+        idx_series = np.flatnonzero(count > rank)
+        idx_crossing = offsets[idx_series] + rank
+        candidate = sign[idx_crossing] * event[idx_crossing]
+        accept = (position[idx_crossing] >= np.abs(last[idx_series])) & (event[idx_crossing] >= 0) & \
+                 (sign[idx_crossing] != np.sign(last[idx_series]))
+        last[idx_series[accept]] = candidate[accept]
+        nevents[idx_series[accept]] += 1
+
+    # There are two "artificial" transitions.
+    ret = (nevents - 1).astype(float)
+    ret[length == 1] = np.nan
+    return ret
@@ -1,9 +1,9 @@
 import calendar
-import itertools
 from collections import OrderedDict, defaultdict
 from datetime import datetime
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from ocgis.calc import base
 from ocgis.calc.base import AbstractUnivariateFunction, AbstractParameterizedFunction
 from ocgis.exc import DefinitionValidationError
@@ -19,12 +19,18 @@ class MovingWindow(AbstractUnivariateFunction, AbstractParameterizedFunction):
 
     _potential_operations = ('mean', 'min', 'max', 'median', 'var', 'std')
 
+    # The maximum number of elements to sort at once when computing moving window medians.
+    _max_batch_elements = 2 ** 24
+    # The minimum window width for computing window sums from cumulative sums. Narrower windows are summed directly
+    # which matches the summation order used by NumPy for short reductions.
+    _min_cumsum_window = 8
+
     def calculate(self, values, k=None, operation=None, mode='valid'):
         """
         Calculate ``operation`` for the set of values with window of width ``k`` centered on time coordinate `t`. The
         ``mode`` may either be ``'valid'`` or ``'same'`` following the definition here: http://docs.scipy.org/doc/numpy/reference/generated/numpy.convolve.html.
         The window width ``k`` must be an odd number and >= 3. Supported operations are: mean, min, max, median, var,
-        and std.
+        and std. Masked values are excluded from the window operations.
 
         :param values: Array containing variable values.
         :type values: :class:`numpy.ma.core.MaskedArray`
@@ -43,37 +49,37 @@ class MovingWindow(AbstractUnivariateFunction, AbstractParameterizedFunction):
         assert values.ndim == 5
         assert operation in self._potential_operations
 
-        operation = getattr(np, operation)
+        assert k % 2 != 0
+        assert k >= 3
+
+        # size of one side of the window
+        shift = int((k - 1) / 2)
+        ntime = values.shape[1]
 
-        fill = values.copy()
+        # Move time to the leading axis and pad both ends with masked values. Each origin then has a full window and
+        # truncated windows in "same" mode are handled by excluding the masked padding.
+        pad_width = [(shift, shift)] + [(0, 0)] * 4
+        data = np.pad(np.moveaxis(np.ma.getdata(values), 1, 0), pad_width, mode='constant')
+        mask = np.pad(np.moveaxis(np.ma.getmaskarray(values), 1, 0), pad_width, mode='constant', constant_values=True)
 
-        # perform the moving average on the time axis
-        axes = [0, 2]
-        itrs = [list(range(values.shape[axis])) for axis in axes]
-        for ie, il in itertools.product(*itrs):
-            values_slice = values[ie, :, il, :, :]
-            build = True
-            for origin, values_kernel in self._iter_kernel_values_(values_slice, k, mode=mode):
-                if build:
-                    # if only the valid region is returned, this index will determine where the start index for the
-                    # field/fill slice is
-                    idx_start = origin
-                    build = False
-                fill[ie, origin, il, :, :] = operation(values_kernel, axis=0)
+        res, res_mask = self._get_window_reduction_(data, mask, k, operation)
+        res = np.moveaxis(res, 0, 1)
+        res_mask = np.moveaxis(res_mask, 0, 1)
 
+        fill_data = np.ma.getdata(values).copy()
         if mode == 'valid':
-            # slice the field and fill arrays
-            # self.field = self.field[:, idx_start:origin + 1, :, :, :]
-            # Mask the invalid regions.
-            fill.mask[:] = True
-            fill.mask[:, idx_start:origin + 1, :, :, :] = False
-            # self._finalize_slice = [slice(None), slice(idx_start, origin + 1), slice(None), slice(None), slice(None)]
+            # Only values with a full window overlap are unmasked.
+            select = (slice(None), slice(shift, max(ntime - shift, shift)))
+            fill_data[select] = res[select]
+            fill_mask = np.ones(values.shape, dtype=bool)
+            fill_mask[select] = False
         elif mode == 'same':
-            pass
+            fill_data[:] = res
+            fill_mask = res_mask
         else:
             raise NotImplementedError(mode)
 
-        return fill
+        return np.ma.array(fill_data, mask=fill_mask, fill_value=values.fill_value)
 
     @classmethod
     def validate(cls, ops):
@@ -134,6 +140,120 @@ class MovingWindow(AbstractUnivariateFunction, AbstractParameterizedFunction):
         else:
             raise NotImplementedError(mode)
 
+    @classmethod
+    def _get_window_reduction_(cls, data, mask, k, operation):
+        """
+        Reduce moving windows along the leading axis with window values following the masked array operations. The
+        mean, var, and std operations use differences of cumulative sums. Sliding window views are used for min, max,
+        and median.
+
+        :param data: The padded value array with time as the leading axis.
+        :type data: :class:`numpy.ndarray`
+        :param mask: The mask for ``data``. ``True`` values are excluded from the window operation.
+        :type mask: :class:`numpy.ndarray`
+        :param int k: The width of the moving window.
+        :param str operation: The window operation.
+        :returns: A tuple containing the reduced values and mask. The leading axis is reduced by ``k - 1``.
+        :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+
+        n = data.shape[0] - k + 1
+
+        if operation in ('mean', 'var', 'std'):
+            valid = np.invert(mask)
+            count = cls._get_window_sum_(valid.astype(int), k)
+            empty = count == 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if k < cls._min_cumsum_window:
+                    ret = cls._get_window_moments_direct_(data, mask, k, n, operation, count, empty)
+                else:
+                    ret = cls._get_window_moments_cumsum_(data, valid, k, operation, count, empty)
+                if operation == 'std':
+                    ret = np.sqrt(ret)
+            ret_mask = empty
+        else:
+            if operation == 'median':
+                ret = np.empty((n,) + data.shape[1:], dtype=float)
+                size_element = max(int(np.prod(data.shape[1:])), 1) * k
+                batch_size = max(cls._max_batch_elements // size_element, 1)
+                for start in range(0, n, batch_size):
+                    stop = min(start + batch_size, n)
+                    window_data = sliding_window_view(data[start:stop + k - 1], k, axis=0)
+                    window_mask = sliding_window_view(mask[start:stop + k - 1], k, axis=0)
+                    ret[start:stop] = np.median(window_data, axis=-1)
+                    # Only windows with some masked values require a masked median.
+                    partial = window_mask.any(axis=-1) & np.invert(window_mask.all(axis=-1))
+                    if partial.any():
+                        partial_median = np.ma.median(np.ma.array(window_data[partial], mask=window_mask[partial]),
+                                                      axis=-1)
+                        ret[start:stop][partial] = partial_median.filled(0)
+            else:
+                if operation == 'min':
+                    filled = np.where(mask, np.ma.minimum_fill_value(data), data)
+                    ufunc = np.minimum
+                else:
+                    filled = np.where(mask, np.ma.maximum_fill_value(data), data)
+                    ufunc = np.maximum
+                ret = ufunc.reduce(sliding_window_view(filled, k, axis=0), axis=-1)
+            ret_mask = sliding_window_view(mask, k, axis=0).all(axis=-1)
+            ret = np.where(ret_mask, np.ma.default_fill_value(data), ret)
+
+        return ret, ret_mask
+
+    @staticmethod
+    def _get_window_moments_cumsum_(data, valid, k, operation, count, empty):
+        if np.issubdtype(data.dtype, np.integer):
+            # Integer cumulative sums are exact.
+            centered = np.where(valid, data, 0).astype(np.int64)
+            center = 0
+        else:
+            # Center the values on their mean to limit the cancellation error when differencing cumulative sums.
+            center = np.where(valid, data, 0).sum(axis=0, dtype=float) / np.maximum(valid.sum(axis=0), 1)
+            centered = np.where(valid, data - center, 0.)
+        dsum = MovingWindow._get_window_sum_(centered, k, cumulative=True)
+        if operation == 'mean':
+            ret = np.where(empty, 0., dsum * 1. / count + center)
+        else:
+            dsum_squares = MovingWindow._get_window_sum_(centered * centered, k, cumulative=True)
+            ret = np.maximum((dsum_squares - dsum * (dsum * 1. / count)) / count, 0.)
+            # Windows with a single value have no variance.
+            ret = np.where(count <= 1, 0., ret)
+        return ret
+
+    @staticmethod
+    def _get_window_moments_direct_(data, mask, k, n, operation, count, empty):
+        # Sum windows by offset which matches the summation order of masked array reductions over each window.
+        filled = np.where(mask, data.dtype.type(0), data)
+        dsum = MovingWindow._get_window_sum_(filled, k)
+        ret = np.where(empty, dsum * 1., dsum * 1. / count)
+        if operation != 'mean':
+            mean = ret
+            ret = None
+            for offset in range(k):
+                danom = data[offset:offset + n] - mean
+                danom *= danom
+                danom[mask[offset:offset + n]] = 0
+                if ret is None:
+                    ret = danom
+                else:
+                    ret += danom
+            ret = np.where(empty, ret, ret / count)
+        return ret
+
+    @staticmethod
+    def _get_window_sum_(values, k, cumulative=False):
+        # Sum windows along the leading axis using either cumulative sums or by accumulating window offsets.
+        n = values.shape[0] - k + 1
+        if cumulative:
+            csum = np.cumsum(values, axis=0)
+            ret = csum[k - 1:].copy()
+            ret[1:] -= csum[:n - 1]
+        else:
+            ret = values[0:n].copy()
+            for offset in range(1, k):
+                ret += values[offset:offset + n]
+        return ret
+
 
 class DailyPercentile(base.AbstractUnivariateFunction, base.AbstractParameterizedFunction):
     key = 'daily_perc'
@@ -145,6 +265,9 @@ class DailyPercentile(base.AbstractUnivariateFunction, base.AbstractParameterize
 
     should_temporally_aggregate = False
 
+    # The maximum number of elements to stack when computing percentiles for a batch of calendar days.
+    _max_batch_elements = 2 ** 24
+
     def __init__(self, *args, **kwargs):
         super(DailyPercentile, self).__init__(*args, **kwargs)
 
@@ -167,7 +290,7 @@ class DailyPercentile(base.AbstractUnivariateFunction, base.AbstractParameterize
         for key, value in dp.items():
             fill[0, month_day_map[key], 0, :, :] = value
         for idx in range(fill.shape[1]):
-            fill.mask[0, idx, 0, :, :] = values.mask[0, 0, 0, :, :]
+            fill.mask[0, idx, 0, :, :] = np.logical_or(fill.mask[0, idx, 0, :, :], values.mask[0, 0, 0, :, :])
         return fill
 
     @staticmethod
@@ -209,37 +332,17 @@ class DailyPercentile(base.AbstractUnivariateFunction, base.AbstractParameterize
             raise NotImplementedError(arr.ndim)
         dt_arr = dt_arr.squeeze()
 
-        # step1: creation of the dictionary with all calendar days:
-        dic_caldays = self.get_dict_caldays(dt_arr)
+        # step1: index the window membership of all time steps for each calendar day
+        caldays, windows = self.get_window_index(dt_arr, window_width, only_leap_years)
 
+        # step2: compute the percentiles for batches of calendar days with equal window sizes
         percentile_dict = OrderedDict()
-
-        dt_hour = dt_arr[
-            0].hour  # (we get hour of a date only one time, because usually the hour is the same for all dates in input dt_arr)
-
-        for month in list(dic_caldays.keys()):
-            for day in dic_caldays[month]:
-                # step2: we do a mask for the datetime vector for current calendar day (day/month)
-                dt_arr_mask = self.get_mask_dt_arr(dt_arr, month, day, dt_hour, window_width, only_leap_years)
-
-                # step3: we are looking for the indices of non-masked dates (i.e. where dt_arr_mask==False)
-                indices_non_masked = np.where(dt_arr_mask == False)[0]
-
-                # step4: we subset our arr
-                arr_subset = arr[indices_non_masked, :, :]
-
-                # step5: we compute the percentile for current arr_subset
-                ############## WARNING: type(arr_subset) = numpy.ndarray. Numpy.percentile does not work with masked arrays,
-                ############## so if arr_subset has aberrant values like 999999 or 1e+20, the result will be wrong.
-                ############## Check with numpy.nanpercentile (Numpy version 1.9) !!!
-                arr_percentille_current_calday = np.percentile(arr_subset, percentile, axis=0)
-
-                # step6: we add to the dictionnary...
-                percentile_dict[month, day] = arr_percentille_current_calday
-
-                # print 'Creating percentile dictionary: month ', month, '---> OK'
-
-        # print 'Percentile dictionary is created.'
+        results = {}
+        for idx_caldays, arr_percentile in self._iter_window_percentiles_(arr, windows, percentile):
+            for idx, idx_calday in enumerate(idx_caldays):
+                results[idx_calday] = arr_percentile[idx]
+        for idx_calday, calday in enumerate(caldays):
+            percentile_dict[calday] = results[idx_calday]
 
         return percentile_dict
 
@@ -337,6 +440,67 @@ class DailyPercentile(base.AbstractUnivariateFunction, base.AbstractParameterize
         mask = np.array([self.get_masked(dt, month, day, dt_hour, window_width, only_leap_years) for dt in dt_arr])
         return mask
 
+    @staticmethod
+    def get_window_index(dt_arr, window_width, only_leap_years):
+        """
+        Create window membership for all calendar days (month-day) in a datetime vector. Membership follows
+        :meth:`~ocgis.calc.library.statistics.DailyPercentile.get_masked` with date differences computed using integer
+        arithmetic on the date components.
+
+        :param dt_arr: Time steps vector.
+        :type dt_arr: :class:`numpy.ndarray` (1D) of :class:`datetime.datetime` objects
+        :param window_width: Window width - must be odd.
+        :type window_width: int
+        :param only_leap_years: Option for February 29th. If ``True``, use only leap years when constructing the basis.
+        :type only_leap_years: bool
+        :returns: A tuple containing the calendar days as ``(month, day)`` tuples and a boolean array with shape
+         ``(len(caldays), len(dt_arr))``. The array is ``True`` where a time step is in the window for a calendar day.
+        :rtype: tuple(list, :class:`numpy.ndarray`)
+        """
+
+        dt_arr = np.atleast_1d(dt_arr)
+        year = np.array([dt.year for dt in dt_arr], dtype=np.int64)
+        month = np.array([dt.month for dt in dt_arr], dtype=np.int64)
+        day = np.array([dt.day for dt in dt_arr], dtype=np.int64)
+        microseconds = np.array([((dt.hour * 60 + dt.minute) * 60 + dt.second) * 10 ** 6 + dt.microsecond
+                                 for dt in dt_arr], dtype=np.int64)
+
+        # Calendar days ordered by first appearance of their month.
+        caldays = []
+        for curr_month in OrderedDict.fromkeys(month.tolist()):
+            for curr_day in np.unique(day[month == curr_month]).tolist():
+                caldays.append((curr_month, curr_day))
+
+        us_per_day = 86400 * 10 ** 6
+        us_hour = dt_arr[0].hour * 3600 * 10 ** 6
+        current = _get_day_number_(year, month, day) * us_per_day + microseconds
+        half_width = window_width / 2
+        is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+        windows = np.zeros((len(caldays), dt_arr.shape[0]), dtype=bool)
+        for idx, (curr_month, curr_day) in enumerate(caldays):
+            if curr_month == 2 and curr_day == 29:
+                diff_leap = np.abs(current - (_get_day_number_(year, 2, 29) * us_per_day + us_hour)) // us_per_day
+                in_window = is_leap & (diff_leap <= half_width)
+                if not only_leap_years:
+                    diff = (current - (_get_day_number_(year, 2, 28) * us_per_day + us_hour)) // us_per_day
+                    in_window |= ~is_leap & (diff >= (-half_width + 1)) & (diff <= half_width)
+            else:
+                # Also compare against the calendar day in the adjacent years to capture windows crossing the year
+                # boundary.
+                diff = None
+                for offset in (0, 1, -1):
+                    target = _get_day_number_(year + offset, curr_month, curr_day) * us_per_day + us_hour
+                    curr_diff = np.abs(current - target) // us_per_day
+                    if diff is None:
+                        diff = curr_diff
+                    else:
+                        np.minimum(diff, curr_diff, out=diff)
+                in_window = diff <= half_width
+            windows[idx] = in_window
+
+        return caldays, windows
+
     @staticmethod
     def get_year_list(dt_arr):
         """
@@ -351,6 +515,47 @@ class DailyPercentile(base.AbstractUnivariateFunction, base.AbstractParameterize
 
         return year_list
 
+    def _iter_window_percentiles_(self, arr, windows, percentile):
+        """
+        Yield percentiles for batches of calendar days. Calendar days are batched by window size and the window values
+        are stacked so a single percentile computation is performed per batch. Masked and NaN values are excluded from
+        the percentile computation if present.
+
+        :param arr: Array of values with time as the leading dimension.
+        :type arr: :class:`numpy.ma.MaskedArray` (3D)
+        :param windows: Window membership from :meth:`~ocgis.calc.library.statistics.DailyPercentile.get_window_index`.
+        :type windows: :class:`numpy.ndarray` (2D)
+        :param float percentile: Percentile to compute which must be between 0 and 100 inclusive.
+        :returns: Tuples of calendar day indices and their percentile arrays.
+        :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+
+        data = np.ma.getdata(arr)
+        mask = np.ma.getmaskarray(arr)
+        is_float = np.issubdtype(data.dtype, np.floating)
+        has_missing = mask.any() or (is_float and np.isnan(data).any())
+        if has_missing:
+            if not is_float:
+                data = data.astype(float)
+            data = np.where(mask, np.nan, data)
+
+        counts = windows.sum(axis=1)
+        size_element = max(int(np.prod(data.shape[1:])), 1)
+        for count in np.unique(counts):
+            idx_caldays = np.flatnonzero(counts == count)
+            batch_size = max(self._max_batch_elements // (size_element * max(count, 1)), 1)
+            for start in range(0, idx_caldays.shape[0], batch_size):
+                idx_batch = idx_caldays[start:start + batch_size]
+                # The time indices for each calendar day window in the batch with shape (batch, count).
+                index = np.nonzero(windows[idx_batch])[1].reshape(idx_batch.shape[0], count)
+                stacked = data[index]
+                if has_missing:
+                    res = get_nan_percentile(stacked, percentile, axis=1)
+                    res = np.ma.array(res, mask=np.isnan(res))
+                else:
+                    res = np.percentile(stacked, percentile, axis=1)
+                yield idx_batch, res
+
 
 class FrequencyPercentile(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFunction):
     key = 'freq_perc'
@@ -378,9 +583,15 @@ class Max(base.AbstractUnivariateSetFunction):
     standard_name = 'max'
     long_name = 'max'
 
+    has_calculate_grouped = True
+
     def calculate(self, values):
         return np.ma.max(values, axis=0)
 
+    def calculate_grouped(self, values, starts):
+        ret = base.get_grouped_reduction(np.maximum, values, starts, np.ma.maximum_fill_value(values))
+        return np.ma.array(ret, mask=base.get_grouped_count(values, starts) == 0)
+
 
 class Min(base.AbstractUnivariateSetFunction):
     description = 'Min value for the series.'
@@ -389,9 +600,15 @@ class Min(base.AbstractUnivariateSetFunction):
     standard_name = 'min'
     long_name = 'Min'
 
+    has_calculate_grouped = True
+
     def calculate(self, values):
         return np.ma.min(values, axis=0)
 
+    def calculate_grouped(self, values, starts):
+        ret = base.get_grouped_reduction(np.minimum, values, starts, np.ma.minimum_fill_value(values))
+        return np.ma.array(ret, mask=base.get_grouped_count(values, starts) == 0)
+
 
 class Mean(base.AbstractUnivariateSetFunction):
     description = 'Compute mean value of the set.'
@@ -423,3 +640,41 @@ class StandardDeviation(base.AbstractUnivariateSetFunction):
 
     def calculate(self, values):
         return np.ma.std(values, axis=0)
+
+
+def get_nan_percentile(values, percentile, axis=0):
+    """
+    Compute a percentile along an axis ignoring NaN values. Linear interpolation is used between the closest ranks as
+    in :func:`numpy.nanpercentile`. This avoids iterating over each slice when only a few slices contain NaNs.
+
+    :param values: The array of values.
+    :type values: :class:`numpy.ndarray`
+    :param float percentile: Percentile to compute which must be between 0 and 100 inclusive.
+    :param int axis: The axis to compute the percentile along.
+    :returns: The percentile array with ``axis`` removed. Slices containing only NaN values are NaN.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    # NaN values are sorted to the end of the axis.
+    values = np.sort(np.moveaxis(values, axis, 0), axis=0)
+    count = values.shape[0] - np.isnan(values).sum(axis=0)
+    quantile = percentile / 100.
+    virtual = count * quantile + (1 - quantile) - 1
+    lower = np.floor(virtual)
+    gamma = np.asarray(virtual - lower, dtype=values.dtype)
+    lower = np.clip(lower.astype(int), 0, np.maximum(count - 1, 0))
+    upper = np.minimum(lower + 1, np.maximum(count - 1, 0))
+    a = np.take_along_axis(values, lower[np.newaxis], axis=0)[0]
+    b = np.take_along_axis(values, upper[np.newaxis], axis=0)[0]
+    diff = b - a
+    ret = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+    ret = np.where(count == 0, values.dtype.type(np.nan), ret)
+    return ret
+
+
+def _get_day_number_(year, month, day):
+    # Days since 1970-01-01 in the proleptic Gregorian calendar.
+    year = np.asarray(year)
+    ret = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (np.asarray(month) - 1)
+    ret = ret.astype('datetime64[D]') + (np.asarray(day) - 1)
+    return ret.astype(np.int64)
@@ -10,6 +10,7 @@ class Between(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFunc
     key = 'between'
     standard_name = 'between'
     long_name = 'between'
+    has_calculate_grouped = True
 
     def calculate(self, values, lower=None, upper=None):
         """
@@ -23,6 +24,11 @@ class Between(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFunc
         idx = (values >= float(lower)) * (values <= float(upper))
         return np.ma.sum(idx, axis=0)
 
+    def calculate_grouped(self, values, starts, lower=None, upper=None):
+        assert (lower <= upper)
+        idx = (values >= float(lower)) * (values <= float(upper))
+        return get_grouped_true_count(idx, starts)
+
 
 class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFunction):
     description = 'Count of values where the logical operation returns TRUE.'
@@ -32,6 +38,7 @@ class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFu
     standard_name = 'threshold'
     long_name = 'threshold'
     parms_required = ('threshold', 'operation')
+    has_calculate_grouped = True
 
     def calculate(self, values, threshold=None, operation=None):
         """
@@ -41,6 +48,19 @@ class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFu
         :type operation: str
         """
 
+        idx = self._get_logical_(values, threshold, operation)
+        ret = np.ma.sum(idx, axis=0)
+        return ret
+
+    def calculate_grouped(self, values, starts, threshold=None, operation=None):
+        idx = self._get_logical_(values, threshold, operation)
+        return get_grouped_true_count(idx, starts)
+
+    def _aggregate_spatial_(self, values, weights):
+        return np.ma.sum(values)
+
+    @staticmethod
+    def _get_logical_(values, threshold, operation):
         # perform requested logical operation
         if operation == 'gt':
             idx = values > threshold
@@ -52,9 +72,21 @@ class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFu
             idx = values <= threshold
         else:
             raise NotImplementedError
+        return idx
 
-        ret = np.ma.sum(idx, axis=0)
-        return ret
 
-    def _aggregate_spatial_(self, values, weights):
-        return np.ma.sum(values)
+def get_grouped_true_count(idx, starts):
+    """
+    Count the ``True`` values of a masked boolean array in contiguous temporal groups. Groups with all elements masked
+    are masked in the output.
+
+    :param idx: The grouped masked boolean array.
+    :type idx: :class:`numpy.ma.MaskedArray`
+    :param starts: The start index of each temporal group along the time axis.
+    :type starts: :class:`numpy.ndarray`
+    :rtype: :class:`numpy.ma.MaskedArray`
+    """
+
+    # Summing booleans with a binary ufunc is a logical "or". Count using integers.
+    ret = base.get_grouped_reduction(np.add, np.ma.filled(idx, False).astype(np.int64), starts, 0)
+    return np.ma.array(ret, mask=base.get_grouped_count(idx, starts) == 0)
@@ -3,12 +3,58 @@ import itertools
 import numpy as np
 
 
+def get_aligned_tile_dimension(tile_dimension, chunksize):
+    """
+    Align a tile dimension with a storage chunk size. The tile dimension is reduced to a multiple of the chunk size if
+    the chunk size is smaller than the tile dimension.
+
+    :param int tile_dimension: The target tile dimension.
+    :param chunksize: The storage chunk size. May be ``None``.
+    :type chunksize: int | None
+    :rtype: int
+    """
+
+    if chunksize is not None and chunksize < tile_dimension:
+        tile_dimension -= tile_dimension % chunksize
+    return tile_dimension
+
+
+def get_tile_shape(shape, nbytes_cell, budget, chunks=None):
+    """
+    Choose a row and column tile shape holding at most ``budget`` bytes. Tiles span whole rows if possible as rows are
+    contiguous in storage. Tile dimensions are aligned with storage chunks.
+
+    :param tuple shape: The row and column count of the tiled grid.
+    :param int nbytes_cell: The number of bytes needed for each grid cell.
+    :param int budget: The maximum number of bytes for a tile.
+    :param tuple chunks: The row and column storage chunk sizes. Elements may be ``None``.
+    :rtype: tuple
+    """
+
+    nrow, ncol = shape
+    if chunks is None:
+        chunks = (None, None)
+    ncell = max(int(budget // max(nbytes_cell, 1)), 1)
+    tile_ncol = min(ncol, ncell)
+    tile_nrow = min(nrow, max(ncell // tile_ncol, 1))
+    if tile_ncol < ncol:
+        tile_ncol = get_aligned_tile_dimension(tile_ncol, chunks[1])
+    if tile_nrow < nrow:
+        tile_nrow = get_aligned_tile_dimension(tile_nrow, chunks[0])
+    return tile_nrow, tile_ncol
+
+
 def get_tile_schema(nrow, ncol, tdim, origin=0):
+    # The tile dimension may be a single integer or a row and column pair.
+    try:
+        tdim_row, tdim_col = tdim
+    except TypeError:
+        tdim_row = tdim_col = tdim
     ret = {}
-    row_idx = np.arange(origin, nrow + tdim, step=tdim, dtype=int)
+    row_idx = np.arange(origin, nrow + tdim_row, step=tdim_row, dtype=int)
     if row_idx[-1] > nrow:
         row_idx[-1] = nrow
-    col_idx = np.arange(origin, ncol + tdim, step=tdim, dtype=int)
+    col_idx = np.arange(origin, ncol + tdim_col, step=tdim_col, dtype=int)
     if col_idx[-1] > ncol:
         col_idx[-1] = ncol
     row_slices = get_slices(row_idx)
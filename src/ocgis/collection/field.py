@@ -70,6 +70,9 @@ class Field(VariableCollection):
         self.regrid_destination = kwargs.pop('regrid_destination', False)
         # Flag to indicate if this is a regrid source.
         self.regrid_source = kwargs.pop('regrid_source', True)
+        # Flag to indicate if this is a spatial tile of a larger field. The local bounds of the tile's grid dimensions
+        # locate it in the larger field.
+        self.is_tile = kwargs.pop('is_tile', False)
 
         # Other incoming data objects may have a coordinate system which should be used.
         crs = kwargs.pop(KeywordArgument.CRS, 'auto')
@@ -18,6 +18,41 @@ DEFAULT_TEMPORAL_UNITS = 'days since 0001-01-01 00:00:00'
 #: Default name for the time dimension.
 DEFAULT_TEMPORAL_NAME = 'time'
 
+#: Default maximum number of temporal groupings to keep in the temporal group cache.
+DEFAULT_TEMPORAL_GROUP_CACHE_SIZE = 32
+
+#: Default maximum ratio of elements read to elements requested when coalescing fancy-indexed netCDF reads.
+DEFAULT_NETCDF_READ_OVERREAD = 2.0
+
+#: Default maximum number of bytes of decompressed netCDF storage chunks to keep in the chunk cache.
+DEFAULT_NETCDF_CHUNK_CACHE_SIZE = 64 * 1024 ** 2
+
+#: Maximum number of multi-file netCDF aggregation indexes to keep in memory.
+NETCDF_MULTIFILE_INDEX_CACHE_SIZE = 16
+
+#: File extension for metadata cache entries.
+METADATA_CACHE_EXTENSION = '.ocgmeta'
+
+#: Default maximum number of bytes written to a netCDF variable in a single slab.
+DEFAULT_NETCDF_WRITE_SLAB_SIZE = 64 * 1024 ** 2
+
+#: Named netCDF output presets. Values are compression arguments to :meth:`netCDF4.Dataset.createVariable`.
+#: ``chunk_bytes`` is the target storage chunk size used to derive chunk shapes from the output dimensions.
+NETCDF_OUTPUT_PRESETS = {'fast': {'zlib': True, 'complevel': 1, 'shuffle': True, 'chunk_bytes': 4 * 1024 ** 2},
+                         'balanced': {'zlib': True, 'complevel': 4, 'shuffle': True, 'chunk_bytes': 1024 ** 2},
+                         'archive': {'zlib': True, 'complevel': 9, 'shuffle': True, 'chunk_bytes': 1024 ** 2}}
+
+#: Default maximum number of entries to keep in the geometry selection cache.
+DEFAULT_GEOM_SELECTION_CACHE_SIZE = 16
+
+#: Default number of records in a block yielded by columnar iteration.
+DEFAULT_ITERATOR_BLOCK_SIZE = 65536
+
+#: Default number of rows sampled from a CSV file to infer column data types.
+DEFAULT_CSV_DTYPE_SAMPLE_SIZE = 1000
+#: Number of CSV files with row offset indexes kept in memory.
+CSV_ROW_OFFSETS_CACHE_SIZE = 8
+
 #: Default sample size variable standard name.
 DEFAULT_SAMPLE_SIZE_STANDARD_NAME = 'sample_size'
 
@@ -107,6 +142,14 @@ class OutputFormatName(object):
 #: example, vector GIS outputs are always wrapped to -180 to 180 if there is a spherical coordinate system.
 VECTOR_OUTPUT_FORMATS = [OutputFormatName.GEOJSON, OutputFormatName.SHAPEFILE, OutputFormatName.CSV_SHAPEFILE]
 
+#: These output formats write collections incrementally and may convert spatially tiled collections.
+TILED_OUTPUT_FORMATS = [OutputFormatName.NETCDF, OutputFormatName.CSV, OutputFormatName.CSV_SHAPEFILE,
+                        OutputFormatName.SHAPEFILE, OutputFormatName.GEOJSON]
+
+#: Multiplier applied to the size of a tile's data variables to account for masks and calculation working copies when
+#: fitting tiles to a memory budget.
+TILE_MEMORY_FACTOR = 3
+
 # Download URL for test datasets.
 TEST_DATA_DOWNLOAD_PREFIX = None
 
@@ -302,9 +345,11 @@ class KeywordArgument(object):
     ADD_GEOM_UID = 'add_geom_uid'
     ALLOW_MASKED = 'allow_masked'
     ATTRS = 'attrs'
+    BLOCK_SIZE = 'block_size'
     BOUNDS_NAMES = 'bounds_names'
     CASCADE = 'cascade'
     CHECK_VALUE = 'check_value'
+    COLUMNAR = 'columnar'
     COMM = 'comm'
     CREATE = 'create'
     CRS = 'crs'
@@ -348,6 +393,7 @@ class KeywordArgument(object):
     PATH = 'path'
     POS = 'pos'
     PREFIX = 'prefix'
+    PRESET = 'preset'
     PRIMARY_MASK = 'primary_mask'
     REPEATERS = 'repeaters'
     RANKS_TO_WRITE = 'ranks_to_write'
@@ -360,6 +406,7 @@ class KeywordArgument(object):
     SNIPPET = 'snippet'
     STANDARDIZE = 'standardize'
     STRICT = 'strict'
+    SYNC = 'sync'
     TAG = 'tag'
     UGID = 'ugid'
     UID = 'uid'
@@ -466,6 +513,21 @@ class BackTransform(Enum):
     ROTATED_POLE = 'rotated pole'
 
 
+class OperationsStage(object):
+    """Stages timed by the operations engine."""
+
+    SUBSET = 'subset'
+    CALCULATE = 'calculate'
+    LOAD = 'load'
+    CONVERT = 'convert'
+    WAIT = 'wait'
+
+
+#: Operations engine stages in reporting order.
+OPERATIONS_STAGES = (OperationsStage.SUBSET, OperationsStage.CALCULATE, OperationsStage.LOAD, OperationsStage.CONVERT,
+                     OperationsStage.WAIT)
+
+
 class OcgisConvention(object):
     class Name(object):
         # Number of nodes per element. Used, for example, when linking element node counts in ESMF unstructured format.
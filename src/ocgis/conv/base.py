@@ -166,6 +166,9 @@ class AbstractCollectionConverter(AbstractFileConverter):
         # Path to the output object.
         f = {KeywordArgument.PATH: self.path}
 
+        # Selection geometries already written. Tiled operations yield a collection for each tile of a selection.
+        written_ugids = set()
+
         build = True
         for i, coll in enumerate(self):
             # This will be changed to "write" if we are on the build loop.
@@ -200,7 +203,10 @@ class AbstractCollectionConverter(AbstractFileConverter):
             if write_ugeom:
                 with vm.scoped(SubcommName.UGEOM_WRITE, [0]):
                     if not vm.is_null:
-                        for subset_field in list(coll.children.values()):
+                        for ugid, subset_field in list(coll.children.items()):
+                            if ugid in written_ugids:
+                                continue
+                            written_ugids.add(ugid)
                             subset_field.write(ugeom_fiona_path, write_mode=write_mode, driver=DriverVector)
 
         # The metadata and dataset descriptor files may only be written if OCGIS operations are present.
@@ -90,6 +90,13 @@ class MetaOCGISConverter(AbstractMetaConverter):
             if isinstance(curr, AbstractParameter):
                 lines.append(curr.get_meta())
 
+        # Explain the tiling plan if a memory limit is set.
+        if self.ops.memory_limit is not None:
+            lines.append('')
+            lines.append('== Memory Plan ==')
+            lines.append('')
+            lines.append(justify_row(self.ops.get_memory_plan()['description']))
+
         # collapse lists
         ret = []
         for line in lines:
@@ -10,7 +10,7 @@ from ocgis.calc.engine import CalculationEngine
 from ocgis.calc.eval_function import MultivariateEvalFunction
 from ocgis.constants import DimensionName
 from ocgis.constants import HeaderName, VariableName
-from ocgis.constants import KeywordArgument
+from ocgis.constants import KeywordArgument, MPIWriteMode
 from ocgis.conv.base import AbstractCollectionConverter
 from ocgis.driver.nc import DriverNetcdf
 from ocgis.environment import get_dtype
@@ -35,10 +35,13 @@ class NcConverter(AbstractCollectionConverter):
     +------------------------+----------------------------------------------------------------------------------------------------------------------------------------+
     | geom_dim               | The name of the dimension storing aggregated (unioned) outputs. Only applies when ``aggregate is True``.                               |
     +------------------------+----------------------------------------------------------------------------------------------------------------------------------------+
+    | preset                 | Compression and chunking preset: ``'fast'``, ``'balanced'``, or ``'archive'``. See ``NETCDF_OUTPUT_PRESETS``.                          |
+    +------------------------+----------------------------------------------------------------------------------------------------------------------------------------+
 
 
     >>> options = {'data_model': 'NETCDF4_CLASSIC'}
     >>> options = {'variable_kwargs': {'zlib': True, 'complevel': 4}}
+    >>> options = {'preset': 'balanced'}
 
     :type options: str
     """
@@ -267,12 +270,25 @@ class NcConverter(AbstractCollectionConverter):
         :param dict variable_kwargs: Optional keyword parameters to pass to the creation of netCDF4 variable objects.
          See http://unidata.github.io/netcdf4-python/#netCDF4.Variable.
         """
+        write_mode = write_kwargs.get(KeywordArgument.WRITE_MODE)
+        if arch.is_tile:
+            # Tiles are written to their location in the untiled field. The first tile creates the dataset using the
+            # untiled dimension sizes.
+            if write_mode is None:
+                write_modes = [MPIWriteMode.TEMPLATE, MPIWriteMode.FILL]
+            else:
+                write_modes = [MPIWriteMode.FILL]
+        else:
+            write_modes = [write_mode]
+
         # Append to the history attribute.
         history_str = '\n{dt} UTC ocgis-{release}'.format(dt=datetime.datetime.utcnow(), release=ocgis.__release__)
         if self.ops is not None:
             history_str += ': {0}'.format(self.ops)
-        original_history_str = arch.attrs.get('history', '')
-        arch.attrs['history'] = original_history_str + history_str
+        # Attributes are only written when the dataset is created.
+        if write_modes[0] != MPIWriteMode.FILL:
+            original_history_str = arch.attrs.get('history', '')
+            arch.attrs['history'] = original_history_str + history_str
 
         if self.ops and self.ops.aggregate:
             arch.attrs['featureType'] = 'timeSeries'
@@ -280,6 +296,9 @@ class NcConverter(AbstractCollectionConverter):
         # Pull in dataset and variable keyword arguments.
         unlimited_to_fixedsize = self.options.get(KeywordArgument.UNLIMITED_TO_FIXED_SIZE, False)
         variable_kwargs[KeywordArgument.UNLIMITED_TO_FIXED_SIZE] = unlimited_to_fixedsize
+        preset = self.options.get(KeywordArgument.PRESET)
+        if preset is not None:
+            variable_kwargs[KeywordArgument.PRESET] = preset
         write_kwargs[KeywordArgument.VARIABLE_KWARGS] = variable_kwargs
         write_kwargs[KeywordArgument.DATASET_KWARGS] = {KeywordArgument.FORMAT: self._get_file_format_()}
 
@@ -287,7 +306,9 @@ class NcConverter(AbstractCollectionConverter):
         path = write_kwargs.get(KeywordArgument.PATH)
 
         # Write the field.
-        arch.write(path, **write_kwargs)
+        for write_mode in write_modes:
+            write_kwargs[KeywordArgument.WRITE_MODE] = write_mode
+            arch.write(path, **write_kwargs)
 
     def _write_coll_(self, ds, coll):
         """
@@ -1,5 +1,11 @@
 import abc
+import hashlib
 import json
+import logging
+import os
+import pickle
+import stat
+import tempfile
 from abc import ABCMeta
 from contextlib import contextmanager
 from copy import deepcopy
@@ -7,7 +13,9 @@ from warnings import warn
 
 import numpy as np
 import six
+import ocgis
 from ocgis import constants, GridUnstruct
+from ocgis import env
 from ocgis import vm
 from ocgis.base import AbstractOcgisObject, raise_if_empty
 from ocgis.base import get_variable_names
@@ -16,7 +24,7 @@ from ocgis.constants import MPIWriteMode, TagName, KeywordArgument, OcgisConvent
 from ocgis.driver.dimension_map import DimensionMap
 from ocgis.exc import DefinitionValidationError, NoDataVariablesFound, DimensionMapError, VariableMissingMetadataError, \
     GridDeficientError, OcgWarning
-from ocgis.util.helpers import get_group
+from ocgis.util.helpers import get_group, get_iter
 from ocgis.util.logging_ocgis import ocgis_lh
 from ocgis.variable.base import SourcedVariable
 from ocgis.variable.dimension import Dimension
@@ -72,7 +80,12 @@ class AbstractDriver(AbstractOcgisObject):
     @property
     def dimension_map_raw(self):
         if self._dimension_map_raw is None:
-            self._dimension_map_raw = create_dimension_map_raw(self, self.metadata_raw)
+            key = self._get_dimension_map_cache_key_()
+            dimension_map_raw = METADATA_CACHE.get(key)
+            if dimension_map_raw is None:
+                dimension_map_raw = create_dimension_map_raw(self, self.metadata_raw)
+                METADATA_CACHE.set(key, dimension_map_raw)
+            self._dimension_map_raw = dimension_map_raw
         return self._dimension_map_raw
 
     @property
@@ -434,6 +447,16 @@ class AbstractDriver(AbstractOcgisObject):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def get_io_lock():
+        """
+        Return the lock serializing calls into the driver's I/O library or ``None`` if the library is thread-safe. The
+        lock is held while a dataset is scoped by :func:`~ocgis.driver.base.driver_scope`.
+
+        :rtype: :class:`threading.RLock` | None
+        """
+        return None
+
     @staticmethod
     def get_group_metadata(group_index, metadata, has_root=False):
         return get_group(metadata, group_index, has_root=has_root)
@@ -443,7 +466,11 @@ class AbstractDriver(AbstractOcgisObject):
         :rtype: dict
         """
 
-        metadata_subclass = self._get_metadata_main_()
+        key = get_metadata_cache_key(self, 'metadata')
+        metadata_subclass = METADATA_CACHE.get(key)
+        if metadata_subclass is None:
+            metadata_subclass = self._get_metadata_main_()
+            METADATA_CACHE.set(key, metadata_subclass)
 
         # Use the predicate (filter) if present on the request dataset.
         # TODO: Should handle groups?
@@ -833,6 +860,18 @@ class AbstractDriver(AbstractOcgisObject):
         """Return the coordinate system variable or None if not found."""
         return None
 
+    def _get_dimension_map_cache_key_(self):
+        """
+        :returns: The metadata cache key for the raw dimension map or ``None`` if the dimension map may not be cached.
+        :rtype: tuple
+        """
+
+        # Dimension maps are created from filtered metadata when a predicate is present.
+        if self.rd is not None and self.rd.predicate is not None:
+            return None
+        rotated_pole_priority = getattr(self.rd, 'rotated_pole_priority', None)
+        return get_metadata_cache_key(self, ('dimension_map', rotated_pole_priority))
+
     @abc.abstractmethod
     def _get_metadata_main_(self):
         """
@@ -940,6 +979,143 @@ class AbstractUnstructuredDriver(AbstractOcgisObject):
         return cindex.attrs.get(mbv_name)
 
 
+class MetadataCache(object):
+    """
+    Opt-in on-disk cache for source metadata, dimension maps, and other values derived from source headers. Entries are
+    pickled to individual files in the directory set by :attr:`ocgis.env.METADATA_CACHE_DIR`. The cache is disabled if
+    the directory is ``None``. Keys are created with :func:`~ocgis.driver.base.get_metadata_cache_key`.
+
+    .. warning:: Entries are unpickled when read. The cache directory must not be writable by other users. Entries are
+     ignored if the directory is not owned by the current user or is writable by the group or others.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self):
+        """
+        :return: The cache directory or ``None`` if the cache is disabled.
+        :rtype: str
+        """
+        return env.METADATA_CACHE_DIR
+
+    def clear(self):
+        """
+        Remove all cache entries and reset the cache statistics.
+        """
+
+        path = self.path
+        if path is not None and os.path.isdir(path):
+            for name in os.listdir(path):
+                if name.endswith(constants.METADATA_CACHE_EXTENSION):
+                    os.remove(os.path.join(path, name))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Entries are unpickled and may execute arbitrary code. Entries are only read if the cache directory is owned by
+        the current user and may not be written by others.
+
+        :param tuple key: The cache key.
+        :return: The cached value or ``None`` if the key is not in the cache or the cache is disabled.
+        """
+
+        if key is None or self.path is None:
+            return None
+        stored_key, ret = None, None
+        if self.is_trusted():
+            try:
+                with open(self.get_entry_path(key), 'rb') as f:
+                    stored_key, ret = pickle.load(f)
+            except (IOError, OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+                # Missing, partially written, or stale entries are misses.
+                stored_key, ret = None, None
+        if stored_key != key:
+            ret = None
+        if ret is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return ret
+
+    def get_entry_path(self, key):
+        """
+        :param tuple key: The cache key.
+        :return: Path to the key's entry file.
+        :rtype: str
+        """
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, digest + constants.METADATA_CACHE_EXTENSION)
+
+    def is_trusted(self):
+        """
+        :return: ``True`` if the cache directory is owned by the current user and may not be written by the group or
+         others. Always ``True`` on platforms without user identifiers.
+        :rtype: bool
+        """
+
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        if not hasattr(os, 'getuid'):
+            return True
+        ret = st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        if not ret:
+            msg = 'Metadata cache directory "{0}" is not owned by the current user or is writable by others. Cache ' \
+                  'entries are not read.'.format(self.path)
+            ocgis_lh(msg=msg, logger='driver', level=logging.WARN)
+        return ret
+
+    def get_stats(self):
+        """
+        :return: Dictionary containing cache statistics.
+        :rtype: dict
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def set(self, key, value):
+        """
+        Add a value to the cache. The entry is written to a temporary file and renamed so concurrent readers never see
+        a partial entry.
+
+        :param tuple key: The cache key. Nothing is stored if this is ``None``.
+        :param value: The value to cache. Values that may not be pickled are not cached.
+        """
+
+        path = self.path
+        if key is None or path is None:
+            return
+        try:
+            data = pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Some sources have metadata objects that may not be pickled (i.e. netCDF variable-length types).
+            return
+        tmp = None
+        try:
+            if not os.path.isdir(path):
+                try:
+                    # The directory is created with user-only permissions. See "get".
+                    os.makedirs(path, 0o700)
+                except OSError:
+                    # The directory may have been created by another process.
+                    if not os.path.isdir(path):
+                        raise
+            fd, tmp = tempfile.mkstemp(dir=path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.rename(tmp, self.get_entry_path(key))
+        except (IOError, OSError) as e:
+            # Failing to cache a value should never fail the read.
+            msg = 'Metadata cache entry not written: {0}'.format(e)
+            ocgis_lh(msg=msg, logger='driver', level=logging.WARN)
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+
 @contextmanager
 def driver_scope(ocgis_driver, opened_or_path=None, mode='r', **kwargs):
     kwargs = kwargs.copy()
@@ -961,19 +1137,26 @@ def driver_scope(ocgis_driver, opened_or_path=None, mode='r', **kwargs):
     else:
         rd = None
 
-    if ocgis_driver.inquire_opened_state(opened_or_path):
-        should_close = False
-    else:
-        should_close = True
-        if rd is not None and rd.driver_kwargs is not None:
-            kwargs.update(rd.driver_kwargs)
-        opened_or_path = ocgis_driver.open(uri=opened_or_path, mode=mode, rd=rd, **kwargs)
-
+    io_lock = ocgis_driver.get_io_lock()
+    if io_lock is not None:
+        io_lock.acquire()
     try:
-        yield opened_or_path
+        if ocgis_driver.inquire_opened_state(opened_or_path):
+            should_close = False
+        else:
+            should_close = True
+            if rd is not None and rd.driver_kwargs is not None:
+                kwargs.update(rd.driver_kwargs)
+            opened_or_path = ocgis_driver.open(uri=opened_or_path, mode=mode, rd=rd, **kwargs)
+
+        try:
+            yield opened_or_path
+        finally:
+            if should_close:
+                ocgis_driver.close(opened_or_path)
     finally:
-        if should_close:
-            ocgis_driver.close(opened_or_path)
+        if io_lock is not None:
+            io_lock.release()
 
 
 def find_variable_by_attribute(variables_metadata, attribute_name, attribute_value):
@@ -1053,6 +1236,34 @@ def get_dump_report_for_group(group, global_attributes_name='global', indent=0):
     return lines
 
 
+def get_metadata_cache_key(driver, name):
+    """
+    Create a key for :data:`~ocgis.driver.base.METADATA_CACHE`. The key changes if the modification time or size of a
+    source file changes.
+
+    :param driver: The driver with the request dataset to create the key for.
+    :type driver: :class:`~ocgis.driver.base.AbstractDriver`
+    :param name: Name of the cached value. This may be any value with a stable ``repr``.
+    :return: The cache key or ``None`` if the request dataset may not be cached. Open datasets, metadata-only request
+     datasets, and remote sources are not cached.
+    :rtype: tuple
+    """
+
+    if env.METADATA_CACHE_DIR is None:
+        return None
+    rd = driver.rd
+    if rd is None or rd.opened is not None or rd._uri is None:
+        return None
+    stamps = []
+    for uri in get_iter(rd.uri):
+        if not os.path.isfile(uri):
+            return None
+        st = os.stat(uri)
+        stamps.append((os.path.abspath(uri), st.st_mtime, st.st_size))
+    driver_kwargs = sorted((rd.driver_kwargs or {}).items())
+    return name, driver.key, tuple(stamps), repr(driver_kwargs), ocgis.__version__
+
+
 def get_variable_metadata_from_request_dataset(driver, variable):
     variables_metadata = get_group(driver.metadata_source, variable.group, has_root=False)['variables']
     try:
@@ -1078,3 +1289,7 @@ def iter_group_keys(ddict, keyseq):
         yld = deepcopy(keyseq)
         yld.append(key)
         yield yld
+
+
+#: Global on-disk metadata cache. See :class:`~ocgis.driver.base.MetadataCache`.
+METADATA_CACHE = MetadataCache()
@@ -1,11 +1,18 @@
 import csv
+import io
+import logging
+import os
 from collections import OrderedDict
+from itertools import islice
 
+import numpy as np
 import six
+from ocgis import constants
 from ocgis import vm
 from ocgis.base import raise_if_empty
-from ocgis.constants import MPIWriteMode, KeywordArgument, DriverKey
-from ocgis.driver.base import driver_scope, AbstractTabularDriver
+from ocgis.constants import MPIWriteMode, KeywordArgument, DriverKey, SourceIndexType
+from ocgis.driver.base import driver_scope, AbstractTabularDriver, get_metadata_cache_key, METADATA_CACHE
+from ocgis.util.logging_ocgis import ocgis_lh
 
 
 class DriverCSV(AbstractTabularDriver):
@@ -16,42 +23,89 @@ class DriverCSV(AbstractTabularDriver):
     key = DriverKey.CSV
     output_formats = 'all'
     common_extension = 'csv'
+    #: Number of rows used to infer column data types.
+    dtype_sample_size = constants.DEFAULT_CSV_DTYPE_SAMPLE_SIZE
+    _row_offsets = None
 
     def get_variable_value(self, variable):
-        # For CSV files, it makes sense to load all variables from source simultaneously.
+        # For CSV files, it makes sense to load all variables from source simultaneously. Variables already having a
+        # value are not reloaded.
         if variable.parent is None:
             to_load = [variable]
         else:
-            to_load = list(variable.parent.values())
+            to_load = [v for v in variable.parent.values() if v is variable or not v.has_allocated_value]
 
         with driver_scope(self) as f:
-            reader = csv.DictReader(f)
-            bounds_local = variable.dimensions[0].bounds_local
-            for idx, row in enumerate(reader):
-                if idx < bounds_local[0]:
-                    continue
-                else:
-                    if idx >= bounds_local[1]:
-                        break
-                for tl in to_load:
-                    if not tl.has_allocated_value:
-                        tl.allocate_value()
-                    tl.get_value()[idx - bounds_local[0]] = row[tl.name]
+            fieldnames = six.next(csv.reader(f))
+        to_load = [tl for tl in to_load if tl.name in fieldnames]
+
+        # Only the rows for the variable's dimension are parsed. The row offset index allows seeking to the rows
+        # directly.
+        rows = get_csv_rows(self.rd.uri, self.row_offsets, get_row_selection(variable.dimensions[0]),
+                            encoding=self._get_encoding_())
+
+        for tl in to_load:
+            column_index = fieldnames.index(tl.name)
+            column = [row[column_index] if column_index < len(row) else None for row in rows]
+            if not tl.has_allocated_value:
+                tl.allocate_value()
+            target = tl.get_value()
+            try:
+                target[:] = get_typed_column(column, target.dtype)
+            except (ValueError, OverflowError, TypeError):
+                # Inference only samples the first rows. Fall back to the untyped values.
+                msg = 'Values for CSV column "{}" may not be converted to data type "{}". Inference uses the first {} ' \
+                      'rows. Using the "object" data type. Set the data type in the request dataset metadata to ' \
+                      'override the inferred type.'
+                ocgis_lh(msg=msg.format(tl.name, target.dtype, self.dtype_sample_size), logger='driver.csv',
+                         level=logging.WARN)
+                tl.dtype = object
+                tl.set_value(get_typed_column(column, object))
         return variable.get_value()
 
+    @property
+    def row_offsets(self):
+        """
+        :return: Byte offsets of the data rows in the CSV file. The last element is the offset of the end of the file.
+         Offsets are indexed once for each file and shared by drivers in the process (see
+         :func:`~ocgis.driver.csv_.get_shared_csv_row_offsets`). Offsets are also stored in the metadata cache if
+         :attr:`ocgis.env.METADATA_CACHE_DIR` is set.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._row_offsets is None:
+            key = get_metadata_cache_key(self, 'row_offsets')
+            row_offsets = METADATA_CACHE.get(key)
+            if row_offsets is None:
+                row_offsets = get_shared_csv_row_offsets(self.rd.uri)
+                METADATA_CACHE.set(key, row_offsets)
+            self._row_offsets = row_offsets
+        return self._row_offsets
+
+    def _get_encoding_(self):
+        driver_kwargs = self.rd.driver_kwargs
+        if driver_kwargs is None:
+            ret = None
+        else:
+            ret = driver_kwargs.get('encoding')
+        return ret
+
     def _get_metadata_main_(self):
         with driver_scope(self) as f:
             meta = {}
             # Get variable names assuming headers are always on the first row.
             reader = csv.reader(f)
             variable_names = six.next(reader)
+            # Infer data types from a sample of rows.
+            sample = list(islice(reader, self.dtype_sample_size))
 
-            # Fill in variable and dimension metadata.
-            meta['variables'] = OrderedDict()
-            meta['dimensions'] = OrderedDict()
-            for varname in variable_names:
-                meta['variables'][varname] = {'name': varname, 'dtype': object, 'dimensions': ('n_records',)}
-            meta['dimensions']['n_records'] = {'name': 'n_records', 'size': sum(1 for _ in f)}
+        # Fill in variable and dimension metadata.
+        meta['variables'] = OrderedDict()
+        meta['dimensions'] = OrderedDict()
+        for idx, varname in enumerate(variable_names):
+            column = [row[idx] for row in sample if idx < len(row)]
+            dtype = get_inferred_dtype(column)
+            meta['variables'][varname] = {'name': varname, 'dtype': dtype, 'dimensions': ('n_records',)}
+        meta['dimensions']['n_records'] = {'name': 'n_records', 'size': self.row_offsets.shape[0] - 1}
         return meta
 
     @classmethod
@@ -59,6 +113,9 @@ class DriverCSV(AbstractTabularDriver):
         raise_if_empty(vc)
 
         iter_kwargs = kwargs.pop(KeywordArgument.ITER_KWARGS, {})
+        # Records are written by column in blocks unless disabled by the iteration keyword arguments.
+        iter_kwargs = iter_kwargs.copy()
+        columnar = iter_kwargs.setdefault(KeywordArgument.COLUMNAR, True)
 
         fieldnames = list(six.next(vc.iter(**iter_kwargs))[1].keys())
 
@@ -70,10 +127,191 @@ class DriverCSV(AbstractTabularDriver):
             for current_rank_write in vm.ranks:
                 if vm.rank == current_rank_write:
                     with driver_scope(cls, opened_or_path, mode='a') as opened:
-                        writer = csv.DictWriter(opened, fieldnames)
-                        for _, record in vc.iter(**iter_kwargs):
-                            writer.writerow(record)
+                        if columnar:
+                            writer = csv.writer(opened)
+                            for _, block in vc.iter(**iter_kwargs):
+                                writer.writerows(get_block_rows(block, fieldnames))
+                        else:
+                            writer = csv.DictWriter(opened, fieldnames)
+                            for _, record in vc.iter(**iter_kwargs):
+                                writer.writerow(record)
                 vm.barrier()
 
     def _init_variable_from_source_main_(self, *args, **kwargs):
         pass
+
+
+def get_block_rows(block, fieldnames):
+    """
+    :param dict block: A block of records mapping record keys to lists of values.
+    :param sequence fieldnames: The output field names.
+    :return: An iterator over record rows ordered by ``fieldnames``. Missing fields are empty strings in the same way as
+     :class:`csv.DictWriter`.
+    :raises: ValueError
+    """
+    extra = [k for k in block if k not in fieldnames]
+    if len(extra) > 0:
+        raise ValueError('dict contains fields not in fieldnames: {}'.format(', '.join([repr(e) for e in extra])))
+    size = len(block[next(iter(block))])
+    columns = [block[k] if k in block else [''] * size for k in fieldnames]
+    return zip(*columns)
+
+
+def get_csv_row_offsets(path):
+    """
+    Create the row offset index for a CSV file. Blank rows are skipped in the same way as :class:`csv.DictReader`.
+    Records with quoted line breaks are indexed by the line they start on.
+
+    :param str path: Path to the CSV file. The first row must contain the headers.
+    :return: Byte offsets of the data rows. The last element is the offset of the end of the file.
+    :rtype: :class:`numpy.ndarray`
+    """
+    offsets = []
+    offset = 0
+    has_header = False
+    # Quoted values may contain line breaks. A record only starts on a line outside quotes. Escaped quotes are doubled
+    # and do not change the quote state.
+    in_quotes = False
+    with open(path, 'rb') as f:
+        for line in f:
+            if not in_quotes and line.strip(b'\r\n'):
+                if has_header:
+                    offsets.append(offset)
+                else:
+                    has_header = True
+            if line.count(b'"') % 2 == 1:
+                in_quotes = not in_quotes
+            offset += len(line)
+    offsets.append(offset)
+    return np.array(offsets, dtype=np.int64)
+
+
+def get_csv_rows(path, row_offsets, selection, encoding=None):
+    """
+    Read and parse rows from a CSV file using the row offset index.
+
+    :param str path: Path to the CSV file.
+    :param row_offsets: See :func:`~ocgis.driver.csv_.get_csv_row_offsets`.
+    :type row_offsets: :class:`numpy.ndarray`
+    :param selection: The rows to read as a slice or an integer array.
+    :type selection: slice | :class:`numpy.ndarray`
+    :param str encoding: The file encoding. If ``None``, use the default encoding for opening files.
+    :return: Parsed rows in the order of ``selection``.
+    :rtype: list
+    """
+    nrows = row_offsets.shape[0] - 1
+    if isinstance(selection, slice):
+        start, stop, _ = selection.indices(nrows)
+        indices = None
+    else:
+        indices = np.asarray(selection)
+        if indices.size == 0:
+            return []
+        start, stop = indices.min(), indices.max() + 1
+    if stop <= start:
+        return []
+
+    # Read the contiguous byte range containing the rows.
+    with open(path, 'rb') as f:
+        f.seek(row_offsets[start])
+        data = f.read(row_offsets[stop] - row_offsets[start])
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, newline='')
+    rows = [row for row in csv.reader(text) if len(row) > 0]
+
+    if indices is not None:
+        rows = [rows[ii] for ii in (indices - start).tolist()]
+    return rows
+
+
+def get_shared_csv_row_offsets(path):
+    """
+    Get the row offset index for a CSV file from :data:`~ocgis.driver.csv_.CSV_ROW_OFFSETS`. The index is created with
+    :func:`~ocgis.driver.csv_.get_csv_row_offsets` if the file is not in the cache or its modification time or size
+    changed.
+
+    :param str path: Path to the CSV file.
+    :rtype: :class:`numpy.ndarray`
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime, stat.st_size)
+    cached = CSV_ROW_OFFSETS.pop(path, None)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, get_csv_row_offsets(path))
+    # Keep the most recently used files.
+    CSV_ROW_OFFSETS[path] = cached
+    while len(CSV_ROW_OFFSETS) > constants.CSV_ROW_OFFSETS_CACHE_SIZE:
+        CSV_ROW_OFFSETS.popitem(last=False)
+    return cached[1]
+
+
+def get_inferred_dtype(values):
+    """
+    Infer the data type of a CSV column from its string values. Integer columns must convert back to the same strings.
+    This preserves identifiers with leading zeros.
+
+    :param sequence values: String values from the CSV column.
+    :return: An integer, float, or ``object`` data type.
+    """
+    if len(values) == 0:
+        return object
+    values = np.array(values)
+    try:
+        converted = values.astype(np.int64)
+    except (ValueError, OverflowError):
+        pass
+    else:
+        if np.all(converted.astype(str) == values):
+            return converted.dtype
+        else:
+            return object
+    try:
+        converted = values.astype(np.float64)
+    except (ValueError, OverflowError):
+        ret = object
+    else:
+        ret = converted.dtype
+    return ret
+
+
+def get_row_selection(dimension):
+    """
+    :param dimension: The dimension for the CSV rows.
+    :type dimension: :class:`~ocgis.Dimension`
+    :return: The rows to read from the source file using the dimension's source index or local bounds.
+    :rtype: slice | :class:`numpy.ndarray`
+    """
+    si_type = dimension._src_idx_type
+    if si_type is None:
+        if dimension.bounds_local is None:
+            ret = slice(0, len(dimension))
+        else:
+            ret = slice(*dimension.bounds_local)
+    elif si_type == SourceIndexType.FANCY:
+        ret = dimension._src_idx
+    elif si_type == SourceIndexType.BOUNDS:
+        ret = slice(*dimension._src_idx)
+    else:
+        raise NotImplementedError(si_type)
+    return ret
+
+
+def get_typed_column(column, dtype):
+    """
+    Convert a column of CSV string values to an array in bulk.
+
+    :param list column: String values for the column.
+    :param dtype: The target data type.
+    :rtype: :class:`numpy.ndarray`
+    """
+    if dtype == object:
+        ret = np.empty(len(column), dtype=object)
+        ret[:] = column
+    else:
+        ret = np.array(column).astype(dtype)
+    return ret
+
+
+#: Row offset indexes for recently read CSV files keyed by absolute path. See
+#: :func:`~ocgis.driver.csv_.get_shared_csv_row_offsets`.
+CSV_ROW_OFFSETS = OrderedDict()
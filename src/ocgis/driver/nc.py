@@ -1,5 +1,7 @@
 import itertools
 import logging
+import os
+import threading
 from abc import ABCMeta
 from collections import OrderedDict
 from copy import deepcopy
@@ -20,12 +22,13 @@ from ocgis.exc import ProjectionDoesNotMatch, PayloadProtectedError, NoDataVaria
     GridDeficientError
 from ocgis.util.helpers import itersubclasses, get_iter, get_formatted_slice, get_by_key_list, is_auto_dtype, get_group
 from ocgis.util.logging_ocgis import ocgis_lh
-from ocgis.variable.base import SourcedVariable, ObjectType, get_slice_sequence_using_local_bounds
+from ocgis.variable.base import SourcedVariable, ObjectType, get_slice_sequence_using_local_bounds, \
+    get_dimension_chunk_sizes
 from ocgis.variable.crs import CFCoordinateReferenceSystem, CoordinateReferenceSystem, CFRotatedPole, CFSpherical, \
     AbstractProj4CRS
 from ocgis.variable.dimension import Dimension
 from ocgis.variable.temporal import TemporalVariable
-from ocgis.vmachine.mpi import OcgDist
+from ocgis.vmachine.mpi import OcgDist, get_rank_bounds
 
 
 class DriverNetcdf(AbstractDriver):
@@ -49,6 +52,11 @@ class DriverNetcdf(AbstractDriver):
     def get_data_variable_names(group_metadata, group_dimension_map):
         return tuple()
 
+    @staticmethod
+    def get_io_lock():
+        # The netCDF-C and HDF5 libraries are not guaranteed to be thread-safe.
+        return NETCDF_IO_LOCK
+
     @classmethod
     def get_variable_for_writing_temporal(cls, temporal_variable):
         return temporal_variable.value_numtime
@@ -67,6 +75,9 @@ class DriverNetcdf(AbstractDriver):
         :keyword bool file_only: (``=False``) If ``True``, do not write the value to the output file. Create an empty
          netCDF file.
         :keyword bool unlimited_to_fixed_size: (``=False``) If ``True``, convert the unlimited dimension to a fixed size.
+        :keyword str preset: (``=None``) Name of a compression and chunking preset in
+         :attr:`ocgis.constants.NETCDF_OUTPUT_PRESETS`. Explicit variable creation arguments take precedence.
+        :keyword bool sync: (``=True``) If ``False``, do not flush the dataset after writing the variable.
         """
         # There should never be any write operations associated with an empty variable.
         raise_if_empty(var)
@@ -81,6 +92,8 @@ class DriverNetcdf(AbstractDriver):
 
         file_only = kwargs.pop(KeywordArgument.FILE_ONLY, False)
         unlimited_to_fixed_size = kwargs.pop(KeywordArgument.UNLIMITED_TO_FIXED_SIZE, False)
+        preset = kwargs.pop(KeywordArgument.PRESET, None)
+        sync = kwargs.pop(KeywordArgument.SYNC, True)
 
         # No data should be written during a global write. Data will be filled in during the append process.
         if write_mode == MPIWriteMode.TEMPLATE:
@@ -135,6 +148,11 @@ class DriverNetcdf(AbstractDriver):
         if write_mode == MPIWriteMode.FILL:
             ncvar = dataset.variables[var.name]
         else:
+            # Compression is not available for netCDF3 or parallel writes.
+            if preset is not None and len(dimensions) > 0 and not is_nc3 and \
+                    write_mode != MPIWriteMode.ASYNCHRONOUS and not isinstance(dtype, VLType) and dtype != 'S1':
+                shape = [len(dataset.dimensions[name]) or size for name, size in zip(dimensions, var.shape)]
+                kwargs = get_preset_variable_kwargs(preset, shape, np.dtype(dtype).itemsize, kwargs)
             ncvar = dataset.createVariable(var.name, dtype, dimensions=dimensions, fill_value=fill_value, **kwargs)
             if write_mode == MPIWriteMode.ASYNCHRONOUS:
                 # Tell NC4 we are writing the variable in parallel
@@ -164,7 +182,7 @@ class DriverNetcdf(AbstractDriver):
                         ncvar[:] = data_value
                     else:
                         try:
-                            ncvar.__setitem__(fill_slice, data_value)
+                            write_variable_slabs(ncvar, fill_slice, data_value)
                         except Exception as e:
                             msg = "Variable name is '{}'. Original message: ".format(var.name) + str(e)
                             raise e.__class__(msg)
@@ -174,7 +192,8 @@ class DriverNetcdf(AbstractDriver):
             if var.units is not None:
                 ncvar.setncattr('units', str(var.units))
 
-        dataset.sync()
+        if sync:
+            dataset.sync()
 
     @classmethod
     def _write_variable_collection_main_(cls, vc, opened_or_path, write_mode, **kwargs):
@@ -208,6 +227,9 @@ class DriverNetcdf(AbstractDriver):
                         vc.write_attributes_to_netcdf_object(dataset)
                     # This is the main variable write loop.
                     variables_to_write = get_variables_to_write(vc)
+                    # The dataset is synced once after all variables are written.
+                    variable_write_kwargs = dict(variable_kwargs)
+                    variable_write_kwargs[KeywordArgument.SYNC] = False
                     for variable in variables_to_write:
                         # Load the variable's data before orphaning. The variable needs its parent to know which
                         # group it is in.
@@ -215,7 +237,7 @@ class DriverNetcdf(AbstractDriver):
                         # Call the individual variable write method in fill mode. Orphaning is required as a
                         # variable will attempt to write its parent first.
                         with orphaned(variable, keep_dimensions=True):
-                            variable.write(dataset, write_mode=write_mode, **variable_kwargs)
+                            variable.write(dataset, write_mode=write_mode, **variable_write_kwargs)
                     # Recurse the children.
                     for child in list(vc.children.values()):
                         if write_mode != MPIWriteMode.FILL:
@@ -398,6 +420,13 @@ class DriverNetcdfCF(AbstractDriverNetcdfCF):
                 env.COORDSYS_ACTUAL = raw_crs
         return dmap
 
+    def _get_dimension_map_cache_key_(self):
+        ret = super(DriverNetcdfCF, self)._get_dimension_map_cache_key_()
+        # Creating a dimension map for a rotated pole source updates the environment. These are not cached.
+        if ret is not None and has_rotated_pole(self.metadata_raw):
+            ret = None
+        return ret
+
     @staticmethod
     def get_data_variable_names(group_metadata, group_dimension_map):
         axes_needed = [DimensionMapKey.TIME, DimensionMapKey.X, DimensionMapKey.Y]
@@ -458,10 +487,14 @@ class DriverNetcdfCF(AbstractDriverNetcdfCF):
         ydim_name = grid_chunker.dst_grid.dimensions[0].name
         xdim_name = grid_chunker.dst_grid.dimensions[1].name
         dst_grid_shape_global = grid_chunker.dst_grid.shape_global
+        # Align the destination slices with the storage chunks of the destination data source.
+        parent = grid_chunker.dst_grid.parent
+        chunk_sizes = get_dimension_chunk_sizes(itertools.chain(parent.data_variables, parent.values()))
         for idx in range(grid_chunker.dst_grid.ndim):
             splits = grid_chunker.nchunks_dst[idx]
             size = dst_grid_shape_global[idx]
-            slices = create_slices_for_dimension(size, splits)
+            chunksize = chunk_sizes.get(grid_chunker.dst_grid.dimensions[idx].name)
+            slices = create_slices_for_dimension(size, splits, chunksize=chunksize)
             slice_store.append(slices)
         for ctr, (slice_y, slice_x) in enumerate(itertools.product(*slice_store)):
             if yield_idx is not None and yield_idx != ctr:
@@ -509,11 +542,194 @@ class DriverNetcdfCF(AbstractDriverNetcdfCF):
         return field
 
 
+class NetcdfChunkCache(object):
+    """
+    Bounded least-recently-used cache of decompressed netCDF storage chunks. The cache is bounded by the total number
+    of bytes of the cached chunks. Hits, misses, and evictions are counted.
+
+    :param int maxbytes: The maximum number of cached bytes. If ``None``, use
+     :attr:`ocgis.env.NETCDF_CHUNK_CACHE_SIZE`. A size of zero disables the cache.
+    """
+
+    def __init__(self, maxbytes=None):
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+        self._maxbytes = maxbytes
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def maxbytes(self):
+        if self._maxbytes is None:
+            ret = env.NETCDF_CHUNK_CACHE_SIZE
+        else:
+            ret = self._maxbytes
+        return ret
+
+    def clear(self):
+        """
+        Remove all cached chunks and reset the counters.
+        """
+
+        self._store.clear()
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+    def get(self, key):
+        """
+        :param key: The cache key.
+        :returns: The cached chunk or ``None`` if it is not in the cache.
+        """
+
+        try:
+            ret = self._store.pop(key)
+        except KeyError:
+            self.misses += 1
+            ret = None
+        else:
+            # Move the entry to the most recently used position.
+            self._store[key] = ret
+            self.hits += 1
+        return ret
+
+    def get_stats(self):
+        """
+        :returns: Dictionary containing the hit, miss, and eviction counts, the current size in bytes, and the maximum
+         size in bytes.
+        :rtype: dict
+        """
+
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'nbytes': self.nbytes,
+                'maxbytes': self.maxbytes}
+
+    def set(self, key, value):
+        """
+        Add a chunk to the cache evicting the least recently used chunks if the cache is full. Chunks larger than the
+        cache are not added.
+
+        :param key: The cache key.
+        :param value: The chunk to cache.
+        :type value: :class:`numpy.ndarray`
+        """
+
+        maxbytes = self.maxbytes
+        if value.nbytes > maxbytes:
+            return
+        previous = self._store.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous.nbytes
+        self._store[key] = value
+        self.nbytes += value.nbytes
+        while self.nbytes > maxbytes:
+            _, evicted = self._store.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+
+
+class NetcdfMultiFileIndex(object):
+    """
+    Index of the member files in a multi-file dataset aggregated along a single dimension as with
+    :class:`netCDF4.MFDataset`. Each member file is opened once to record its length along the aggregation dimension
+    and the ``units`` and ``calendar`` attributes of the aggregated variables. Use
+    :func:`~ocgis.driver.nc.get_multifile_index` to retrieve cached indexes.
+
+    :param sequence uris: Paths to the member files in aggregation order.
+    :param str aggdim: Name of the aggregation dimension. If ``None``, use the first unlimited dimension of the first
+     member file. :attr:`aggdim` is ``None`` if there is no aggregation dimension.
+    """
+
+    def __init__(self, uris, aggdim=None):
+        self.uris = tuple(uris)
+        #: Maps aggregated variable names to a sequence of attribute dictionaries with one element per member file.
+        self.attributes = OrderedDict()
+
+        sizes = []
+        for file_index, uri in enumerate(self.uris):
+            with nc.Dataset(uri) as ds:
+                if file_index == 0 and aggdim is None:
+                    for dim in ds.dimensions.values():
+                        if dim.isunlimited():
+                            aggdim = dim.name
+                            break
+                    else:
+                        break
+                sizes.append(len(ds.dimensions[aggdim]))
+                for name, ncvar in ds.variables.items():
+                    if ncvar.ndim > 0 and ncvar.dimensions[0] == aggdim:
+                        attrs = {key: getattr(ncvar, key, None) for key in ('units', 'calendar')}
+                        self.attributes.setdefault(name, [{}] * len(self.uris))[file_index] = attrs
+
+        self.aggdim = aggdim
+        #: Start of each member file along the aggregation dimension with the total length as the last element.
+        self.offsets = np.append(0, np.cumsum(sizes)).astype(int)
+
+    @property
+    def size(self):
+        """
+        :return: The length of the aggregation dimension.
+        :rtype: int
+        """
+        return int(self.offsets[-1])
+
+    @property
+    def variables(self):
+        """
+        :return: Names of the variables spanning the aggregation dimension.
+        :rtype: tuple
+        """
+        return tuple(self.attributes.keys())
+
+    def iter_pieces(self, element):
+        """
+        Map a source slice element along the aggregation dimension to member files. Pieces are yielded in the requested
+        order and concatenate to the requested elements.
+
+        :param element: A slice or one-dimensional integer or boolean index array along the aggregation dimension.
+        :return: Tuples of ``(file_index, local)`` where ``local`` is a slice or integer index array into the member
+         file.
+        :rtype: tuple
+        """
+
+        if isinstance(element, slice):
+            index = np.arange(*element.indices(self.size))
+        else:
+            index = np.asarray(element).reshape(-1)
+            if index.dtype == bool:
+                index = np.flatnonzero(index)
+            else:
+                index = np.where(index < 0, index + self.size, index)
+        if index.shape[0] == 0:
+            yield 0, slice(0, 0)
+            return
+
+        file_indices = np.searchsorted(self.offsets, index, side='right') - 1
+        breaks = np.flatnonzero(np.diff(file_indices)) + 1
+        for run in np.split(np.arange(index.shape[0]), breaks):
+            file_index = int(file_indices[run[0]])
+            local = index[run] - self.offsets[file_index]
+            if np.all(np.diff(local) == 1):
+                local = slice(int(local[0]), int(local[-1]) + 1)
+            yield file_index, local
+
+
 def create_slice_from_tuple(tup):
     return slice(tup[0], tup[1])
 
 
-def create_slices_for_dimension(size, splits):
+def create_slices_for_dimension(size, splits, chunksize=None):
+    # If there are enough storage chunks, distribute whole chunks so slice bounds fall on chunk boundaries.
+    if chunksize is not None and splits > 1:
+        nstorage = int(np.ceil(float(size) / chunksize))
+        if nstorage >= splits:
+            bounds = [get_rank_bounds(nstorage, splits, rank) for rank in range(splits)]
+            return [(start * chunksize, min(stop * chunksize, size)) for start, stop in bounds]
     ompi = OcgDist(size=splits)
     dimname = 'foo'
     ompi.create_dimension(dimname, size, dist=True)
@@ -587,6 +803,10 @@ def init_variable_using_metadata_for_netcdf(variable, metadata):
                 desired_fill_value = var.get('fill_value')
             variable._fill_value = deepcopy(desired_fill_value)
 
+        chunking = var.get('chunking')
+        if chunking is not None:
+            variable._chunking = tuple(chunking)
+
         variable_attrs = variable._attrs
         # Offset and scale factors are not supported by OCGIS. The data is unpacked when written to a new output file.
         # TODO: Consider supporting offset and scale factors for write operations.
@@ -619,6 +839,11 @@ def get_value_from_request_dataset(variable):
     if variable.protected:
         raise PayloadProtectedError(variable.name)
 
+    # Multi-file datasets are read from the member files holding the requested elements.
+    with NETCDF_IO_LOCK:
+        if get_should_read_multifile(variable):
+            return get_multifile_variable_value(variable)
+
     rd = variable._request_dataset
     with driver_scope(rd.driver) as source:
         if variable.group is not None:
@@ -645,6 +870,23 @@ def get_value_from_request_dataset(variable):
     return ret
 
 
+def get_variable_slab(variable, slc):
+    """
+    Read a slab from a source variable. The slab is assembled from cached storage chunks if appropriate.
+
+    :param variable: The source variable.
+    :type variable: :class:`netCDF4.Variable`
+    :param slc: Sequence of slices with one element per dimension.
+    :rtype: :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+    """
+
+    if get_should_read_chunks(variable, slc):
+        ret = get_chunked_variable_value(variable, slc)
+    else:
+        ret = variable[tuple(slc)]
+    return ret
+
+
 def get_variables_to_write(vc):
     from ocgis.variable.geom import GeometryVariable
     ret = []
@@ -657,6 +899,15 @@ def get_variables_to_write(vc):
 
 
 def get_variable_value(variable, dimensions):
+    slc = get_source_slice(dimensions)
+    return get_sliced_variable_value(variable, slc)
+
+
+def get_source_slice(dimensions):
+    """
+    :return: The source slice for a variable read formatted from its dimensions' local bounds or source indices.
+    """
+
     if dimensions is not None and len(dimensions) > 0:
         to_format = [None] * len(dimensions)
         for idx in range(len(dimensions)):
@@ -677,6 +928,26 @@ def get_variable_value(variable, dimensions):
         slc = get_formatted_slice(to_format, len(dimensions))
     else:
         slc = slice(None)
+    return slc
+
+
+def get_sliced_variable_value(variable, slc):
+    """
+    Read a variable value from a source variable.
+
+    :param variable: The source variable.
+    :type variable: :class:`netCDF4.Variable`
+    :param slc: The source slice. See :func:`~ocgis.driver.nc.get_source_slice`.
+    :rtype: :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+    """
+
+    # Fancy indices are read using bulk slab reads to avoid many small reads.
+    if get_should_coalesce_read(variable, slc):
+        return get_coalesced_variable_value(variable, slc, env.NETCDF_READ_OVERREAD)
+    # Reads touching part of their storage chunks are assembled from cached decompressed chunks.
+    if get_should_read_chunks(variable, slc):
+        return get_chunked_variable_value(variable, slc)
+
     try:
         ret = variable.__getitem__(slc)
     except IndexError:
@@ -685,6 +956,451 @@ def get_variable_value(variable, dimensions):
     return ret
 
 
+def get_multifile_index(uris, aggdim=None):
+    """
+    :return: The aggregation index for a multi-file dataset. Indexes are kept in
+     :data:`~ocgis.driver.nc.NETCDF_MULTIFILE_INDEXES` and rebuilt if the modification time or size of a member file
+     changes.
+    :rtype: :class:`~ocgis.driver.nc.NetcdfMultiFileIndex`
+    """
+
+    uris = tuple(os.path.abspath(uri) for uri in uris)
+    stamps = []
+    for uri in uris:
+        stat = os.stat(uri)
+        stamps.append((stat.st_mtime, stat.st_size))
+    key = (uris, aggdim, tuple(stamps))
+
+    ret = NETCDF_MULTIFILE_INDEXES.pop(key, None)
+    if ret is None:
+        ret = NetcdfMultiFileIndex(uris, aggdim=aggdim)
+    NETCDF_MULTIFILE_INDEXES[key] = ret
+    while len(NETCDF_MULTIFILE_INDEXES) > constants.NETCDF_MULTIFILE_INDEX_CACHE_SIZE:
+        NETCDF_MULTIFILE_INDEXES.popitem(last=False)
+    return ret
+
+
+def get_multifile_variable_value(variable):
+    """
+    Read a variable value from a multi-file dataset without opening an aggregated dataset. Only member files holding
+    the requested elements along the aggregation dimension are opened. Temporal values are converted to the variable's
+    units and calendar if time formatting is requested.
+
+    :param variable: The variable to read. Its request dataset must have a sequence of URIs.
+    :type variable: :class:`~ocgis.variable.base.SourcedVariable`
+    :rtype: :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+    """
+
+    rd = variable._request_dataset
+    index = get_multifile_index(rd.uri, aggdim=(rd.driver_kwargs or {}).get('aggdim'))
+    name = variable.source_name or rd.variable
+    slc = get_source_slice(variable.dimensions)
+
+    # Variables not spanning the aggregation dimension are read from the first member file.
+    if name not in index.variables:
+        with nc.Dataset(index.uris[0]) as ds:
+            ds.set_always_mask(False)
+            return get_sliced_variable_value(ds.variables[name], slc)
+
+    slc = list(get_iter(slc, dtype=(slice, np.ndarray)))
+    should_convert_time = isinstance(variable, TemporalVariable) and rd.format_time
+    pieces = []
+    for file_index, local in index.iter_pieces(slc[0]):
+        with nc.Dataset(index.uris[file_index]) as ds:
+            ds.set_always_mask(False)
+            piece = get_sliced_variable_value(ds.variables[name], tuple([local] + slc[1:]))
+        if should_convert_time:
+            piece = get_converted_time_value(piece, index.attributes[name][file_index], variable.units,
+                                             variable.calendar)
+        pieces.append(piece)
+
+    if len(pieces) == 1:
+        ret = pieces[0]
+    elif any([isinstance(piece, np.ma.MaskedArray) for piece in pieces]):
+        ret = np.ma.concatenate(pieces)
+        for piece in pieces:
+            if np.ma.is_masked(piece):
+                ret.fill_value = piece.fill_value
+                break
+    else:
+        ret = np.concatenate(pieces)
+    return ret
+
+
+def get_converted_time_value(value, attributes, units, calendar):
+    """
+    :param value: Numeric time values read from a member file.
+    :param dict attributes: The member file's ``units`` and ``calendar`` attributes for the time variable.
+    :param str units: The target units.
+    :param str calendar: The target calendar.
+    :return: Time values converted to the target units. Values are returned unchanged if the units and calendar match.
+    """
+
+    src_units = attributes.get('units') or units
+    src_calendar = attributes.get('calendar') or calendar
+    if src_units == units and src_calendar == calendar:
+        return value
+    if calendar is None:
+        calendar = constants.DEFAULT_TEMPORAL_CALENDAR
+    if src_calendar is None:
+        src_calendar = calendar
+    if src_calendar == calendar:
+        # Units with a fixed length convert linearly. Only the unit origin and scale are converted.
+        origin, unit = nc.date2num(nc.num2date([0, 1], src_units, calendar=calendar), units, calendar=calendar)
+        return origin + value * (unit - origin)
+    dates = nc.num2date(value, src_units, calendar=src_calendar)
+    return nc.date2num(dates, units, calendar=calendar)
+
+
+def get_should_read_multifile(variable):
+    """
+    :return: ``True`` if a variable should be read with :func:`~ocgis.driver.nc.get_multifile_variable_value`.
+    :rtype: bool
+    """
+
+    if not env.USE_NETCDF_MULTIFILE_INDEX:
+        return False
+    rd = variable._request_dataset
+    if rd.opened is not None or isinstance(rd.uri, six.string_types):
+        return False
+    # Aggregated datasets are flat. Variables in the root group have a group of "[None]".
+    if variable.group not in (None, [None]):
+        return False
+    # Remote datasets have no file stamps to key the aggregation index.
+    if not all([os.path.isfile(uri) for uri in rd.uri]):
+        return False
+    # Other keyword arguments change how the aggregated dataset is opened.
+    if rd.driver_kwargs is not None and len(set(rd.driver_kwargs.keys()).difference(['aggdim'])) > 0:
+        return False
+    return get_multifile_index(rd.uri, aggdim=(rd.driver_kwargs or {}).get('aggdim')).aggdim is not None
+
+
+def get_chunk_cache_key(variable):
+    """
+    :return: Key identifying a source variable in :data:`~ocgis.driver.nc.NETCDF_CHUNK_CACHE` or ``None`` if the
+     variable's file may not be identified. The key changes if the modification time or size of the file changes.
+    :rtype: tuple
+    """
+
+    try:
+        group = variable.group()
+        path = group.filepath()
+    except (AttributeError, ValueError):
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), stat.st_mtime, stat.st_size, group.path, variable.name
+
+
+def get_chunked_variable_value(variable, slc):
+    """
+    Read a variable value chunk-by-chunk. Decompressed storage chunks are retrieved from or added to
+    :data:`~ocgis.driver.nc.NETCDF_CHUNK_CACHE` and the requested elements are copied from them.
+
+    :param variable: The source variable.
+    :type variable: :class:`netCDF4.Variable`
+    :param tuple slc: Sequence of slices with unit steps and one element per dimension. A single element is allowed for
+     one-dimensional variables.
+    :rtype: :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+    """
+
+    slc = list(get_iter(slc, dtype=(slice, np.ndarray)))
+    key = get_chunk_cache_key(variable)
+    if key is None:
+        return variable[tuple(slc)]
+
+    chunking = get_variable_chunking(variable)
+    bounds = [element.indices(size)[0:2] for element, size in zip(slc, variable.shape)]
+    chunk_ranges = [range(start // chunksize, -(-stop // chunksize)) for (start, stop), chunksize in
+                    zip(bounds, chunking)]
+
+    out = None
+    fill_value = None
+    for chunk_index in itertools.product(*chunk_ranges):
+        chunk_slc = tuple(slice(idx * chunksize, min((idx + 1) * chunksize, size)) for idx, chunksize, size in
+                          zip(chunk_index, chunking, variable.shape))
+        chunk = NETCDF_CHUNK_CACHE.get(key + (chunk_index,))
+        if chunk is None:
+            chunk = variable[chunk_slc]
+            NETCDF_CHUNK_CACHE.set(key + (chunk_index,), chunk)
+
+        # Copy the intersection of the chunk and the request.
+        src = []
+        dst = []
+        for (start, stop), element in zip(bounds, chunk_slc):
+            lower = max(start, element.start)
+            upper = min(stop, element.stop)
+            src.append(slice(lower - element.start, upper - element.start))
+            dst.append(slice(lower - start, upper - start))
+        piece = chunk[tuple(src)]
+        if fill_value is None and np.ma.is_masked(piece):
+            fill_value = chunk.fill_value
+
+        if out is None:
+            out = np.empty([stop - start for start, stop in bounds], dtype=piece.dtype)
+        # Chunks are only returned masked if they contain masked elements (i.e. with "set_always_mask(False)").
+        if isinstance(piece, np.ma.MaskedArray) and not isinstance(out, np.ma.MaskedArray):
+            out = np.ma.array(out, mask=False)
+        out[tuple(dst)] = piece
+
+    if fill_value is not None:
+        out.fill_value = fill_value
+    return out
+
+
+def get_coalesced_variable_value(variable, slc, overread):
+    """
+    Read a variable value using slab reads for fancy-indexed dimensions. The requested elements are gathered from the
+    slabs in memory. Reads are planned with :func:`~ocgis.driver.nc.get_read_plan`.
+
+    :param variable: The source variable.
+    :type variable: :class:`netCDF4.Variable`
+    :param tuple slc: Sequence of slices and one-dimensional integer or boolean index arrays with one element per
+     dimension. A single element is allowed for one-dimensional variables.
+    :param float overread: See :func:`~ocgis.driver.nc.get_read_plan`.
+    :rtype: :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+    """
+
+    slc = list(get_iter(slc, dtype=(slice, np.ndarray)))
+    chunking = get_variable_chunking(variable)
+
+    plans = OrderedDict()
+    for idx, element in enumerate(slc):
+        if isinstance(element, np.ndarray):
+            if element.dtype == bool:
+                element = np.flatnonzero(element)
+            chunksize = None if chunking is None else chunking[idx]
+            plans[idx] = get_read_plan(element, overread, chunksize=chunksize)
+
+    out = None
+    fill_value = None
+    for groups in itertools.product(*[plan[2] for plan in plans.values()]):
+        read_slc = list(slc)
+        fill_slc = [slice(None)] * len(slc)
+        for axis, (start, stop, positions), plan in zip(plans.keys(), groups, plans.values()):
+            read_slc[axis] = slice(start, stop)
+            fill_slc[axis] = positions
+        piece = get_variable_slab(variable, read_slc)
+        # Masked slabs carry the variable's fill value. Taking from masked arrays does not preserve it.
+        if fill_value is None and np.ma.is_masked(piece):
+            fill_value = piece.fill_value
+        # Gather the requested elements from the slab.
+        for axis, (start, stop, positions), plan in zip(plans.keys(), groups, plans.values()):
+            piece = piece.take(plan[0][positions] - start, axis=axis)
+
+        if out is None:
+            shape = list(piece.shape)
+            for axis, plan in plans.items():
+                shape[axis] = plan[0].shape[0]
+            out = np.empty(shape, dtype=piece.dtype)
+        # Slabs are only returned masked if they contain masked elements (i.e. with "set_always_mask(False)").
+        if isinstance(piece, np.ma.MaskedArray) and not isinstance(out, np.ma.MaskedArray):
+            out = np.ma.array(out, mask=False)
+        out[tuple(fill_slc)] = piece
+
+    # Expand the sorted unique elements to the requested order.
+    for axis, plan in plans.items():
+        if plan[1] is not None:
+            out = out.take(plan[1], axis=axis)
+    if fill_value is not None:
+        out.fill_value = fill_value
+    return out
+
+
+def get_read_plan(index, overread, chunksize=None):
+    """
+    Plan slab reads for a fancy index along a dimension. Contiguous runs of the sorted unique index are read as single
+    slabs. Runs separated by gaps inside a single storage chunk are merged as the chunk is read in full regardless. The
+    smallest remaining gaps are merged while the number of elements read stays within ``overread`` times the number of
+    elements requested.
+
+    :param index: The integer index.
+    :type index: :class:`numpy.ndarray`
+    :param float overread: The maximum ratio of elements read to elements requested for merging gaps.
+    :param int chunksize: The storage chunk size along the dimension, if any.
+    :return: A tuple containing the sorted unique index, the inverse index to restore the requested order (``None`` if
+     the index is already sorted and unique), and a sequence of ``(start, stop, positions)`` tuples. ``start`` and
+     ``stop`` are the slab bounds and ``positions`` is a slice into the sorted unique index.
+    :rtype: tuple
+    """
+
+    index = np.asarray(index).reshape(-1)
+    unique, inverse = np.unique(index, return_inverse=True)
+    if unique.shape[0] == index.shape[0] and np.all(unique == index):
+        inverse = None
+
+    gaps = np.diff(unique) - 1
+    merge = gaps == 0
+    if chunksize is not None:
+        merge |= (unique[:-1] // chunksize) == (unique[1:] // chunksize)
+    budget = overread * unique.shape[0] - (unique.shape[0] + gaps[merge].sum())
+    candidates = np.flatnonzero(np.invert(merge))
+    candidates = candidates[np.argsort(gaps[candidates], kind='stable')]
+    merge[candidates[np.cumsum(gaps[candidates]) <= budget]] = True
+
+    breaks = np.flatnonzero(np.invert(merge)) + 1
+    starts = np.append(0, breaks)
+    stops = np.append(breaks, unique.shape[0])
+    groups = [(int(unique[start]), int(unique[stop - 1]) + 1, slice(int(start), int(stop))) for start, stop in
+              zip(starts, stops)]
+    return unique, inverse, groups
+
+
+def get_preset_chunk_sizes(shape, itemsize, chunk_bytes):
+    """
+    Derive storage chunk sizes for an output variable. Trailing dimensions are kept whole and leading dimensions are
+    filled until a chunk reaches the target size. This favors writing and reading whole slabs along the leading (usually
+    time) dimension.
+
+    :param sequence shape: The output variable's shape.
+    :param int itemsize: Size in bytes of a single element.
+    :param int chunk_bytes: The target chunk size in bytes.
+    :rtype: list
+    """
+
+    ret = [1] * len(shape)
+    nbytes = itemsize
+    for idx in range(len(shape) - 1, -1, -1):
+        size = max(int(shape[idx]), 1)
+        count = max(int(chunk_bytes // nbytes), 1)
+        ret[idx] = min(size, count)
+        nbytes *= ret[idx]
+        if ret[idx] < size:
+            break
+    return ret
+
+
+def get_preset_variable_kwargs(preset, shape, itemsize, kwargs):
+    """
+    :param str preset: Name of a preset in :attr:`ocgis.constants.NETCDF_OUTPUT_PRESETS`.
+    :param sequence shape: The output variable's shape.
+    :param int itemsize: Size in bytes of a single element.
+    :param dict kwargs: Explicit variable creation arguments. These take precedence over preset arguments.
+    :return: Variable creation arguments with preset compression and chunking arguments.
+    :rtype: dict
+    """
+
+    try:
+        ret = dict(constants.NETCDF_OUTPUT_PRESETS[preset])
+    except KeyError:
+        msg = 'Output preset "{}" not recognized. Valid presets are: {}'.format(
+            preset, sorted(constants.NETCDF_OUTPUT_PRESETS.keys()))
+        raise ValueError(msg)
+    chunk_bytes = ret.pop('chunk_bytes')
+    if not kwargs.get('contiguous', False):
+        ret['chunksizes'] = get_preset_chunk_sizes(shape, itemsize, chunk_bytes)
+    ret.update(kwargs)
+    return ret
+
+
+def get_should_coalesce_read(variable, slc):
+    """
+    :return: ``True`` if a variable read should be planned with :func:`~ocgis.driver.nc.get_coalesced_variable_value`.
+    :rtype: bool
+    """
+
+    if env.NETCDF_READ_OVERREAD < 1 or isinstance(variable, MFTime):
+        return False
+    slc = list(get_iter(slc, dtype=(slice, np.ndarray)))
+    if len(slc) != variable.ndim:
+        return False
+    # Character and string variables may be converted on read changing the dimension count.
+    if variable.dtype == str or np.dtype(variable.dtype).kind in ('S', 'U', 'O'):
+        return False
+
+    has_fancy = False
+    for element in slc:
+        if isinstance(element, np.ndarray):
+            if element.ndim != 1 or element.dtype.kind not in ('b', 'i', 'u') or element.size == 0:
+                return False
+            has_fancy = True
+        elif not isinstance(element, slice):
+            return False
+    return has_fancy
+
+
+def get_should_read_chunks(variable, slc):
+    """
+    :return: ``True`` if a variable read should be assembled from storage chunks with
+     :func:`~ocgis.driver.nc.get_chunked_variable_value`. This is the case when the read touches more elements in its
+     storage chunks than it requests and the touched chunks fit in the chunk cache.
+    :rtype: bool
+    """
+
+    maxbytes = NETCDF_CHUNK_CACHE.maxbytes
+    if maxbytes <= 0 or isinstance(variable, MFTime) or variable.ndim == 0:
+        return False
+    chunking = get_variable_chunking(variable)
+    if chunking is None:
+        return False
+    slc = list(get_iter(slc, dtype=(slice, np.ndarray)))
+    if len(slc) != variable.ndim or not all([isinstance(element, slice) for element in slc]):
+        return False
+    if variable.dtype == str or np.dtype(variable.dtype).kind in ('S', 'U', 'O'):
+        return False
+
+    requested = 1
+    touched = 1
+    for element, chunksize, size in zip(slc, chunking, variable.shape):
+        if element.step not in (None, 1):
+            return False
+        start, stop = element.indices(size)[0:2]
+        if stop <= start:
+            return False
+        requested *= stop - start
+        touched *= min(-(-stop // chunksize) * chunksize, size) - (start // chunksize) * chunksize
+    return requested < touched and touched * np.dtype(variable.dtype).itemsize <= maxbytes
+
+
+def get_variable_chunking(variable):
+    """
+    :return: The storage chunk sizes for a source variable or ``None`` if the variable is not chunked.
+    :rtype: list
+    """
+
+    try:
+        ret = variable.chunking()
+    except (AttributeError, RuntimeError):
+        # Multi-file variables and some storage formats do not support the chunking query.
+        ret = None
+    if ret == 'contiguous':
+        ret = None
+    return ret
+
+
+def write_variable_slabs(ncvar, fill_slice, value):
+    """
+    Write a value to a netCDF variable in slabs along the first dimension. Masked values are filled and data types are
+    converted one slab at a time so a large value is not copied in full during the write. Slabs are aligned with the
+    variable's storage chunks when possible.
+
+    :param ncvar: The target netCDF variable.
+    :type ncvar: :class:`netCDF4.Variable`
+    :param sequence fill_slice: Slices into the target variable with one element per dimension.
+    :param value: The value to write.
+    :type value: :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+    """
+
+    fill_slice = list(fill_slice)
+    maxbytes = env.NETCDF_WRITE_SLAB_SIZE
+    size = value.shape[0] if value.ndim > 0 else 0
+    if maxbytes <= 0 or value.nbytes <= maxbytes or size <= 1 or len(fill_slice) != value.ndim:
+        ncvar[tuple(fill_slice)] = value
+        return
+
+    step = max(int(maxbytes // (value.nbytes // size)), 1)
+    chunking = get_variable_chunking(ncvar)
+    if chunking is not None and chunking[0] <= step:
+        step -= step % chunking[0]
+    offset = fill_slice[0].start or 0
+    for start in range(0, size, step):
+        stop = min(start + step, size)
+        slab_slice = [slice(offset + start, offset + stop)] + fill_slice[1:]
+        ncvar[tuple(slab_slice)] = value[start:stop]
+
+
 def create_dimension_or_pass(dim, dataset, write_mode=MPIWriteMode.NORMAL):
     if dim.name not in dataset.dimensions:
         if dim.is_unlimited:
@@ -871,7 +1587,8 @@ def update_group_metadata(rootgrp, fill):
                                 'name': value._name,
                                 'fill_value': fill_value,
                                 'dtype_packed': dtype_packed,
-                                'fill_value_packed': fill_value_packed}})
+                                'fill_value_packed': fill_value_packed,
+                                'chunking': get_variable_chunking(value)}})
     fill.update({'variables': variables})
 
     # get dimensions
@@ -880,3 +1597,26 @@ def update_group_metadata(rootgrp, fill):
         subdim = {key: {'name': key, 'size': len(value), 'isunlimited': value.isunlimited()}}
         dimensions.update(subdim)
     fill.update({'dimensions': dimensions})
+
+
+def has_rotated_pole(metadata):
+    """
+    :param dict metadata: Group metadata to search recursively.
+    :returns: ``True`` if a variable in the group or its children is a rotated pole grid mapping.
+    :rtype: bool
+    """
+
+    names = (CFRotatedPole.grid_mapping_name,) + CFRotatedPole._fuzzy_grid_mapping_names
+    for variable in metadata.get('variables', {}).values():
+        if variable.get('attrs', {}).get('grid_mapping_name') in names:
+            return True
+    return any([has_rotated_pole(group) for group in metadata.get('groups', {}).values()])
+
+
+NETCDF_CHUNK_CACHE = NetcdfChunkCache()
+
+#: Aggregation indexes for multi-file datasets. See :func:`~ocgis.driver.nc.get_multifile_index`.
+NETCDF_MULTIFILE_INDEXES = OrderedDict()
+
+#: Serializes netCDF library calls when operations run I/O on more than one thread.
+NETCDF_IO_LOCK = threading.RLock()
@@ -5,7 +5,8 @@ from copy import deepcopy
 
 import fiona
 import numpy as np
-from ocgis import constants, vm
+import shapely
+from ocgis import constants, vm, env
 from ocgis.constants import MPIWriteMode, DimensionName, KeywordArgument, DriverKey, DMK, SourceIndexType, VariableName
 from ocgis.driver.base import driver_scope, AbstractTabularDriver
 from ocgis.driver.dimension_map import DimensionMap
@@ -15,6 +16,7 @@ from ocgis.util.helpers import is_auto_dtype
 from ocgis.util.logging_ocgis import ocgis_lh
 from ocgis.variable.crs import CoordinateReferenceSystem
 from ocgis.variable.geom import GeometryVariable
+from shapely import wkb
 from shapely.geometry import mapping
 
 
@@ -115,6 +117,10 @@ class DriverVector(AbstractTabularDriver):
             if iteration_dimension._src_idx_type == SourceIndexType.BOUNDS:
                 src_idx = slice(*src_idx)
 
+        # Read attributes and geometries by column unless the client provided an opened object.
+        if not as_geometry_iterator and self.rd.opened is None:
+            return self._get_variable_value_bulk_(variable, src_idx)
+
         # For vector formats based on loading via iteration, it makes sense to load all values with a single pass.
         with driver_scope(self, slc=src_idx) as g:
             if as_geometry_iterator:
@@ -188,6 +194,47 @@ class DriverVector(AbstractTabularDriver):
                                                  'attrs': OrderedDict()}
         return m
 
+    def _get_variable_value_bulk_(self, variable, src_idx):
+        if variable.parent is None:
+            targets = [variable]
+        else:
+            targets = [v for v in variable.parent.values() if not isinstance(v, CoordinateReferenceSystem)]
+        names = [v.name for v in targets if not isinstance(v, GeometryVariable)]
+        load_geoms = any([isinstance(v, GeometryVariable) for v in targets])
+
+        driver_kwargs = self.rd.driver_kwargs or {}
+        if env.USE_PYOGRIO and set(driver_kwargs.keys()).issubset({'feature_class'}):
+            columns, geoms = read_vector_columns(self.rd.uri, names, slc=src_idx,
+                                                 layer=driver_kwargs.get('feature_class'), load_geoms=load_geoms)
+        else:
+            # Other driver keyword arguments (e.g. a SQL selection) are only understood by the OGR iterator.
+            with driver_scope(self, slc=src_idx, load_geoms=load_geoms) as g:
+                rows = list(g)
+            columns = {name: [row['properties'][name] for row in rows] for name in names}
+            if load_geoms:
+                geoms = np.empty(len(rows), dtype=object)
+                geoms[:] = [row['geom'] for row in rows]
+            else:
+                geoms = None
+
+        ret = {}
+        for v in targets:
+            if isinstance(v, GeometryVariable):
+                ret[v.name] = geoms
+            else:
+                ret[v.name] = get_typed_vector_column(columns[v.name], v.dtype)
+
+        # Only supply a mask if something is actually masked.
+        is_masked = any([np.ma.is_masked(v) for v in ret.values()])
+        if is_masked:
+            for k, v in ret.items():
+                ret[k] = np.ma.array(v, mask=np.ma.getmaskarray(v))
+        else:
+            for k, v in ret.items():
+                ret[k] = np.ma.getdata(v)
+
+        return ret
+
     def _init_variable_from_source_main_(self, variable_object, variable_metadata):
         if is_auto_dtype(variable_object._dtype):
             variable_object.dtype = variable_metadata['dtype']
@@ -375,6 +422,37 @@ def get_fiona_type_from_pydata(pydata, string_width=None):
     return ftype
 
 
+def get_typed_vector_column(values, dtype):
+    """
+    Convert a vector attribute column to a typed array in bulk. Missing values (``None`` or NaN for numeric columns)
+    are masked. The columnar reader returns null floating point values as NaN while the OGR iterator returns ``None``,
+    so both are masked for either reader.
+
+    :param values: The column values.
+    :type values: sequence | :class:`numpy.ndarray`
+    :param dtype: The target data type.
+    :rtype: :class:`numpy.ma.MaskedArray`
+    """
+    if dtype == object:
+        ret = np.empty(len(values), dtype=object)
+        ret[:] = values
+        mask = np.array([v is None for v in ret.tolist()], dtype=bool)
+    else:
+        values = np.asarray(values)
+        if values.dtype == object:
+            mask = np.array([v is None or (isinstance(v, float) and np.isnan(v)) for v in values.tolist()],
+                            dtype=bool)
+            values = values.copy()
+            values[mask] = 0
+        elif values.dtype.kind == 'f':
+            mask = np.isnan(values)
+            values = np.where(mask, 0, values)
+        else:
+            mask = np.zeros(values.shape, dtype=bool)
+        ret = values.astype(dtype)
+    return np.ma.array(ret, mask=mask)
+
+
 def iter_field_slices_for_records(vc_like, dimension_names, variable_names):
     dimensions = [vc_like.dimensions[d] for d in dimension_names]
     target = vc_like.copy()
@@ -423,3 +501,74 @@ def write_records_to_fiona(sink, itr, driver):
         record = format_record_for_fiona(driver, record)
         record = {'properties': record, 'geometry': mapping(geom)}
         sink.write(record)
+
+
+def read_vector_columns(path, names, slc=None, layer=None, load_geoms=True):
+    """
+    Read attribute columns and geometries from a vector data source in bulk using the columnar reader from
+    ``pyogrio``. Geometries are returned by the reader as WKB and decoded together. Requires ``pyogrio`` (see
+    :attr:`ocgis.env.USE_PYOGRIO`).
+
+    :param str path: Path to the vector data source.
+    :param sequence names: Attribute names to read.
+    :param slc: Positional feature selection. If ``None``, read all features.
+    :type slc: slice | :class:`numpy.ndarray`
+    :param str layer: The layer name. If ``None``, use the first layer.
+    :param bool load_geoms: If ``False``, do not read geometries.
+    :return: A tuple composed of a dictionary mapping attribute names to value arrays or lists and an object array of
+     geometries. The geometry array is ``None`` if geometries are not loaded.
+    :rtype: tuple
+    :raises: ValueError
+    """
+    from pyogrio import read_info
+    from pyogrio.raw import read
+
+    if slc is None:
+        start, stop, positions = 0, None, None
+    elif isinstance(slc, slice):
+        start, stop, positions = slc.start or 0, slc.stop, None
+    else:
+        # Read the span of features covering the selection and select them by position afterwards.
+        slc = np.asarray(slc)
+        if slc.size == 0:
+            start, stop, positions = 0, 0, None
+        else:
+            start, stop = int(slc.min()), int(slc.max()) + 1
+            positions = slc - start
+
+    is_empty = stop is not None and stop <= start
+    if is_empty:
+        # Nothing is selected. Only the layer information is needed to check the attribute names.
+        fields = read_info(path, layer=layer)['fields']
+    else:
+        if stop is None:
+            max_features = None
+        else:
+            max_features = stop - start
+        meta, _, geometry, field_data = read(path, layer=layer, columns=names, read_geometry=load_geoms,
+                                             skip_features=start, max_features=max_features)
+        fields = meta['fields']
+
+    # Attribute names not in the data source are dropped by the reader.
+    missing = [n for n in names if n not in list(fields)]
+    if len(missing) > 0:
+        raise ValueError('Attributes not found in the vector data source "{}": {}'.format(path, missing))
+
+    if is_empty:
+        columns = {n: np.array([]) for n in names}
+        geometry = np.array([], dtype=object)
+    else:
+        if positions is not None:
+            field_data = [fd[positions] for fd in field_data]
+            if load_geoms:
+                geometry = geometry[positions]
+        columns = dict(zip(fields, field_data))
+    if not load_geoms:
+        geoms = None
+    elif env.USE_VECTORIZED_GEOMETRY:
+        geoms = shapely.from_wkb(geometry)
+    else:
+        geoms = np.empty(len(geometry), dtype=object)
+        geoms[:] = [None if g is None else wkb.loads(g) for g in geometry]
+
+    return columns, geoms
@@ -58,6 +58,8 @@ class Environment(AbstractOcgisObject):
         self.DIR_GEOMCABINET = EnvParm('DIR_GEOMCABINET', None)
         # Left in for backwards compatibility. Performs the same function as DIR_GEOMCABINET.
         self.DIR_SHPCABINET = EnvParm('DIR_SHPCABINET', None)
+        # Directory for persistent geometry cabinet feature indexes. If None, indexes are stored next to their source.
+        self.DIR_GEOMCABINET_INDEX = EnvParm('DIR_GEOMCABINET_INDEX', None)
         self.DIR_DATA = EnvParm('DIR_DATA', None)
         self.DIR_TEST_DATA = EnvParm('DIR_TEST_DATA', None)
         self.MELTED = EnvParm('MELTED', None, formatter=self._format_bool_)
@@ -70,10 +72,16 @@ class Environment(AbstractOcgisObject):
         self.DEBUG = EnvParm('DEBUG', False, formatter=self._format_bool_)
         self.DIR_BIN = EnvParm('DIR_BIN', None)
         self.USE_SPATIAL_INDEX = EnvParmImport('USE_SPATIAL_INDEX', None, 'rtree')
+        # If True, build and reuse persistent feature indexes for geometry cabinet selections.
+        self.USE_GEOMCABINET_INDEX = EnvParm('USE_GEOMCABINET_INDEX', False, formatter=self._format_bool_)
         self.USE_CFUNITS = EnvParmImport('USE_CFUNITS', None, ('cf_units', 'cfunits'))
         self.USE_ESMF = EnvParmImport('USE_ESMF', None, 'ESMF')
         self.USE_ICCLIM = EnvParmImport('USE_ICCLIM', None, 'icclim')
         self.USE_MPI4PY = EnvParmImport('USE_MPI4PY', None, 'mpi4py')
+        # If True, use the vectorized geometry constructors available with shapely >= 2.0.
+        self.USE_VECTORIZED_GEOMETRY = EnvParmImport('USE_VECTORIZED_GEOMETRY', None, 'shapely.creation')
+        # If True, read vector attributes and geometries in bulk using the columnar pyogrio reader.
+        self.USE_PYOGRIO = EnvParmImport('USE_PYOGRIO', None, 'pyogrio')
         self.USE_MEMORY_OPTIMIZATIONS = EnvParm('USE_MEMORY_OPTIMIZATIONS', False, formatter=self._format_bool_)
         self.USE_NETCDF4_MPI = EnvParm('USE_NETCDF4_MPI', None, formatter=self._format_bool_)
         self.CONF_PATH = EnvParm('CONF_PATH', os.path.expanduser('~/.config/ocgis.conf'))
@@ -95,6 +103,40 @@ class Environment(AbstractOcgisObject):
         self.COORDSYS_ACTUAL = EnvParm('COORDSYS_ACTUAL', None)
         # The maximum string length to use when creating NetCDF string variables.
         self.STRING_MAX_LENGTH = EnvParm('STRING_MAX_LENGTH', 255)
+        # The maximum number of temporal groupings to cache. Set to zero to disable the cache.
+        self.TEMPORAL_GROUP_CACHE_SIZE = EnvParm('TEMPORAL_GROUP_CACHE_SIZE',
+                                                 constants.DEFAULT_TEMPORAL_GROUP_CACHE_SIZE, formatter=int)
+        # The maximum ratio of elements read to elements requested when coalescing fancy-indexed netCDF reads into slab
+        # reads. Set to zero to disable coalescing.
+        self.NETCDF_READ_OVERREAD = EnvParm('NETCDF_READ_OVERREAD', constants.DEFAULT_NETCDF_READ_OVERREAD,
+                                            formatter=float)
+        # The maximum number of bytes of decompressed netCDF storage chunks to cache. Set to zero to disable the cache.
+        self.NETCDF_CHUNK_CACHE_SIZE = EnvParm('NETCDF_CHUNK_CACHE_SIZE', constants.DEFAULT_NETCDF_CHUNK_CACHE_SIZE,
+                                               formatter=int)
+        # If True, read multi-file netCDF datasets from their member files using a cached aggregation index instead of
+        # opening an aggregated dataset for each read.
+        self.USE_NETCDF_MULTIFILE_INDEX = EnvParm('USE_NETCDF_MULTIFILE_INDEX', True, formatter=self._format_bool_)
+        # Directory for the on-disk metadata cache. Source metadata, dimension maps, and time extents are cached by file
+        # path, modification time, size, and driver. If None, the cache is disabled. The directory must not be writable by
+        # other users.
+        self.METADATA_CACHE_DIR = EnvParm('METADATA_CACHE_DIR', None)
+        # The maximum number of bytes written to a netCDF variable in a single slab. Set to zero to write whole values.
+        self.NETCDF_WRITE_SLAB_SIZE = EnvParm('NETCDF_WRITE_SLAB_SIZE', constants.DEFAULT_NETCDF_WRITE_SLAB_SIZE,
+                                              formatter=int)
+        # The maximum number of loaded or transformed selection geometries to cache. Set to zero to disable the cache.
+        self.GEOM_SELECTION_CACHE_SIZE = EnvParm('GEOM_SELECTION_CACHE_SIZE',
+                                                 constants.DEFAULT_GEOM_SELECTION_CACHE_SIZE, formatter=int)
+        # The number of worker processes used by the "process" operations backend. If None, use the CPU count.
+        self.PROCESS_POOL_WORKERS = EnvParm('PROCESS_POOL_WORKERS', None, formatter=int)
+        # The maximum number of work units submitted to the "process" operations backend and not yet converted. This
+        # bounds the number of collections held in memory. If None, use twice the number of workers.
+        self.PROCESS_POOL_QUEUE_DEPTH = EnvParm('PROCESS_POOL_QUEUE_DEPTH', None, formatter=int)
+        # The number of collections read ahead by a background thread while the current collection is converted. Set to
+        # zero to process collections serially.
+        self.OPERATIONS_PREFETCH_DEPTH = EnvParm('OPERATIONS_PREFETCH_DEPTH', 0, formatter=int)
+        # The default memory limit for operations in megabytes. Fields are tiled spatially if the estimated working set
+        # of a request exceeds the limit. If None, there is no limit.
+        self.MEMORY_LIMIT = EnvParm('MEMORY_LIMIT', None, formatter=float)
 
         if self.PREFER_NETCDFTIME is None:
             self.PREFER_NETCDFTIME = get_netcdftime_preference()
@@ -1,10 +1,17 @@
-from ocgis import vm
+from copy import deepcopy
+
+import numpy as np
+
+from ocgis import vm, env
 from ocgis.base import AbstractOcgisObject
+from ocgis.calc.base import AbstractMultivariateFunction
+from ocgis.calc.engine import CalculationEngine
 from ocgis.conv.meta import MetaOCGISConverter
 from ocgis.ops.engine import OperationsEngine
 from ocgis.ops.interpreter import OcgInterpreter
 from ocgis.ops.parms.base import AbstractParameter
 from ocgis.ops.parms.definition import *
+from ocgis.ops.parms.definition import Backend, MemoryLimit
 from ocgis.util.addict import Dict
 from ocgis.variable.crs import CFRotatedPole, WGS84, Spherical
 
@@ -43,7 +50,9 @@ class OcgOperations(AbstractOcgisObject):
     :param snippet: If ``True``, return a data "snippet" composed of the first time point, first level (if applicable),
      and the entire spatial domain.
     :type snippet: bool
-    :param backend: The processing backend to use.
+    :param backend: The processing backend to use. If ``'process'``, request datasets and selection geometries are
+     processed by a pool of worker processes without MPI. See :attr:`ocgis.env.PROCESS_POOL_WORKERS` and
+     :attr:`ocgis.env.PROCESS_POOL_QUEUE_DEPTH`.
     :type backend: str
     :param prefix: The output prefix to prepend to any output data filename.
     :type prefix: str
@@ -115,6 +124,9 @@ class OcgOperations(AbstractOcgisObject):
      coordinate systems.
     :param bool optimized_bbox_subset: If ``True``, only perform the bounding box subset ignoring other subsetting
      procedures such as spatial operations on geometry objects using a spatial index.
+    :param memory_limit: The memory limit in megabytes. If ``None``, default to :attr:`ocgis.env.MEMORY_LIMIT`. If the
+     estimated working set exceeds the limit, fields are tiled spatially. See :meth:`~ocgis.OcgOperations.get_memory_plan`.
+    :type memory_limit: int | float
     """
 
     def __init__(self, dataset=None, spatial_operation='intersects', geom=None, geom_select_sql_where=None,
@@ -126,10 +138,13 @@ class OcgOperations(AbstractOcgisObject):
                  add_auxiliary_files=True, optimizations=None, callback=None, time_range=None, time_region=None,
                  time_subset_func=None, level_range=None, conform_units_to=None, select_nearest=False,
                  regrid_destination=None, regrid_options=None, melted=False, output_format_options=None,
-                 spatial_wrapping=None, spatial_reorder=False, optimized_bbox_subset=False):
+                 spatial_wrapping=None, spatial_reorder=False, optimized_bbox_subset=False,
+                 memory_limit=None):
 
         # Tells "__setattr__" to not perform global validation until all values are initially set.
         self._is_init = True
+        # The memory plan is computed on demand and cached until a parameter is set.
+        self._memory_plan = None
 
         self.dataset = Dataset(dataset)
         self.spatial_operation = SpatialOperation(spatial_operation)
@@ -163,6 +178,7 @@ class OcgOperations(AbstractOcgisObject):
         self.add_auxiliary_files = AddAuxiliaryFiles(add_auxiliary_files)
         self.optimizations = Optimizations(optimizations)
         self.optimized_bbox_subset = OptimizedBoundingBoxSubset(optimized_bbox_subset)
+        self.memory_limit = MemoryLimit(env.MEMORY_LIMIT if memory_limit is None else memory_limit)
         self.callback = Callback(callback)
         self.time_range = TimeRange(time_range)
         self.time_region = TimeRegion(time_region)
@@ -212,6 +228,7 @@ class OcgOperations(AbstractOcgisObject):
             except AttributeError:
                 object.__setattr__(self, name, value)
         if self._is_init is False:
+            object.__setattr__(self, '_memory_plan', None)
             self._update_dependents_()
             self._validate_()
 
@@ -288,6 +305,35 @@ class OcgOperations(AbstractOcgisObject):
         ret['total'] = total
         return ret
 
+    def get_memory_plan(self):
+        """
+        Estimate the working set of each field in kilobytes and decide if fields are tiled to fit within the memory
+        limit. The working set is the raw data variables and their masks (see
+        :meth:`~ocgis.OcgOperations.get_base_request_size`), the calculation outputs, and the sample size arrays if
+        ``calc_sample_size`` is ``True``. Fields are processed one at a time, so the largest working set is compared to
+        the limit. If fields are tiled, the tile budget is shared by the tiles read ahead by the operations engine (see
+        :attr:`ocgis.env.OPERATIONS_PREFETCH_DEPTH`). The plan is cached until an operations parameter is set.
+
+        :returns: Dictionary with the memory limit, the largest working set, the working set components for each field
+         keyed by field name, if fields are tiled, the tile budget, and a description of the plan. All sizes are in
+         kilobytes.
+        :rtype: dict
+
+        >>> ops = OcgOperations(..., memory_limit=512)
+        >>> ret = ops.get_memory_plan()
+        {'description': 'Estimated working set of 915668.0 KB exceeds the memory limit of 524288.0 KB. Fields are '
+                        'tiled spatially with a budget of 524288.0 KB for each tile.',
+         'field': {'tas': {'calc': 1168.0, 'raw': 914500.0, 'sample_size': 0.0, 'total': 915668.0}},
+         'memory_limit': 524288.0,
+         'tile_budget': 524288.0,
+         'tiled': True,
+         'working_set': 915668.0}
+        """
+
+        if self._memory_plan is None:
+            object.__setattr__(self, '_memory_plan', self._get_memory_plan_())
+        return self._memory_plan
+
     def get_meta(self):
         meta_converter = MetaOCGISConverter(self)
         rows = meta_converter.get_rows()
@@ -298,10 +344,8 @@ class OcgOperations(AbstractOcgisObject):
 
         ret = {}
         for value in self.__dict__.values():
-            try:
+            if isinstance(value, AbstractParameter):
                 ret.update({value.name: value.value})
-            except AttributeError:
-                pass
         return ret
 
     def execute(self):
@@ -315,6 +359,78 @@ class OcgOperations(AbstractOcgisObject):
     def _get_object_(self, name):
         return object.__getattribute__(self, name)
 
+    def _get_memory_plan_(self):
+        ret = Dict()
+        ret['tiled'] = False
+        ret['tile_budget'] = None
+        if self.memory_limit is None or self.regrid_destination is not None:
+            ret['memory_limit'] = None if self.memory_limit is None else float(self.memory_limit) * 1024.0
+            ret['working_set'] = None
+            if self.memory_limit is None:
+                ret['description'] = 'No memory limit set. Fields are not tiled.'
+            else:
+                # The base request size is not available with a regrid destination.
+                ret['description'] = 'Working set not estimated with a regrid destination. Fields are not tiled.'
+            return ret
+
+        if self.calc is None:
+            ncalc = 0
+        elif CalculationEngine._check_calculation_members_(self.calc, AbstractMultivariateFunction):
+            ncalc = len(self.calc)
+        else:
+            ncalc = None
+        float_nbytes = np.dtype(env.NP_FLOAT).itemsize
+        int_nbytes = np.dtype(env.NP_INT).itemsize
+
+        ops_size = deepcopy(self)
+        subset = OperationsEngine(ops_size, request_base_size_only=True)
+        for coll in subset:
+            for field in coll.iter_fields():
+                data_variables = field.data_variables
+                # Calculations on grouped time values reduce the time dimension to the number of groups.
+                time_dimension = None
+                ngroups = None
+                if self.calc_grouping is not None and field.temporal is not None:
+                    time_dimension = field.temporal.dimensions[0]
+                    ngroups = field.temporal.get_grouping(deepcopy(self.calc_grouping)).shape[0]
+
+                raw = 0.0
+                calc = 0.0
+                sample_size = 0.0
+                for dv in data_variables:
+                    # Add a byte for the mask.
+                    raw += dv.size * (np.dtype(dv.dtype).itemsize + 1)
+                    if time_dimension is not None and time_dimension.name in dv.dimension_names:
+                        nelements = dv.size // max(len(time_dimension), 1) * ngroups
+                    else:
+                        nelements = dv.size
+                    # Univariate calculations are applied to each data variable. Multivariate calculation outputs are
+                    # shared by the data variables.
+                    nfill = len(self.calc) if ncalc is None else ncalc / float(max(len(data_variables), 1))
+                    calc += nfill * nelements * (float_nbytes + 1)
+                    if self.calc_sample_size:
+                        sample_size += nfill * nelements * int_nbytes
+
+                curr = {'raw': raw / 1024.0, 'calc': calc / 1024.0, 'sample_size': sample_size / 1024.0}
+                curr['total'] = curr['raw'] + curr['calc'] + curr['sample_size']
+                previous = ret.field[field.name]
+                if not previous or previous['total'] < curr['total']:
+                    ret.field[field.name] = curr
+
+        ret['memory_limit'] = float(self.memory_limit) * 1024.0
+        ret['working_set'] = max([v['total'] for v in ret.field.values()] or [0.0])
+        msg = 'Estimated working set of {0:.1f} KB'.format(ret['working_set'])
+        if ret['working_set'] > ret['memory_limit']:
+            ret['tiled'] = True
+            ret['tile_budget'] = ret['memory_limit'] / (1 + env.OPERATIONS_PREFETCH_DEPTH)
+            msg += ' exceeds the memory limit of {0:.1f} KB. Fields are tiled spatially with a budget of {1:.1f} KB ' \
+                   'for each tile.'.format(ret['memory_limit'], ret['tile_budget'])
+        else:
+            msg += ' is within the memory limit of {0:.1f} KB. Fields are not tiled.'.format(ret['memory_limit'])
+        ret['description'] = msg
+
+        return ret
+
     def _update_dependents_(self):
         # the select_ugid parameter must always connect to the geometry selection
         geom = self._get_object_(Geom.name)
@@ -346,6 +462,13 @@ class OcgOperations(AbstractOcgisObject):
                 msg = 'Regridding not allowed with spatial "clip" operation.'
                 raise DefinitionValidationError(SpatialOperation, msg)
 
+        # The process pool backend is an alternative to MPI and does not run regridding in its workers.
+        if self.backend == 'process':
+            if vm.size > 1:
+                _raise_('The "process" backend may not be used in parallel with MPI.', obj=Backend)
+            if self.regrid_destination is not None:
+                _raise_('Regridding is not supported by the "process" backend.', obj=Backend)
+
         # Collect unique coordinate systems. None is returned if one is not parsable.
         projections = []
         for element in dataset:
@@ -1,19 +1,30 @@
 import logging
+import multiprocessing
+import threading
+import time
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
 
+import numpy as np
+from six.moves.queue import Queue, Full
 from ocgis import env, constants
 from ocgis import vm
 from ocgis.base import raise_if_empty, AbstractOcgisObject
 from ocgis.calc.engine import CalculationEngine
+from ocgis.calc.tile import get_tile_schema, get_tile_shape, get_aligned_tile_dimension
 from ocgis.collection.field import Field
 from ocgis.collection.spatial import SpatialCollection
 from ocgis.constants import WrappedState, HeaderName, WrapAction, SubcommName, KeywordArgument
 from ocgis.exc import ExtentError, EmptySubsetError, BoundsAlreadyAvailableError, SubcommNotFoundError, \
     NoDataVariablesFound, WrappedStateEvalTargetMissing
-from ocgis.spatial.spatial_subset import SpatialSubsetOperation
+from ocgis.spatial.geom_cabinet import GEOM_SELECTION_CACHE, update_selection_crs
+from ocgis.spatial.grid import Grid
+from ocgis.spatial.spatial_subset import SpatialSubsetOperation, GridSubsetIndex
 from ocgis.util.helpers import get_default_or_apply
 from ocgis.util.logging_ocgis import ocgis_lh, ProgressOcgOperations
-from ocgis.variable.base import create_typed_variable_from_data_model
+from ocgis.variable.base import create_typed_variable_from_data_model, get_dimension_chunk_sizes
 from ocgis.variable.crs import CFRotatedPole, Spherical, WGS84
 
 
@@ -29,6 +40,9 @@ class OperationsEngine(AbstractOcgisObject):
     :type progress: :class:`~ocgis.util.logging_ocgis.ProgressOcgOperations`
     """
 
+    #: If ``False``, collections are never read ahead by a background thread.
+    _allow_prefetch = True
+
     def __init__(self, ops, request_base_size_only=False, progress=None):
         self.ops = ops
         self._request_base_size_only = request_base_size_only
@@ -36,6 +50,10 @@ class OperationsEngine(AbstractOcgisObject):
         self._progress = progress or ProgressOcgOperations()
         self._original_subcomm = deepcopy(vm.current_comm_name)
         self._backtransform = {}
+        # Out-of-core tiling options. None if operations are not tiled.
+        self._tiling = self._get_tiling_()
+        # Seconds spent in each operations stage. See :class:`~ocgis.constants.OperationsStage`.
+        self.stage_timing = OrderedDict([(stage, 0.0) for stage in constants.OPERATIONS_STAGES])
 
         # Create the calculation engine is calculations are present.
         if self.ops.calc is None or self._request_base_size_only:
@@ -54,26 +72,36 @@ class OperationsEngine(AbstractOcgisObject):
         """:rtype: :class:`ocgis.collection.base.AbstractCollection`"""
         ocgis_lh('beginning iteration', logger='conv.__iter__', level=logging.DEBUG)
 
+        for stage in self.stage_timing:
+            self.stage_timing[stage] = 0.0
+
+        # With prefetching, a background thread subsets, calculates, and loads the next collections while the current
+        # collection is converted. Virtual machine state is shared by the threads so only serial runs are pipelined.
+        prefetch_depth = env.OPERATIONS_PREFETCH_DEPTH
+        if prefetch_depth > 0 and vm.size == 1 and self._allow_prefetch:
+            itr = self._iter_prefetched_collections_(prefetch_depth)
+        else:
+            itr = self._iter_collections_()
+
         # Yields collections with all operations applied.
         try:
-            for coll in self._iter_collections_():
+            for coll in itr:
                 ocgis_lh('__iter__ yielding', self._subset_log, level=logging.DEBUG)
-                yield coll
+                # Time spent by the consumer before requesting the next collection is conversion time.
+                with self._stage_timer_(constants.OperationsStage.CONVERT):
+                    yield coll
         finally:
-            # Try and remove any subcommunicators associated with operations.
-            for v in SubcommName.__members__.values():
-                try:
-                    vm.free_subcomm(name=v)
-                except SubcommNotFoundError:
-                    pass
-            vm.set_comm(self._original_subcomm)
-
-            # Remove any back transformations.
-            for v in constants.BackTransform.__members__.values():
-                self._backtransform.pop(v, None)
+            itr.close()
+            self._reset_()
+            msg = 'Stage timing (seconds): {0}'.format(
+                ', '.join(['{0}={1:.3f}'.format(k, v) for k, v in self.stage_timing.items()]))
+            ocgis_lh(msg=msg, logger=self._subset_log)
 
-    def _iter_collections_(self):
-        """:rtype: :class:`ocgis.collection.base.AbstractCollection`"""
+    def _get_request_dataset_groups_(self):
+        """
+        :returns: Sequence of request dataset sequences. Each element is processed as a single subsettable.
+        :rtype: list
+        """
 
         # Multivariate calculations require datasets come in as a list with all variable inputs part of the same
         # sequence.
@@ -82,6 +110,166 @@ class OperationsEngine(AbstractOcgisObject):
         # Otherwise, process geometries expects a single element sequence.
         else:
             itr_rd = [[rd] for rd in self.ops.dataset]
+        return itr_rd
+
+    def _get_selection_geometries_(self):
+        """
+        :returns: An iterator yielding selection geometry fields or ``None`` if there is no spatial selection.
+        :rtype: [None] or [:class:`~ocgis.Field`, ...]
+        """
+
+        # Set iterator based on presence of slice. Slice always overrides geometry.
+        if self.ops.slice is not None:
+            itr = [None]
+        else:
+            itr = [None] if self.ops.geom is None else self.ops.geom
+        return itr
+
+    def _iter_collections_(self):
+        """:rtype: :class:`ocgis.collection.base.AbstractCollection`"""
+
+        itr_rd = self._get_request_dataset_groups_()
+        self._log_introduction_(itr_rd)
+
+        # Process the incoming datasets. Convert from request datasets to fields as needed.
+        for rds in itr_rd:
+            self._log_processing_(rds)
+            for coll in self._iter_timed_(self._process_subsettables_(rds), constants.OperationsStage.SUBSET):
+                for coll in self._iter_calculated_collections_(coll):
+                    # Conversion of groups.
+                    if self.ops.output_grouping is not None:
+                        raise NotImplementedError
+                    else:
+                        ocgis_lh('_iter_collections_ yielding', self._subset_log, level=logging.DEBUG)
+                        yield coll
+
+    def _iter_calculated_collections_(self, coll):
+        """
+        Apply calculations to a spatially subsetted collection. If tiling is enabled, the collection's field is split
+        into spatial tiles. Tiles are sliced from the subsetted field and read from source only when calculated or
+        converted.
+
+        :param coll: The spatially subsetted collection.
+        :type coll: :class:`~ocgis.SpatialCollection`
+        :rtype: :class:`~ocgis.SpatialCollection`
+        """
+
+        windows = self._get_tile_windows_(coll)
+        if windows is None:
+            if self._tiling is not None:
+                self._conform_units_(coll)
+            with self._stage_timer_(constants.OperationsStage.CALCULATE):
+                coll = self._get_calculated_collection_(coll)
+            yield coll
+            return
+
+        field, container = next(coll.iter_fields(yield_container=True))
+        shape = field.grid.shape
+        names = field.grid.dimension_names
+        msg = 'Tiling field with shape {0} into {1} tile(s) with shape {2}.'.format(
+            shape, len(windows), tuple(s.stop - s.start for s in windows[0]))
+        ocgis_lh(msg=msg, logger=self._subset_log)
+
+        # Progress is marked as a fraction of the field's operations for each tile.
+        progress_start = self._progress.n_completed_operations
+        progress_count = max(self._progress.n_calculations, 1)
+        for idx, window in enumerate(windows):
+            tile = field.grid[window].parent
+            tile_coll = self._get_initialized_collection_()
+            tile_coll.add_field(tile, container)
+            self._conform_units_(tile_coll)
+            with self._stage_timer_(constants.OperationsStage.CALCULATE):
+                tile_coll = self._get_calculated_collection_(tile_coll, mark_progress=False)
+
+            # Locate the tile inside the untiled field. Converters use the bounds to write tiles to their position in
+            # the destination.
+            for tile_field in tile_coll.iter_fields():
+                tile_field.is_tile = True
+                for name, slc, size in zip(names, window, shape):
+                    dimension = tile_field.dimensions.get(name)
+                    if dimension is not None:
+                        dimension.bounds_global = (0, size)
+                        dimension.bounds_local = (slc.start, slc.stop)
+
+            self._progress.n_completed_operations = progress_start + progress_count * (idx + 1) / float(len(windows))
+            yield tile_coll
+
+    def _iter_prefetched_collections_(self, depth):
+        """
+        Yield collections produced by a background thread. The thread loads variable values from source so reads for
+        the next collections overlap conversion of the current collection.
+
+        :param int depth: The maximum number of loaded collections waiting for conversion.
+        :rtype: :class:`ocgis.collection.base.AbstractCollection`
+        """
+
+        buffered = Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def _put_(item):
+            # Return False if the consumer stopped before the item could be queued.
+            while not stop.is_set():
+                try:
+                    buffered.put(item, timeout=0.1)
+                except Full:
+                    continue
+                else:
+                    return True
+            return False
+
+        def _produce_():
+            itr = self._iter_collections_()
+            try:
+                for coll in itr:
+                    with self._stage_timer_(constants.OperationsStage.LOAD):
+                        _load_collection_(coll)
+                    if not _put_((coll, None)):
+                        return
+                _put_((_PREFETCH_DONE, None))
+            except BaseException as e:
+                _put_((None, e))
+            finally:
+                itr.close()
+
+        producer = threading.Thread(target=_produce_, name='ocgis-prefetch')
+        producer.daemon = True
+        producer.start()
+        try:
+            while True:
+                with self._stage_timer_(constants.OperationsStage.WAIT):
+                    coll, e = buffered.get()
+                if e is not None:
+                    raise e
+                if coll is _PREFETCH_DONE:
+                    break
+                yield coll
+        finally:
+            stop.set()
+            producer.join()
+
+    def _iter_timed_(self, itr, stage):
+        """
+        Yield from an iterator adding the time spent producing each element to a stage's timing.
+
+        :param itr: The iterator to time.
+        :param str stage: The stage name. See :class:`~ocgis.constants.OperationsStage`.
+        """
+
+        itr = iter(itr)
+        while True:
+            with self._stage_timer_(stage):
+                try:
+                    element = next(itr)
+                except StopIteration:
+                    return
+            yield element
+
+    def _log_introduction_(self, itr_rd):
+        """
+        Configure the progress object and log a summary of the operations.
+
+        :param list itr_rd: The request dataset groups to process.
+        """
 
         # Configure the progress object.
         self._progress.n_subsettables = len(itr_rd)
@@ -104,61 +292,112 @@ class OperationsEngine(AbstractOcgisObject):
                 format(', '.join([_['func'] for _ in self.ops.calc]))
         ocgis_lh(msg=msg, logger=self._subset_log)
 
-        # Process the incoming datasets. Convert from request datasets to fields as needed.
-        for rds in itr_rd:
+    def _log_processing_(self, rds):
+        """
+        :param rds: Sequence of :class:~`ocgis.RequestDataset` objects about to be processed.
+        :type rds: sequence
+        """
 
+        try:
+            msg = 'Processing URI(s): {0}'.format([rd.uri for rd in rds])
+        except AttributeError:
+            # Field objects have no URIs. Multivariate calculations change how the request dataset iterator is
+            # configured as well.
+            msg = []
+            for rd in rds:
+                try:
+                    msg.append(rd.uri)
+                except AttributeError:
+                    # Likely a field object which does have a name.
+                    msg.append(rd.name)
+            msg = 'Processing URI(s) / field names: {0}'.format(msg)
+        ocgis_lh(msg=msg, logger=self._subset_log)
+
+    @contextmanager
+    def _stage_timer_(self, stage):
+        """
+        Add the time spent in the context to a stage's timing.
+
+        :param str stage: The stage name. See :class:`~ocgis.constants.OperationsStage`.
+        """
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.stage_timing[stage] += time.time() - start
+
+    def _reset_(self):
+        """Remove subcommunicators and back transformations created while processing."""
+
+        # Try and remove any subcommunicators associated with operations.
+        for v in SubcommName.__members__.values():
             try:
-                msg = 'Processing URI(s): {0}'.format([rd.uri for rd in rds])
-            except AttributeError:
-                # Field objects have no URIs. Multivariate calculations change how the request dataset iterator is
-                # configured as well.
-                msg = []
-                for rd in rds:
-                    try:
-                        msg.append(rd.uri)
-                    except AttributeError:
-                        # Likely a field object which does have a name.
-                        msg.append(rd.name)
-                msg = 'Processing URI(s) / field names: {0}'.format(msg)
-            ocgis_lh(msg=msg, logger=self._subset_log)
+                vm.free_subcomm(name=v)
+            except SubcommNotFoundError:
+                pass
+        vm.set_comm(self._original_subcomm)
 
-            for coll in self._process_subsettables_(rds):
-                # If there are calculations, do those now and return a collection.
-                if not vm.is_null and self.cengine is not None:
-                    ocgis_lh('Starting calculations.', self._subset_log)
-                    raise_if_empty(coll)
+        # Remove any back transformations.
+        for v in constants.BackTransform.__members__.values():
+            self._backtransform.pop(v, None)
 
-                    # Look for any temporal grouping optimizations.
-                    if self.ops.optimizations is None:
-                        tgds = None
-                    else:
-                        tgds = self.ops.optimizations.get('tgds')
-
-                    # Execute the calculations.
-                    coll = self.cengine.execute(coll, file_only=self.ops.file_only, tgds=tgds)
-
-                    # If we need to spatially aggregate and calculations used raw values, update the collection
-                    # fields and subset geometries.
-                    if self.ops.aggregate and self.ops.calc_raw:
-                        coll_to_itr = coll.copy()
-                        for sfield, container in coll_to_itr.iter_fields(yield_container=True):
-                            sfield = _update_aggregation_wrapping_crs_(self, None, sfield, container, None)
-                            coll.add_field(sfield, container, force=True)
-                else:
-                    # If there are no calculations, mark progress to indicate a geometry has been completed.
-                    self._progress.mark()
+    def _get_calculated_collection_(self, coll, mark_progress=True):
+        """
+        :param coll: The spatially subsetted collection.
+        :type coll: :class:`~ocgis.SpatialCollection`
+        :param bool mark_progress: If ``False``, do not mark progress for the collection.
+        :returns: The collection with any calculations applied.
+        :rtype: :class:`~ocgis.SpatialCollection`
+        """
 
-                # Conversion of groups.
-                if self.ops.output_grouping is not None:
-                    raise NotImplementedError
-                else:
-                    ocgis_lh('_iter_collections_ yielding', self._subset_log, level=logging.DEBUG)
-                    yield coll
+        # If there are calculations, do those now and return a collection.
+        if not vm.is_null and self.cengine is not None:
+            ocgis_lh('Starting calculations.', self._subset_log)
+            raise_if_empty(coll)
 
-    def _process_subsettables_(self, rds):
+            # Look for any temporal grouping optimizations.
+            if self.ops.optimizations is None:
+                tgds = None
+            else:
+                tgds = self.ops.optimizations.get('tgds')
+
+            # Execute the calculations.
+            coll = self.cengine.execute(coll, file_only=self.ops.file_only, tgds=tgds, mark_progress=mark_progress)
+
+            # If we need to spatially aggregate and calculations used raw values, update the collection fields and
+            # subset geometries.
+            if self.ops.aggregate and self.ops.calc_raw:
+                coll_to_itr = coll.copy()
+                for sfield, container in coll_to_itr.iter_fields(yield_container=True):
+                    sfield = _update_aggregation_wrapping_crs_(self, None, sfield, container, None)
+                    coll.add_field(sfield, container, force=True)
+        elif mark_progress:
+            # If there are no calculations, mark progress to indicate a geometry has been completed.
+            self._progress.mark()
+
+        return coll
+
+    def _conform_units_(self, coll):
+        """
+        Conform data variable units in-place if requested by the operations.
+
+        :param coll: The collection to conform.
+        :type coll: :class:`~ocgis.SpatialCollection`
+        """
+
+        if not vm.is_null and self.ops.conform_units_to is not None:
+            for to_conform in coll.iter_fields():
+                for dv in to_conform.data_variables:
+                    dv.cfunits_conform(self.ops.conform_units_to)
+
+    def _process_subsettables_(self, rds, geoms=None):
         """
         :param rds: Sequence of :class:~`ocgis.RequestDataset` objects.
         :type rds: sequence
+        :param geoms: The selection geometries to process. If ``None``, use the selection geometries from the
+         operations.
+        :type geoms: [None] or [:class:`~ocgis.Field`, ...]
         :rtype: :class:`ocgis.collection.base.AbstractCollection`
         """
 
@@ -269,18 +508,12 @@ class OperationsEngine(AbstractOcgisObject):
                 ocgis_lh(exc=ExtentError(message=str(e)), alias=str([rd.field_name for rd in rds]),
                          logger=self._subset_log)
 
-        # Set iterator based on presence of slice. Slice always overrides geometry.
-        if self.ops.slice is not None:
-            itr = [None]
-        else:
-            itr = [None] if self.ops.geom is None else self.ops.geom
+        itr = self._get_selection_geometries_() if geoms is None else geoms
 
         for coll in self._process_geometries_(itr, field, alias):
-            # Conform units following the spatial subset.
-            if not vm.is_null and self.ops.conform_units_to is not None:
-                for to_conform in coll.iter_fields():
-                    for dv in to_conform.data_variables:
-                        dv.cfunits_conform(self.ops.conform_units_to)
+            # Conform units following the spatial subset. Tiled operations conform units for each tile.
+            if self._tiling is None:
+                self._conform_units_(coll)
             ocgis_lh(msg='_process_subsettables_ yielding', logger=self._subset_log, level=logging.DEBUG)
             yield coll
 
@@ -296,6 +529,8 @@ class OperationsEngine(AbstractOcgisObject):
         assert isinstance(field, Field)
 
         ocgis_lh('processing geometries', self._subset_log, level=logging.DEBUG)
+        # The grid subset index is built once for each target field and shared by all selection geometries.
+        grid_index_field, grid_index = None, None
         # Process each geometry.
         for subset_field in itr:
 
@@ -336,7 +571,11 @@ class OperationsEngine(AbstractOcgisObject):
                 if subset_field is not None:
                     # If the coordinate systems differ, update the spatial subset's CRS to match the field.
                     if subset_field.crs is not None and subset_field.crs != field.crs:
-                        subset_field.update_crs(field.crs)
+                        if subset_field.grid is None:
+                            # Transformed selection geometries are reused across operations.
+                            update_selection_crs(subset_field.geom, field.crs)
+                        else:
+                            subset_field.update_crs(field.crs)
                     # If the geometry is a point, it needs to be buffered if there is a search radius multiplier.
                     subset_field = self._get_buffered_subset_geometry_if_point_(field, subset_field)
 
@@ -345,7 +584,10 @@ class OperationsEngine(AbstractOcgisObject):
                 if subset_field is None:
                     sfield = field
                 else:
-                    sfield = self._get_spatially_subsetted_field_(alias, field, subset_field, subset_ugid)
+                    if grid_index_field is not field:
+                        grid_index_field, grid_index = field, self._get_grid_subset_index_(field)
+                    sfield = self._get_spatially_subsetted_field_(alias, field, subset_field, subset_ugid,
+                                                                  grid_index=grid_index)
 
                 ocgis_lh(msg='after self._get_spatially_subsetted_field_', logger=self._subset_log, level=logging.DEBUG)
 
@@ -384,6 +626,9 @@ class OperationsEngine(AbstractOcgisObject):
 
             yield coll
 
+        ocgis_lh('Geometry selection cache: {0}'.format(GEOM_SELECTION_CACHE.get_stats()), self._subset_log,
+                 level=logging.DEBUG)
+
     def _get_nonspatial_subset_(self, field):
         """
         
@@ -405,6 +650,85 @@ class OperationsEngine(AbstractOcgisObject):
 
         return field
 
+    def _get_tiling_(self):
+        """
+        :returns: The tiling options from the operations optimizations or the memory plan. ``None`` if operations are
+         not tiled. See :meth:`~ocgis.OcgOperations.get_memory_plan`.
+        :rtype: dict | None
+        """
+
+        optimizations = self.ops.optimizations or {}
+        tile_dimension = optimizations.get('tile_dimension')
+        tile_budget = optimizations.get('tile_budget')
+        use_memory_plan = tile_dimension is None and tile_budget is None
+        if use_memory_plan and self.ops.memory_limit is None:
+            return None
+        # Base size requests are used to create the memory plan and are never tiled.
+        if self._request_base_size_only:
+            return None
+
+        if use_memory_plan:
+            plan = self.ops.get_memory_plan()
+            ocgis_lh(msg=plan['description'], logger=self._subset_log)
+            if not plan['tiled']:
+                return None
+            # The plan's tile budget is in kilobytes.
+            tile_budget = int(plan['tile_budget'] * 1024)
+
+        # Tiles are calculated and written independently. Spatial aggregation and regridding need the whole field, and
+        # tiled collections may only be converted by output formats writing collections incrementally.
+        if vm.size > 1 or self.ops.backend != 'ocg':
+            reason = 'parallel operations'
+        elif self.ops.aggregate or self.ops.regrid_destination is not None or self.ops.file_only:
+            reason = 'spatial aggregation, regridding, or file only operations'
+        elif self.ops.output_format not in constants.TILED_OUTPUT_FORMATS:
+            reason = 'output format "{0}"'.format(self.ops.output_format)
+        else:
+            reason = None
+        if reason is not None:
+            msg = 'Tiling is not supported with {0}. Fields will not be tiled.'.format(reason)
+            ocgis_lh(msg=msg, logger=self._subset_log, level=logging.WARN)
+            return None
+
+        return {'tile_dimension': tile_dimension, 'tile_budget': tile_budget}
+
+    def _get_tile_windows_(self, coll):
+        """
+        :param coll: The spatially subsetted collection.
+        :type coll: :class:`~ocgis.SpatialCollection`
+        :returns: Sequence of row and column slice tuples for each tile or ``None`` if the collection is not tiled.
+        :rtype: list | None
+        """
+
+        if self._tiling is None or vm.is_null:
+            return None
+        fields = list(coll.iter_fields())
+        if len(fields) != 1:
+            return None
+        field = fields[0]
+        grid = field.grid
+        if field.is_empty or not isinstance(grid, Grid) or grid.has_shared_dimension:
+            return None
+
+        shape = grid.shape
+        chunk_sizes = get_dimension_chunk_sizes(field.data_variables)
+        chunks = [chunk_sizes.get(name) for name in grid.dimension_names]
+        tile_dimension = self._tiling['tile_dimension']
+        if tile_dimension is None:
+            tile_shape = get_tile_shape(shape, get_tile_cell_nbytes(field), self._tiling['tile_budget'], chunks=chunks)
+        else:
+            try:
+                tile_shape = tuple(tile_dimension)
+            except TypeError:
+                tile_shape = (tile_dimension, tile_dimension)
+            tile_shape = [get_aligned_tile_dimension(t, c) for t, c in zip(tile_shape, chunks)]
+        if tile_shape[0] >= shape[0] and tile_shape[1] >= shape[1]:
+            return None
+
+        schema = get_tile_schema(shape[0], shape[1], tile_shape)
+        return [(slice(int(v['row'][0]), int(v['row'][1])), slice(int(v['col'][0]), int(v['col'][1])))
+                for v in schema.values()]
+
     @staticmethod
     def _get_initialized_collection_():
         coll = SpatialCollection()
@@ -471,7 +795,30 @@ class OperationsEngine(AbstractOcgisObject):
             field = field.get_field_slice(the_slice, strict=False, distributed=True)
         return field
 
-    def _get_spatially_subsetted_field_(self, alias, field, subset_field, subset_ugid):
+    def _get_grid_subset_index_(self, field):
+        """
+        Create an index over the target field's grid cells to share between selection geometries.
+
+        :param field: The target field.
+        :type field: :class:`ocgis.Field`
+        :return: The index or ``None`` if the field's grid may not be indexed. Distributed grids, rotated pole and
+         unwrapped spherical coordinate systems, and optimized bounding box subsets are not indexed.
+        :rtype: :class:`~ocgis.spatial.spatial_subset.GridSubsetIndex`
+        """
+
+        if not env.USE_SPATIAL_INDEX or not env.USE_VECTORIZED_GEOMETRY or self.ops.optimized_bbox_subset:
+            return None
+        if vm.size > 1 or not isinstance(field.grid, Grid) or field.grid.is_empty:
+            return None
+        crs = field.crs
+        if isinstance(crs, CFRotatedPole) or self._backtransform.get(constants.BackTransform.ROTATED_POLE) is not None:
+            return None
+        if isinstance(crs, Spherical) and field.wrapped_state == WrappedState.UNWRAPPED:
+            return None
+        ocgis_lh('building grid subset index', self._subset_log, level=logging.DEBUG)
+        return GridSubsetIndex(field.grid)
+
+    def _get_spatially_subsetted_field_(self, alias, field, subset_field, subset_ugid, grid_index=None):
         """
         Spatially subset a field with a selection field.
 
@@ -480,6 +827,8 @@ class OperationsEngine(AbstractOcgisObject):
         :type field: :class:`ocgis.Field`
         :param subset_field: The field to use for subsetting.
         :type subset_field: :class:`ocgis.Field`
+        :param grid_index: An optional index over the target field's grid cells.
+        :type grid_index: :class:`~ocgis.spatial.spatial_subset.GridSubsetIndex`
         :rtype: :class:`ocgis.Field`
         :raises: AssertionError, ExtentError
         """
@@ -488,7 +837,7 @@ class OperationsEngine(AbstractOcgisObject):
 
         ocgis_lh('executing spatial subset operation', self._subset_log, level=logging.DEBUG, alias=alias,
                  ugid=subset_ugid)
-        sso = SpatialSubsetOperation(field)
+        sso = SpatialSubsetOperation(field, grid_index=grid_index)
         try:
             # Execute the spatial subset and return the subsetted field.
             sfield = sso.get_spatial_subset(self.ops.spatial_operation, subset_field.geom,
@@ -570,6 +919,99 @@ class OperationsEngine(AbstractOcgisObject):
                 ocgis_lh(msg=msg, logger=self._subset_log, level=logging.WARN)
 
 
+class ProcessPoolOperationsEngine(OperationsEngine):
+    """
+    Executes the operations defined by ``ops`` using a pool of worker processes. This is the ``'process'`` backend
+    and does not require MPI. Each request dataset group and selection geometry pair is a work unit executed by a
+    worker. Collections are yielded in the same order as :class:`~ocgis.ops.engine.OperationsEngine`.
+
+    .. note:: Each work unit runs ``_process_subsettables_`` in its worker. The source field is read and rebuilt for
+     every selection geometry, so the backend favors few large selections over many small ones.
+
+    :param ops: The operations to interpret.
+    :type ops: :class:`~ocgis.OcgOperations`
+    :param int workers: The number of worker processes. If ``None``, use :attr:`ocgis.env.PROCESS_POOL_WORKERS`.
+    :param int queue_depth: The maximum number of work units submitted and not yet yielded. If ``None``, use
+     :attr:`ocgis.env.PROCESS_POOL_QUEUE_DEPTH`.
+    :param kwargs: See :class:`~ocgis.ops.engine.OperationsEngine`.
+    """
+
+    # Workers already run ahead of conversion. Workers must also be forked from the main thread. A prefetch thread may
+    # fork while the main thread holds the netCDF IO lock leaving the lock held in the workers.
+    _allow_prefetch = False
+
+    def __init__(self, ops, workers=None, queue_depth=None, **kwargs):
+        super(ProcessPoolOperationsEngine, self).__init__(ops, **kwargs)
+
+        if workers is None:
+            workers = env.PROCESS_POOL_WORKERS
+            if workers is None:
+                workers = multiprocessing.cpu_count()
+        if queue_depth is None:
+            queue_depth = env.PROCESS_POOL_QUEUE_DEPTH
+            if queue_depth is None:
+                queue_depth = 2 * workers
+        if workers < 1 or queue_depth < 1:
+            raise ValueError('The process pool must have at least one worker and a queue depth of at least one.')
+
+        self.workers = workers
+        self.queue_depth = queue_depth
+
+    def _iter_collections_(self):
+        """:rtype: :class:`ocgis.collection.base.AbstractCollection`"""
+
+        itr_rd = self._get_request_dataset_groups_()
+        self._log_introduction_(itr_rd)
+        msg = 'Processing with {0} worker process(es) and a queue depth of {1}.'.format(self.workers, self.queue_depth)
+        ocgis_lh(msg=msg, logger=self._subset_log)
+
+        # Forked workers inherit the operations without pickling. This allows callbacks and other unpicklable objects
+        # on the operations.
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+        else:
+            mp_context = None
+
+        # Futures are consumed in submission order. Limiting their number bounds the collections held in memory while
+        # the converter writes the preceding collection.
+        futures = deque()
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp_context,
+                                       initializer=_initialize_process_pool_worker_, initargs=(self.ops,))
+        try:
+            for rds_index, rds in enumerate(itr_rd):
+                self._log_processing_(rds)
+                for subset_field in self._get_selection_geometries_():
+                    if len(futures) == self.queue_depth:
+                        for coll in self._iter_completed_collections_(futures.popleft()):
+                            yield coll
+                    futures.append(executor.submit(_execute_process_pool_work_unit_, rds_index, subset_field))
+            while len(futures) > 0:
+                for coll in self._iter_completed_collections_(futures.popleft()):
+                    yield coll
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _iter_completed_collections_(self, future):
+        """
+        :param future: The future for a submitted work unit.
+        :type future: :class:`concurrent.futures.Future`
+        :rtype: :class:`~ocgis.SpatialCollection`
+        """
+
+        for coll in future.result():
+            # Workers track progress separately. Mark the operations completed by the work unit.
+            for _ in range(max(self._progress.n_calculations, 1)):
+                self._progress.mark()
+
+            if self.ops.output_grouping is not None:
+                raise NotImplementedError
+            else:
+                ocgis_lh('_iter_collections_ yielding', self._subset_log, level=logging.DEBUG)
+                yield coll
+
+
 def _update_aggregation_wrapping_crs_(obj, alias, sfield, subset_sdim, subset_ugid):
     raise_if_empty(sfield)
 
@@ -708,3 +1150,86 @@ def get_data_model(ops):
         else:
             ret = None
     return ret
+
+
+def _execute_process_pool_work_unit_(rds_index, subset_field):
+    """
+    Execute a single work unit in a process pool worker.
+
+    :param int rds_index: Index of the request dataset group to process.
+    :param subset_field: The selection geometry field. ``None`` if there is no spatial selection.
+    :type subset_field: :class:`~ocgis.Field`
+    :returns: The processed collections with all variable values loaded from source.
+    :rtype: list
+    """
+
+    engine = _PROCESS_POOL_ENGINE
+    rds = engine._get_request_dataset_groups_()[rds_index]
+    ret = []
+    try:
+        for coll in engine._process_subsettables_(rds, geoms=[subset_field]):
+            coll = engine._get_calculated_collection_(coll)
+            # Load values in the worker. Otherwise, they are read from source when the collection is converted.
+            _load_collection_(coll)
+            ret.append(coll)
+    finally:
+        engine._reset_()
+    return ret
+
+
+def _load_collection_(coll):
+    """
+    Load all variable values from source for the fields in a collection.
+
+    :param coll: The collection to load.
+    :type coll: :class:`~ocgis.SpatialCollection`
+    """
+
+    for field in coll.iter_fields():
+        field.load()
+
+
+def get_tile_cell_nbytes(field):
+    """
+    Estimate the memory needed for each grid cell when tiling a field. This includes the data variables, their masks,
+    and working copies needed by calculations. See :attr:`ocgis.constants.TILE_MEMORY_FACTOR`.
+
+    :param field: The field to tile.
+    :type field: :class:`~ocgis.Field`
+    :rtype: int
+    """
+
+    grid_names = set(field.grid.dimension_names)
+    ret = 0
+    for dv in field.data_variables:
+        try:
+            itemsize = np.dtype(dv.dtype).itemsize
+        except TypeError:
+            # Object data types hold references. Assume double precision.
+            itemsize = np.dtype(float).itemsize
+        nelements = 1
+        for dimension in dv.dimensions:
+            if dimension.name not in grid_names:
+                nelements *= len(dimension)
+        # Add a byte for the mask.
+        ret += (itemsize + 1) * nelements
+    return max(ret, 1) * constants.TILE_MEMORY_FACTOR
+
+
+def _initialize_process_pool_worker_(ops):
+    """
+    Create the operations engine used by a process pool worker.
+
+    :param ops: The operations to interpret.
+    :type ops: :class:`~ocgis.OcgOperations`
+    """
+
+    global _PROCESS_POOL_ENGINE
+    _PROCESS_POOL_ENGINE = OperationsEngine(ops)
+
+
+#: The operations engine for the current process pool worker.
+_PROCESS_POOL_ENGINE = None
+
+#: Marks the end of prefetched collections.
+_PREFETCH_DONE = object()
@@ -9,7 +9,7 @@ from ocgis import exc, env
 from ocgis.base import AbstractOcgisObject
 from ocgis.conv.base import AbstractTabularConverter
 from ocgis.conv.meta import AbstractMetaConverter
-from ocgis.ops.engine import OperationsEngine
+from ocgis.ops.engine import OperationsEngine, ProcessPoolOperationsEngine
 from ocgis.ops.parms.definition import OutputFormat
 from ocgis.util.logging_ocgis import ocgis_lh, ProgressOcgOperations
 
@@ -29,7 +29,7 @@ class Interpreter(AbstractOcgisObject):
     def get_interpreter(cls, ops):
         """Select interpreter class."""
 
-        imap = {'ocg': OcgInterpreter}
+        imap = {'ocg': OcgInterpreter, 'process': OcgInterpreter}
         try:
             return imap[ops.backend](ops)
         except KeyError:
@@ -124,7 +124,10 @@ class OcgInterpreter(Interpreter):
             else:
                 # the operations object performs subsetting and calculations
                 ocgis_lh('initializing subset', interpreter_log, level=logging.DEBUG)
-                so = OperationsEngine(self.ops, progress=progress)
+                if self.ops.backend == 'process':
+                    so = ProcessPoolOperationsEngine(self.ops, progress=progress)
+                else:
+                    so = OperationsEngine(self.ops, progress=progress)
                 # if there is no grouping on the output files, a singe converter is needed
                 if self.ops.output_grouping is None:
                     ocgis_lh('initializing converter', interpreter_log, level=logging.DEBUG)
@@ -90,11 +90,13 @@ class AggregateSelection(base.BooleanParameter):
 class Backend(base.StringOptionParameter):
     name = 'backend'
     default = 'ocg'
-    valid = ('ocg',)
+    valid = ('ocg', 'process')
 
     def _get_meta_(self):
         if self.value == 'ocg':
             ret = 'OpenClimateGIS backend used for processing.'
+        elif self.value == 'process':
+            ret = 'OpenClimateGIS backend used for processing with a pool of worker processes.'
         else:
             raise NotImplementedError
         return ret
@@ -898,6 +900,26 @@ class Melted(base.BooleanParameter):
     meta_false = 'Flat tabular iteration requested.'
 
 
+class MemoryLimit(base.AbstractParameter):
+    input_types = [int, float]
+    name = 'memory_limit'
+    nullable = True
+    return_type = [int, float]
+    default = None
+
+    def _get_meta_(self):
+        if self.value is None:
+            msg = 'No memory limit set.'
+        else:
+            msg = 'Fields were tiled spatially if the estimated working set exceeded the memory limit of {0} MB.'.format(
+                self.value)
+        return msg
+
+    def _validate_(self, value):
+        if value <= 0:
+            raise DefinitionValidationError(self, msg='must be > 0')
+
+
 class Optimizations(base.AbstractParameter):
     name = 'optimizations'
     default = None
@@ -905,7 +927,9 @@ class Optimizations(base.AbstractParameter):
     nullable = True
     return_type = [dict]
     # : 'tgds' - dictionary mapping field aliases to TemporalGroupDimension objects
-    _allowed_keys = ['tgds', 'fields']
+    # : 'tile_dimension' - row and column tile dimensions (or a single integer) used to tile fields out-of-core
+    # : 'tile_budget' - maximum bytes for a tile when tiling fields out-of-core
+    _allowed_keys = ['tgds', 'fields', 'tile_dimension', 'tile_budget']
     _perform_deepcopy = False
 
     def _get_meta_(self):
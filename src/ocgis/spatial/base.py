@@ -4,7 +4,15 @@ from abc import abstractmethod
 
 import numpy as np
 import six
-from pyproj import Proj, transform
+from pyproj import Proj
+
+try:
+    from pyproj import Transformer
+except ImportError:
+    # Transformer objects are available with pyproj >= 2.1.
+    from pyproj import transform
+
+    Transformer = None
 from shapely.geometry import box
 
 from ocgis import Variable, SourcedVariable, vm
@@ -581,28 +589,21 @@ class AbstractXYZSpatialContainer(AbstractSpatialContainer):
         elif isinstance(to_crs, crs.CFRotatedPole):
             to_crs.update_with_rotated_pole_transformation(self, inverse=True)
         else:
-            src_proj4 = from_crs.proj4
-            dst_proj4 = to_crs.proj4
-
-            src_proj4 = Proj(src_proj4)
-            dst_proj4 = Proj(dst_proj4)
-
-            y = self.y
-            x = self.x
-
-            value_row = self.y.get_value().reshape(-1)
-            value_col = self.x.get_value().reshape(-1)
-            tvalue_col, tvalue_row = transform(src_proj4, dst_proj4, value_col, value_row)
+            # Transform the coordinate and bounds values directly in a single call. No geometry objects are created.
+            pairs = [(self.x, self.y)]
+            if self.has_bounds:
+                pairs.append((self.x.bounds, self.y.bounds))
+            value_col = np.concatenate([x.get_value().reshape(-1) for x, _ in pairs])
+            value_row = np.concatenate([y.get_value().reshape(-1) for _, y in pairs])
 
-            self.x.set_value(tvalue_col.reshape(self.shape))
-            self.y.set_value(tvalue_row.reshape(self.shape))
+            tvalue_col, tvalue_row = get_transformed_coordinates(from_crs.proj4, to_crs.proj4, value_col, value_row)
 
-            if self.has_bounds:
-                corner_row = y.bounds.get_value().reshape(-1)
-                corner_col = x.bounds.get_value().reshape(-1)
-                tvalue_col, tvalue_row = transform(src_proj4, dst_proj4, corner_col, corner_row)
-                y.bounds.set_value(tvalue_row.reshape(y.bounds.shape))
-                x.bounds.set_value(tvalue_col.reshape(x.bounds.shape))
+            start = 0
+            for x, y in pairs:
+                stop = start + x.get_value().size
+                x.set_value(tvalue_col[start:stop].reshape(x.shape))
+                y.set_value(tvalue_row[start:stop].reshape(y.shape))
+                start = stop
 
         self.crs = to_crs
 
@@ -747,6 +748,29 @@ def get_extent_global(container):
     return ret
 
 
+def get_transformed_coordinates(src_proj4, dst_proj4, x, y):
+    """
+    Transform coordinate vectors to a destination coordinate system using a single vectorized call.
+
+    :param str src_proj4: The PROJ.4 string for the source coordinate system.
+    :param str dst_proj4: The PROJ.4 string for the destination coordinate system.
+    :param x: Vector of x-coordinate values.
+    :type x: :class:`numpy.ndarray`
+    :param y: Vector of y-coordinate values.
+    :type y: :class:`numpy.ndarray`
+    :return: The transformed x- and y-coordinate vectors.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    src_proj = Proj(src_proj4)
+    dst_proj = Proj(dst_proj4)
+    if Transformer is None:
+        ret = transform(src_proj, dst_proj, x, y)
+    else:
+        ret = Transformer.from_proj(src_proj, dst_proj).transform(x, y)
+    return ret
+
+
 def iter_spatial_decomposition(sobj, splits, **kwargs):
     """
     Yield spatial subsets of the target ``sobj`` defined by the spatial decomposition created from ``splits``.
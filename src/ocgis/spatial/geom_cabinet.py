@@ -1,13 +1,19 @@
+import hashlib
+import logging
 import os
 from collections import OrderedDict
+from copy import deepcopy
 
 import fiona
+import numpy as np
+import shapely
 from osgeo import ogr
 from ocgis import env
 from ocgis.collection.field import Field
 from ocgis.util.helpers import get_formatted_slice
 from ocgis.util.logging_ocgis import ocgis_lh
 from shapely import wkb
+from shapely.geometry import box, shape
 
 
 class GeomCabinet(object):
@@ -95,9 +101,27 @@ class GeomCabinet(object):
             msg = 'a shapefile with key "{0}" was not found under the directory: {1}'.format(key, self.path)
             raise ValueError(msg)
 
+    def get_index(self, key=None, path=None, uid=None, driver_kwargs=None):
+        """
+        Get the persistent feature index for a data source. The index is built on first access and stored in
+        :attr:`ocgis.env.DIR_GEOMCABINET_INDEX` or next to the data source.
+
+        :param str key: See :class:`~ocgis.GeomCabinetIterator`.
+        :param str path: See :class:`~ocgis.GeomCabinetIterator`.
+        :param str uid: See :class:`~ocgis.GeomCabinetIterator`.
+        :param dict driver_kwargs: See :class:`~ocgis.GeomCabinetIterator`.
+        :rtype: :class:`~ocgis.spatial.geom_cabinet.GeomCabinetIndex`
+        """
+        shp_path = self._get_path_by_key_or_direct_path_(key=key, path=path)
+        if self.get_gdal_driver(shp_path) == 'OpenFileGDB':
+            layer = driver_kwargs['feature_class']
+        else:
+            layer = None
+        return GeomCabinetIndex(shp_path, uid=uid, layer=layer, directory=env.DIR_GEOMCABINET_INDEX)
+
     def iter_geoms(self, key=None, select_uid=None, path=None, load_geoms=True, as_field=False,
                    uid=None, select_sql_where=None, slc=None, union=False, data_model=None,
-                   driver_kwargs=None):
+                   driver_kwargs=None, bbox=None):
         """
         See documentation for :class:`~ocgis.GeomCabinetIterator`.
         """
@@ -105,17 +129,16 @@ class GeomCabinet(object):
         # Get the path to the output shapefile.
         shp_path = self._get_path_by_key_or_direct_path_(key=key, path=path)
 
-        # Get the source metadata.
-        meta = self.get_meta(path=shp_path, driver_kwargs=driver_kwargs)
-
         if union:
+            # Get the source metadata.
+            meta = self.get_meta(path=shp_path, driver_kwargs=driver_kwargs)
             gic = GeomCabinetIterator(key=key, select_uid=select_uid, path=path, load_geoms=load_geoms, as_field=False,
                                       uid=uid, select_sql_where=select_sql_where, slc=slc, union=False,
-                                      data_model=data_model, driver_kwargs=driver_kwargs)
+                                      data_model=data_model, driver_kwargs=driver_kwargs, bbox=bbox)
             yld = Field.from_records(gic, meta['schema'], crs=meta['crs'], uid=uid, union=True, data_model=data_model)
             yield yld
         else:
-            if slc is not None and (select_uid is not None or select_sql_where is not None):
+            if slc is not None and (select_uid is not None or select_sql_where is not None or bbox is not None):
                 exc = ValueError('Slice is not allowed with other select statements.')
                 ocgis_lh(exc=exc, logger='geom_cabinet')
 
@@ -123,15 +146,47 @@ class GeomCabinet(object):
             if slc is not None:
                 slc = get_index_slice_for_iteration(slc)
 
+            # Records for a repeated selection are retrieved from the geometry selection cache without reading the
+            # data source. Full layer scans and slices are not cached as they may hold every record of the layer.
+            is_selection = select_uid is not None or select_sql_where is not None or bbox is not None
+            if load_geoms and is_selection and GEOM_SELECTION_CACHE.maxsize > 0:
+                cache_key = get_records_cache_key(shp_path, select_uid, select_sql_where, uid, driver_kwargs, bbox)
+                cached = GEOM_SELECTION_CACHE.get(cache_key)
+            else:
+                cache_key = None
+                cached = None
+            if cached is not None:
+                for yld in iter_cached_records(cached, as_field=as_field, data_model=data_model):
+                    yield yld
+                return
+            cached_wkb = []
+            cached_properties = []
+
+            # Get the source metadata.
+            meta = self.get_meta(path=shp_path, driver_kwargs=driver_kwargs)
+
+            # Use the persistent feature index to find the selected features without a layer scan.
+            if get_should_use_index(select_uid, select_sql_where, bbox):
+                fids = self.get_index(path=shp_path, uid=uid, driver_kwargs=driver_kwargs).get_fids(
+                    select_uid=select_uid, bbox=bbox)
+            else:
+                fids = None
+
             # Open the target geometry file.
             ds = ogr.Open(shp_path)
             try:
                 # Return the features iterator.
-                features = self._get_features_object_(ds, uid=uid, select_uid=select_uid,
-                                                      select_sql_where=select_sql_where, driver_kwargs=driver_kwargs)
+                if fids is None:
+                    features = self._get_features_object_(ds, uid=uid, select_uid=select_uid,
+                                                          select_sql_where=select_sql_where,
+                                                          driver_kwargs=driver_kwargs, bbox=bbox)
+                else:
+                    features = self._get_features_object_(ds, driver_kwargs=driver_kwargs)
 
                 # Using slicing, we will select the features individually from the object.
-                if slc is None:
+                if fids is not None:
+                    itr = (features.GetFeature(int(fid)) for fid in fids)
+                elif slc is None:
                     itr = features
                 else:
                     # The geodatabase API requires iterations to get the given location.
@@ -154,7 +209,8 @@ class GeomCabinet(object):
                 # Convert feature objects to record dictionaries.
                 for ctr, feature in enumerate(itr):
                     if load_geoms:
-                        yld = {'geom': wkb.loads(feature.geometry().ExportToWkb())}
+                        geom_wkb = bytes(feature.geometry().ExportToWkb())
+                        yld = {'geom': wkb.loads(geom_wkb)}
                     else:
                         yld = {}
                     items = feature.items()
@@ -174,6 +230,10 @@ class GeomCabinet(object):
                     else:
                         properties[uid] = int(properties[uid])
 
+                    if cache_key is not None:
+                        cached_wkb.append(geom_wkb)
+                        cached_properties.append(OrderedDict(properties))
+
                     if as_field:
                         yld = Field.from_records([yld], schema=meta['schema'], crs=yld['meta']['crs'], uid=uid,
                                                  data_model=data_model)
@@ -185,6 +245,10 @@ class GeomCabinet(object):
                     # occurs if there were not feature returned by the iterator. raise a more clear exception.
                     msg = 'No features returned from target data source. Were features appropriately selected?'
                     raise ValueError(msg)
+
+                if cache_key is not None:
+                    GEOM_SELECTION_CACHE.set(cache_key, (deepcopy(meta), uid, tuple(cached_wkb),
+                                                         tuple(cached_properties)))
             finally:
                 # Close or destroy the data source object if it actually exists.
                 if ds is not None:
@@ -212,7 +276,7 @@ class GeomCabinet(object):
         return shp_path
 
     @staticmethod
-    def _get_features_object_(ds, uid=None, select_uid=None, select_sql_where=None, driver_kwargs=None):
+    def _get_features_object_(ds, uid=None, select_uid=None, select_sql_where=None, driver_kwargs=None, bbox=None):
         """
         :param ds: Open OGR data source object
         :type ds: :class:`osgeo.ogr.DataSource`
@@ -224,6 +288,7 @@ class GeomCabinet(object):
         >>> select_sql_where = 'STATE_NAME = "Wisconsin"'
 
         :param dict driver_kwargs: GDAL driver-specific arguments.
+        :param sequence bbox: If provided, only features with bounding boxes intersecting ``bbox`` are returned.
 
         +-------------+----------------------+--------------------------------------+
         | Driver      | Key                  | Value                                |
@@ -272,6 +337,8 @@ class GeomCabinet(object):
             features = ds.ExecuteSQL(sql)
         else:
             features = lyr
+        if bbox is not None:
+            features.SetSpatialFilterRect(*bbox)
         return features
 
 
@@ -321,12 +388,20 @@ class GeomCabinetIterator(object):
     >>> data_model = 'NETCDF3'
 
     :param dict driver_kwargs: Format specific keyword arguments to use for driver creation.
+    :param bbox: Select features with bounding boxes intersecting this bounding box.
+
+    >>> bbox = [-104.0, 38.0, -102.0, 40.0]
+
+    :type bbox: sequence
     :raises: ValueError, RuntimeError
     :rtype: dict
+
+    If :attr:`ocgis.env.USE_GEOMCABINET_INDEX` is ``True``, ``select_uid`` and ``bbox`` selections use a persistent
+    feature index (see :class:`~ocgis.spatial.geom_cabinet.GeomCabinetIndex`).
     """
 
     def __init__(self, key=None, select_uid=None, path=None, load_geoms=True, as_field=False, uid=None,
-                 select_sql_where=None, slc=None, union=False, data_model=None, driver_kwargs=None):
+                 select_sql_where=None, slc=None, union=False, data_model=None, driver_kwargs=None, bbox=None):
         self.key = key
         self.path = path
         self.select_uid = select_uid
@@ -338,6 +413,7 @@ class GeomCabinetIterator(object):
         self.union = union
         self.data_model = data_model
         self.driver_kwargs = driver_kwargs
+        self.bbox = bbox
         self.sc = GeomCabinet()
 
     def __iter__(self):
@@ -348,7 +424,8 @@ class GeomCabinetIterator(object):
         for row in self.sc.iter_geoms(key=self.key, select_uid=self.select_uid, path=self.path,
                                       load_geoms=self.load_geoms, as_field=self.as_field,
                                       uid=self.uid, select_sql_where=self.select_sql_where, slc=self.slc,
-                                      union=self.union, data_model=self.data_model, driver_kwargs=self.driver_kwargs):
+                                      union=self.union, data_model=self.data_model, driver_kwargs=self.driver_kwargs,
+                                      bbox=self.bbox):
             yield row
 
     def __len__(self):
@@ -361,7 +438,10 @@ class GeomCabinetIterator(object):
 
             if self.slc is not None:
                 return len(get_index_slice_for_iteration(self.slc))
-            elif self.select_uid is not None:
+            elif get_should_use_index(self.select_uid, self.select_sql_where, self.bbox):
+                index = self.sc.get_index(path=shp_path, uid=self.uid, driver_kwargs=self.driver_kwargs)
+                ret = len(index.get_fids(select_uid=self.select_uid, bbox=self.bbox))
+            elif self.select_uid is not None and self.bbox is None:
                 ret = len(self.select_uid)
             else:
                 # Get the geometries using a select statement.
@@ -369,7 +449,7 @@ class GeomCabinetIterator(object):
                 try:
                     features = self.sc._get_features_object_(ds, uid=self.uid, select_uid=self.select_uid,
                                                              select_sql_where=self.select_sql_where,
-                                                             driver_kwargs=self.driver_kwargs)
+                                                             driver_kwargs=self.driver_kwargs, bbox=self.bbox)
                     ret = len(features)
                 finally:
                     ds.Destroy()
@@ -418,6 +498,230 @@ class ShpCabinet(GeomCabinet):
     pass
 
 
+class GeomCabinetIndex(object):
+    """
+    Persistent feature index for a geometry cabinet data source. The index maps unique identifiers to feature
+    identifiers and holds a bulk loaded spatial index of feature bounding boxes. Index files are rebuilt when the
+    modification time or size of the data source or its sidecar files changes (see :func:`get_source_stamp`). If the
+    index files may not be written, the index is held in memory for the process.
+
+    :param str path: Path to the data source.
+    :param str uid: See :class:`~ocgis.GeomCabinetIterator`.
+    :param str layer: The layer name for multi-layer data sources.
+    :param str directory: Directory for the index files. If ``None``, use the directory containing the data source.
+    """
+
+    _version = 1
+
+    def __init__(self, path, uid=None, layer=None, directory=None):
+        self.path = path
+        self.uid = uid
+        self.layer = layer
+        if directory is None:
+            directory = os.path.dirname(os.path.abspath(path))
+        stem = '.'.join([ii for ii in [os.path.splitext(os.path.basename(path))[0], layer, uid] if ii is not None])
+        path_hash = hashlib.md5(os.path.abspath(path).encode('utf-8')).hexdigest()[0:8]
+        self.index_path = os.path.join(directory, '{}.{}.ocgis_index'.format(stem, path_hash))
+
+        self.uids = None
+        self.fids = None
+        self._spatial_index = None
+        self._load_or_build_()
+
+    @property
+    def stamp(self):
+        """
+        :return: Values identifying the state of the data source. The index is valid for a data source with the same
+         stamp.
+        :rtype: :class:`numpy.ndarray`
+        """
+        return np.array((self._version,) + get_source_stamp(self.path), dtype=float)
+
+    def get_fids(self, select_uid=None, bbox=None):
+        """
+        :param sequence select_uid: Unique identifiers to select. Missing identifiers are ignored.
+        :param sequence bbox: Select features with bounding boxes intersecting this bounding box.
+        :return: Sorted feature identifiers for features satisfying all selections.
+        :rtype: :class:`numpy.ndarray`
+        """
+        ret = self.fids
+        if select_uid is not None and ret.shape[0] > 0:
+            select_uid = np.asarray(select_uid).reshape(-1)
+            positions = np.searchsorted(self.uids, select_uid)
+            positions[positions == self.uids.shape[0]] = 0
+            found = self.uids[positions] == select_uid
+            ret = np.intersect1d(ret, self.fids[positions[found]])
+        if bbox is not None:
+            intersects = np.fromiter(self._spatial_index.iter_rtree_intersection(box(*bbox)), dtype=np.int64)
+            ret = np.intersect1d(ret, intersects)
+        return np.sort(ret)
+
+    def _build_(self):
+        # Stamp the data source before reading so changes made while reading invalidate the index.
+        stamp = self.stamp
+        with fiona.open(self.path, 'r', layer=self.layer) as source:
+            properties = source.schema['properties']
+            uid = self.uid
+            if uid is None:
+                if env.DEFAULT_GEOM_UID in properties:
+                    uid = env.DEFAULT_GEOM_UID
+            elif uid not in properties:
+                msg = 'The unique identifier "{0}" was not found in the properties: {1}'.format(uid, list(properties))
+                raise ValueError(msg)
+
+            fids, uids, geoms = [], [], []
+            for feature in source:
+                fid = int(feature['id'])
+                fids.append(fid)
+                if uid is None:
+                    # Unique identifiers are created from feature identifiers when iterating.
+                    uids.append(fid)
+                else:
+                    uids.append(int(feature['properties'][uid]))
+                if feature['geometry'] is not None:
+                    geom = shape(feature['geometry'])
+                    if not geom.is_empty:
+                        geoms.append((fid, geom))
+
+        uids = np.array(uids, dtype=np.int64)
+        fids = np.array(fids, dtype=np.int64)
+        sort = np.argsort(uids, kind='stable')
+        self.uids, self.fids = uids[sort], fids[sort]
+
+        # Write the spatial index to a temporary location first to avoid exposing partially written index files.
+        from ocgis.spatial.index import SpatialIndex, get_rtree_data_path, get_rtree_index_path
+        tmp_path = '{}.{}'.format(self.index_path, os.getpid())
+        try:
+            for path in [get_rtree_data_path(tmp_path), get_rtree_index_path(tmp_path)]:
+                if os.path.exists(path):
+                    os.remove(path)
+            si = SpatialIndex(path=tmp_path)
+            if len(geoms) == 0:
+                # Write an empty index for sources without geometries so the index is not rebuilt on every load.
+                from rtree import index
+                si._index = index.Rtree(tmp_path)
+            else:
+                si.add([g[0] for g in geoms], [g[1] for g in geoms])
+            si._index.close()
+            for get_path in [get_rtree_data_path, get_rtree_index_path]:
+                os.rename(get_path(tmp_path), get_path(self.index_path))
+            with open(tmp_path + '.npz', 'wb') as f:
+                np.savez(f, stamp=stamp, uids=self.uids, fids=self.fids)
+            os.rename(tmp_path + '.npz', self.index_path + '.npz')
+            self._spatial_index = SpatialIndex(path=self.index_path)
+        except (IOError, OSError) as e:
+            ocgis_lh(msg='Geometry cabinet index not written to "{}": {}'.format(self.index_path, e),
+                     logger='geom_cabinet', level=logging.WARN)
+            self._spatial_index = SpatialIndex()
+            self._spatial_index.add([g[0] for g in geoms], [g[1] for g in geoms])
+            # Keep the index for the process so the data source is not scanned again on every access.
+            GEOMCABINET_MEMORY_INDEXES[self.index_path] = (stamp, self.uids, self.fids, self._spatial_index)
+
+    def _load_or_build_(self):
+        from ocgis.spatial.index import SpatialIndex, get_rtree_index_path
+        stamp = self.stamp
+        arrays_path = self.index_path + '.npz'
+        try:
+            with np.load(arrays_path) as arrays:
+                is_valid = np.array_equal(arrays['stamp'], stamp)
+                if is_valid:
+                    self.uids, self.fids = arrays['uids'], arrays['fids']
+        except (IOError, OSError, KeyError, ValueError):
+            is_valid = False
+        if is_valid and os.path.exists(get_rtree_index_path(self.index_path)):
+            self._spatial_index = SpatialIndex(path=self.index_path)
+            return
+
+        in_memory = GEOMCABINET_MEMORY_INDEXES.get(self.index_path)
+        if in_memory is not None and np.array_equal(in_memory[0], stamp):
+            self.uids, self.fids, self._spatial_index = in_memory[1:]
+        else:
+            self._build_()
+
+
+class GeometrySelectionCache(object):
+    """
+    Bounded least-recently-used cache of selection geometries. Records loaded from a data source are stored as well
+    known binary and geometries transformed to a coordinate system are stored as prepared geometry objects. Hits,
+    misses, and evictions are counted.
+
+    :param int maxsize: The maximum number of cached entries. If ``None``, use
+     :attr:`ocgis.env.GEOM_SELECTION_CACHE_SIZE`. A size of zero disables the cache.
+    """
+
+    def __init__(self, maxsize=None):
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._maxsize = maxsize
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def maxsize(self):
+        if self._maxsize is None:
+            ret = env.GEOM_SELECTION_CACHE_SIZE
+        else:
+            ret = self._maxsize
+        return ret
+
+    def clear(self):
+        """
+        Remove all cached entries and reset the counters.
+        """
+
+        self._store.clear()
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        :param key: The cache key.
+        :returns: The cached entry or ``None`` if it is not in the cache.
+        """
+
+        try:
+            ret = self._store.pop(key)
+        except KeyError:
+            self.misses += 1
+            ret = None
+        else:
+            # Move the entry to the most recently used position.
+            self._store[key] = ret
+            self.hits += 1
+        return ret
+
+    def get_stats(self):
+        """
+        :returns: Dictionary containing the hit, miss, and eviction counts, the current size, and the maximum size.
+        :rtype: dict
+        """
+
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self),
+                'maxsize': self.maxsize}
+
+    def set(self, key, value):
+        """
+        Add an entry to the cache evicting the least recently used entries if the cache is full.
+
+        :param key: The cache key.
+        :param value: The entry to cache.
+        """
+
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        self._store.pop(key, None)
+        self._store[key] = value
+        while len(self._store) > maxsize:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+
 class ShpCabinetIterator(GeomCabinetIterator):
     """Left in for backwards compatibility."""
     pass
@@ -428,6 +732,140 @@ def get_gdal_driver(ds):
     return driver.GetName()
 
 
+def get_should_use_index(select_uid, select_sql_where, bbox):
+    """
+    :return: ``True`` if a selection should use the persistent feature index.
+    :rtype: bool
+    """
+    return env.USE_GEOMCABINET_INDEX and env.USE_SPATIAL_INDEX and select_sql_where is None and \
+           (select_uid is not None or bbox is not None)
+
+
 def get_index_slice_for_iteration(slc):
     slc = get_formatted_slice(slc, 1)[0]
     return slc
+
+
+def get_crs_cache_key(crs):
+    """
+    :param crs: The coordinate system.
+    :type crs: :class:`~ocgis.variable.crs.AbstractCRS`
+    :return: A hashable value identifying the coordinate system.
+    :rtype: tuple
+    """
+    if crs is None:
+        ret = None
+    else:
+        ret = (crs.__class__.__name__, getattr(crs, 'proj4', None))
+    return ret
+
+
+def get_source_stamp(path):
+    """
+    :param str path: Path to the data source.
+    :return: Modification times and sizes of the data source and its sidecar files. For shapefiles, the ``.dbf``,
+     ``.shx``, and ``.prj`` files are included if present. For file geodatabases, the files in the geodatabase
+     directory are included.
+    :rtype: tuple
+    """
+    stat = os.stat(path)
+    ret = [stat.st_mtime, stat.st_size]
+    if os.path.isdir(path):
+        # Lock files are created and removed by readers.
+        sidecars = [os.path.join(path, ii) for ii in sorted(os.listdir(path)) if not ii.endswith('.lock')]
+    else:
+        root, ext = os.path.splitext(path)
+        sidecars = []
+        if ext.lower() == '.shp':
+            for sidecar_ext in ['.dbf', '.shx', '.prj']:
+                if ext.isupper():
+                    sidecar_ext = sidecar_ext.upper()
+                sidecars.append(root + sidecar_ext)
+    for sidecar in sidecars:
+        if os.path.isfile(sidecar):
+            stat = os.stat(sidecar)
+            ret += [stat.st_mtime, stat.st_size]
+    return tuple(ret)
+
+
+def get_records_cache_key(path, select_uid, select_sql_where, uid, driver_kwargs, bbox):
+    """
+    :return: A hashable key identifying a record selection from a data source. The key changes if the modification
+     time or size of the data source or its sidecar files changes (see :func:`get_source_stamp`).
+    :rtype: tuple
+    """
+    if select_uid is not None:
+        select_uid = tuple(int(ii) for ii in select_uid)
+    if driver_kwargs is not None:
+        driver_kwargs = repr(sorted(driver_kwargs.items()))
+    if bbox is not None:
+        bbox = tuple(float(ii) for ii in bbox)
+    return ('records', os.path.abspath(path), get_source_stamp(path), select_uid, select_sql_where, uid, driver_kwargs,
+            bbox)
+
+
+def iter_cached_records(cached, as_field=False, data_model=None):
+    """
+    Yield records or fields from a geometry selection cache entry created by :meth:`~ocgis.GeomCabinet.iter_geoms`.
+
+    :param tuple cached: The cache entry.
+    :param bool as_field: See :class:`~ocgis.GeomCabinetIterator`.
+    :param str data_model: See :class:`~ocgis.GeomCabinetIterator`.
+    :rtype: dict | :class:`~ocgis.Field`
+    """
+    meta, uid, geom_wkb, properties = cached
+    meta = deepcopy(meta)
+    if env.USE_VECTORIZED_GEOMETRY:
+        geoms = shapely.from_wkb(list(geom_wkb))
+    else:
+        geoms = [wkb.loads(ii) for ii in geom_wkb]
+    for geom, prop in zip(geoms, properties):
+        yld = {'geom': geom, 'properties': OrderedDict(prop), 'meta': meta}
+        if as_field:
+            yld = Field.from_records([yld], schema=meta['schema'], crs=meta['crs'], uid=uid, data_model=data_model)
+        yield yld
+
+
+def update_selection_crs(gvar, to_crs):
+    """
+    Update the coordinate system of a selection geometry variable in-place. Geometries previously transformed between
+    the same coordinate systems are retrieved from :data:`GEOM_SELECTION_CACHE` skipping the transformation.
+
+    :param gvar: The selection geometry variable.
+    :type gvar: :class:`~ocgis.GeometryVariable`
+    :param to_crs: The destination coordinate system.
+    :type to_crs: :class:`~ocgis.variable.crs.AbstractCRS`
+    """
+    if GEOM_SELECTION_CACHE.maxsize <= 0 or gvar.is_empty or gvar.crs is None or to_crs is None:
+        gvar.update_crs(to_crs)
+        return
+
+    # Geometries are identified by a digest of their well known binary representations.
+    r_value = gvar.get_value().reshape(-1)
+    digest = hashlib.sha1()
+    for geom in r_value:
+        geom_wkb = b'' if geom is None else geom.wkb
+        digest.update(str(len(geom_wkb)).encode('utf-8'))
+        digest.update(geom_wkb)
+    key = ('transform', digest.hexdigest(), get_crs_cache_key(gvar.crs), get_crs_cache_key(to_crs))
+
+    cached = GEOM_SELECTION_CACHE.get(key)
+    if cached is None:
+        gvar.update_crs(to_crs)
+        cached = np.empty(r_value.shape[0], dtype=object)
+        cached[:] = gvar.get_value().reshape(-1)
+        # Prepared geometries accelerate repeated spatial predicates on the selection geometries.
+        if env.USE_VECTORIZED_GEOMETRY:
+            shapely.prepare(cached)
+        GEOM_SELECTION_CACHE.set(key, cached)
+    else:
+        r_value[:] = cached
+        gvar.crs = to_crs
+
+
+#: Process-wide cache of selection geometries.
+GEOM_SELECTION_CACHE = GeometrySelectionCache()
+
+#: In-memory feature indexes for data sources with index files that may not be written. Keyed by index path with
+#: values of data source stamp, unique identifiers, feature identifiers, and spatial index.
+GEOMCABINET_MEMORY_INDEXES = {}
@@ -4,6 +4,7 @@ from collections import OrderedDict
 
 import numpy as np
 import ocgis
+import shapely
 import six
 from ocgis import Variable, vm
 from ocgis.base import get_dimension_names, raise_if_empty, AbstractOcgisObject, get_variable_names, \
@@ -43,62 +44,23 @@ class GridGeometryProcessor(GeometryProcessor):
     def get_geometry_iterable(self):
         grid = self.grid
         hint_mask = self.hint_mask
-        is_vectorized = grid.is_vectorized
         if self.use_bounds:
             abstraction = grid.abstraction
         else:
             abstraction = 'point'
 
+        # Geometries are constructed in bulk and then yielded in row-major order.
+        fill = np.empty(grid.shape, dtype=object)
         if abstraction == 'point':
-            x_data = grid.x.get_value()
-            y_data = grid.y.get_value()
-            for idx_row, idx_col in itertools.product(*[list(range(ii)) for ii in grid.shape]):
-                if hint_mask is not None and hint_mask[idx_row, idx_col]:
-                    yld = None
-                else:
-                    if is_vectorized:
-                        y = y_data[idx_row]
-                        x = x_data[idx_col]
-                    else:
-                        y = y_data[idx_row, idx_col]
-                        x = x_data[idx_row, idx_col]
-                    yld = Point(x, y)
-                yield (idx_row, idx_col), yld
+            fill = get_point_geometry_array(grid, fill, hint_mask=hint_mask)
         elif abstraction == 'polygon':
-            if grid.has_bounds:
-                # We want geometries for everything even if masked.
-                x_bounds = grid.x.bounds.get_value()
-                y_bounds = grid.y.bounds.get_value()
-                range_row = list(range(grid.shape[0]))
-                range_col = list(range(grid.shape[1]))
-                if is_vectorized:
-                    for row, col in itertools.product(range_row, range_col):
-                        if hint_mask is not None and hint_mask[row, col]:
-                            polygon = None
-                        else:
-                            min_x, max_x = np.min(x_bounds[col, :]), np.max(x_bounds[col, :])
-                            min_y, max_y = np.min(y_bounds[row, :]), np.max(y_bounds[row, :])
-                            polygon = box(min_x, min_y, max_x, max_y)
-                        yield (row, col), polygon
-                else:
-                    # TODO: We should be able to avoid the creation of this corners array.
-                    corners = np.vstack((y_bounds, x_bounds))
-                    corners = corners.reshape([2] + list(x_bounds.shape))
-                    for row, col in itertools.product(range_row, range_col):
-                        if hint_mask is not None and hint_mask[row, col]:
-                            polygon = None
-                        else:
-                            current_corner = corners[:, row, col]
-                            coords = np.hstack((current_corner[1, :].reshape(-1, 1),
-                                                current_corner[0, :].reshape(-1, 1)))
-                            polygon = Polygon(coords)
-                        yield (row, col), polygon
-            else:
-                msg = 'A grid must have bounds/corners to construct polygons. Consider using "set_extrapolated_bounds".'
-                raise GridDeficientError(msg)
+            fill = get_polygon_geometry_array(grid, fill, hint_mask=hint_mask)
         else:
             raise NotImplementedError(abstraction)
 
+        for idx_row, idx_col in itertools.product(*[list(range(ii)) for ii in grid.shape]):
+            yield (idx_row, idx_col), fill[idx_row, idx_col]
+
 
 @six.add_metaclass(abc.ABCMeta)
 class AbstractGrid(AbstractOcgisObject):
@@ -1127,54 +1089,89 @@ def update_crs_with_geometry_collection(src_sr, to_sr, value_row, value_col):
         value_row[ii] = geom.GetY()
 
 
-def get_polygon_geometry_array(grid, fill):
-    is_vectorized = grid.is_vectorized
-
-    if grid.has_bounds:
-        # We want geometries for everything even if masked.
-        x_bounds = grid.x.bounds.get_value()
-        y_bounds = grid.y.bounds.get_value()
-        range_row = list(range(grid.shape[0]))
-        range_col = list(range(grid.shape[1]))
-        if is_vectorized:
-            for row, col in itertools.product(range_row, range_col):
-                min_x, max_x = np.min(x_bounds[col, :]), np.max(x_bounds[col, :])
-                min_y, max_y = np.min(y_bounds[row, :]), np.max(y_bounds[row, :])
-                polygon = box(min_x, min_y, max_x, max_y)
-                fill[row, col] = polygon
-        else:
-            # TODO: We should be able to avoid the creation of this corners array.
-            corners = np.vstack((y_bounds, x_bounds))
-            corners = corners.reshape([2] + list(x_bounds.shape))
-            for row, col in itertools.product(range_row, range_col):
-                current_corner = corners[:, row, col]
-                coords = np.hstack((current_corner[1, :].reshape(-1, 1),
-                                    current_corner[0, :].reshape(-1, 1)))
-                polygon = Polygon(coords)
-                fill[row, col] = polygon
-    else:
+def get_polygon_geometry_array(grid, fill, hint_mask=None):
+    """
+    Create polygon geometries for all grid cells regardless if the data is masked. Geometries are created in bulk if
+    vectorized geometry construction is available (see :attr:`ocgis.env.USE_VECTORIZED_GEOMETRY`).
+
+    :param grid: The source grid. It must have bounds.
+    :type grid: :class:`~ocgis.Grid`
+    :param fill: The object array to fill with geometries. It must have the same shape as the grid.
+    :type fill: :class:`numpy.ndarray`
+    :param hint_mask: If provided, no geometries are created for elements that are ``True``. These elements are set to
+     ``None``.
+    :type hint_mask: :class:`numpy.ndarray`
+    :rtype: :class:`numpy.ndarray`
+    :raises: GridDeficientError
+    """
+
+    if not grid.has_bounds:
         msg = 'A grid must have bounds/corners to construct polygons. Consider using "set_extrapolated_bounds".'
         raise GridDeficientError(msg)
 
+    # We want geometries for everything even if masked.
+    x_bounds = grid.x.bounds.get_value()
+    y_bounds = grid.y.bounds.get_value()
+
+    if grid.is_vectorized:
+        # Cell extents are computed once per row and column and then broadcast to the grid.
+        min_x, max_x = np.min(x_bounds, axis=1), np.max(x_bounds, axis=1)
+        min_y, max_y = np.min(y_bounds, axis=1), np.max(y_bounds, axis=1)
+        extents = [np.broadcast_to(min_x, grid.shape), np.broadcast_to(min_y[:, None], grid.shape),
+                   np.broadcast_to(max_x, grid.shape), np.broadcast_to(max_y[:, None], grid.shape)]
+        if env.USE_VECTORIZED_GEOMETRY:
+            select = _get_geometry_select_(grid, hint_mask)
+            fill[select] = shapely.box(*[e[select] for e in extents])
+        else:
+            for row, col in _iter_geometry_indices_(grid, hint_mask):
+                fill[row, col] = box(*[e[row, col] for e in extents])
+    else:
+        # Corner coordinates with shape (row, column, corner, x/y).
+        coords = np.stack((x_bounds, y_bounds), axis=-1)
+        if env.USE_VECTORIZED_GEOMETRY:
+            select = _get_geometry_select_(grid, hint_mask)
+            fill[select] = shapely.polygons(coords[select])
+        else:
+            for row, col in _iter_geometry_indices_(grid, hint_mask):
+                fill[row, col] = Polygon(coords[row, col])
+
+    if hint_mask is not None:
+        fill[hint_mask] = None
+
     return fill
 
 
-def get_point_geometry_array(grid, fill):
-    """Create geometries for all the underlying coordinates regardless if the data is masked."""
+def get_point_geometry_array(grid, fill, hint_mask=None):
+    """
+    Create point geometries for all the underlying coordinates regardless if the data is masked. Geometries are created
+    in bulk if vectorized geometry construction is available (see :attr:`ocgis.env.USE_VECTORIZED_GEOMETRY`).
+
+    :param grid: The source grid.
+    :type grid: :class:`~ocgis.Grid`
+    :param fill: The object array to fill with geometries. It must have the same shape as the grid.
+    :type fill: :class:`numpy.ndarray`
+    :param hint_mask: If provided, no geometries are created for elements that are ``True``. These elements are set to
+     ``None``.
+    :type hint_mask: :class:`numpy.ndarray`
+    :rtype: :class:`numpy.ndarray`
+    """
 
     x_data = grid.x.get_value()
     y_data = grid.y.get_value()
-    is_vectorized = grid.is_vectorized
+    if grid.is_vectorized:
+        x_data = np.broadcast_to(x_data, grid.shape)
+        y_data = np.broadcast_to(y_data[:, None], grid.shape)
+
+    if env.USE_VECTORIZED_GEOMETRY:
+        select = _get_geometry_select_(grid, hint_mask)
+        fill[select] = shapely.points(x_data[select], y_data[select])
+    else:
+        for idx_row, idx_col in _iter_geometry_indices_(grid, hint_mask):
+            fill[idx_row, idx_col] = Point(x_data[idx_row, idx_col], y_data[idx_row, idx_col])
+
+    if hint_mask is not None:
+        fill[hint_mask] = None
 
-    for idx_row, idx_col in itertools.product(*[list(range(ii)) for ii in grid.shape]):
-        if is_vectorized:
-            y = y_data[idx_row]
-            x = x_data[idx_col]
-        else:
-            y = y_data[idx_row, idx_col]
-            x = x_data[idx_row, idx_col]
-        pt = Point(x, y)
-        fill[idx_row, idx_col] = pt
     return fill
 
 
@@ -1382,3 +1379,17 @@ def reorder_array(reorder_indices, arr, arr_dimensions, reorder_dimension, varyi
         offset = view_to_reorder.shape[0] - the_split_index
         view_to_reorder[0:offset] = original_to_reorder[the_split_index:]
         view_to_reorder[offset:] = original_to_reorder[0:the_split_index]
+
+
+def _get_geometry_select_(grid, hint_mask):
+    if hint_mask is None:
+        ret = np.ones(grid.shape, dtype=bool)
+    else:
+        ret = np.invert(hint_mask)
+    return ret
+
+
+def _iter_geometry_indices_(grid, hint_mask):
+    for idx in itertools.product(*[list(range(ii)) for ii in grid.shape]):
+        if hint_mask is None or not hint_mask[idx]:
+            yield idx
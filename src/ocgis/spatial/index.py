@@ -1,35 +1,59 @@
+import os
+
+import numpy as np
+import shapely
 from rtree import index
 from shapely.prepared import prep
 
+from ocgis import env
+from ocgis.variable.geom import get_intersects_select
+
 
 class SpatialIndex(object):
     """
     Create and access spatial indexes using the :mod:`rtree` module.
     
-    :param str path: If provided, this is the path to pre-computed spatial index file in the ``rtree`` format.
+    :param str path: If provided, this is the path to pre-computed spatial index file in the ``rtree`` format. If the
+     index files do not exist, they are created when geometries are added.
     """
 
     def __init__(self, path=None):
+        self.path = path
         if path is None:
             self._index = index.Index()
+            is_empty = True
         else:
-            self._index = index.Rtree(path)
+            is_empty = not os.path.exists(get_rtree_index_path(path))
+            if is_empty:
+                # The file-based index is bulk loaded when a sequence is added.
+                self._index = None
+            else:
+                self._index = index.Rtree(path)
+        # An empty index may be replaced by a bulk loaded index when a sequence is added.
+        self._is_empty = is_empty
 
     def add(self, id_geom, shapely_geom):
         """
-        ..note: Both parameters may come in as sequences of the appropriate type.
+        ..note: Both parameters may come in as sequences of the appropriate type. Sequences added to an empty
+         in-memory index are bulk loaded.
 
         :param int id_geom: The unique identifier for the input geometry.
         :param :class:`shapely.geometry.Geometry` shapely_geom: The geometry to add to the spatial index. The bounds
          attribute of the geometry is added to the index.
         """
+        if self._index is None:
+            self._index = index.Rtree(self.path)
         try:
             self._index.insert(id_geom, shapely_geom.bounds)
         except AttributeError:
             # likely a sequence
-            _insert = self._index.insert
-            for ig, sg in zip(id_geom, shapely_geom):
-                _insert(ig, sg.bounds)
+            if self._is_empty:
+                self._add_bulk_(id_geom, shapely_geom)
+            else:
+                _insert = self._index.insert
+                for ig, sg in zip(id_geom, shapely_geom):
+                    _insert(ig, sg.bounds)
+        self._is_empty = False
 
     def iter_intersects(self, shapely_geom, arr, keep_touches=True):
         """
@@ -38,8 +62,9 @@ class SpatialIndex(object):
         :param shapely_geom: The geometry to use for subsetting. It is the ``bounds`` attribute fo the geometry that is
          actually tested.
         :type shapely_geom: :class:`shapely.geometry.Geometry`
-        :param arr: Array of geometry objects to spatially evaluate.
-        :type arr: :class:`~numpy.ndarray`
+        :param arr: Array of geometry objects to spatially evaluate. This may also be a dictionary mapping unique
+         identifiers to geometry objects.
+        :type arr: :class:`~numpy.ndarray` | :class:`dict`
         :param bool keep_touches: If ``True``, return the unique identifiers of geometries only touching the subset
          geometry.
         :returns: Generator yield integer unique identifiers.
@@ -56,18 +81,27 @@ class SpatialIndex(object):
         for shapely_geom_sub in itr:
             # Return the initial identifiers that intersect with the bounding box using the "rtree" internal method.
             indices = self._get_intersection_rtree_(shapely_geom_sub)
-            # Prepare the geometry for faster operations.
-            prepared = prep(shapely_geom_sub)
-            r_intersects = prepared.intersects
-            r_touches = shapely_geom_sub.touches
-            for idx in indices:
-                geom = arr[idx]
-                if r_intersects(geom):
-                    if not keep_touches:
-                        if not r_touches(geom):
+            if env.USE_VECTORIZED_GEOMETRY:
+                # Evaluate the spatial predicates for all candidates at once.
+                indices = np.fromiter(indices, dtype=int)
+                candidates = np.empty(indices.shape[0], dtype=object)
+                candidates[:] = [arr[idx] for idx in indices.tolist()]
+                select = get_intersects_select(shapely_geom_sub, candidates, keep_touches=keep_touches)
+                for idx in indices[select].tolist():
+                    yield idx
+            else:
+                # Prepare the geometry for faster operations.
+                prepared = prep(shapely_geom_sub)
+                r_intersects = prepared.intersects
+                r_touches = shapely_geom_sub.touches
+                for idx in indices:
+                    geom = arr[idx]
+                    if r_intersects(geom):
+                        if not keep_touches:
+                            if not r_touches(geom):
+                                yield idx
+                        else:
                             yield idx
-                    else:
-                        yield idx
 
     def iter_rtree_intersection(self, shapely_geom):
         # Create the geometry iterator. If it is a multi-geometry, we want to iterator over those individually.
@@ -83,5 +117,46 @@ class SpatialIndex(object):
             for idd in ids:
                 yield idd
 
+    def _add_bulk_(self, id_geom, shapely_geom):
+        ids = list(id_geom)
+        if len(ids) == 0:
+            return
+        geoms = np.empty(len(ids), dtype=object)
+        geoms[:] = list(shapely_geom)
+        if env.USE_VECTORIZED_GEOMETRY:
+            bounds = shapely.bounds(geoms).tolist()
+        else:
+            bounds = [sg.bounds for sg in geoms]
+        stream = ((int(ig), tuple(b), None) for ig, b in zip(ids, bounds))
+        if self.path is None:
+            self._index = index.Index(stream)
+        else:
+            if self._index is not None:
+                self._index.close()
+                for path in [get_rtree_index_path(self.path), get_rtree_data_path(self.path)]:
+                    if os.path.exists(path):
+                        os.remove(path)
+            self._index = index.Index(self.path, stream)
+
     def _get_intersection_rtree_(self, shapely_geom):
+        if self._index is None:
+            return []
         return self._index.intersection(shapely_geom.bounds)
+
+
+def get_rtree_data_path(path):
+    """
+    :param str path: Base path of a file-based :mod:`rtree` index.
+    :return: Path to the index's data file.
+    :rtype: str
+    """
+    return '{}.{}'.format(path, index.Property().dat_extension)
+
+
+def get_rtree_index_path(path):
+    """
+    :param str path: Base path of a file-based :mod:`rtree` index.
+    :return: Path to the index's index file.
+    :rtype: str
+    """
+    return '{}.{}'.format(path, index.Property().idx_extension)
@@ -1,9 +1,13 @@
 from copy import deepcopy, copy
 
+import numpy as np
+import shapely
+
 from ocgis import env, vm
 from ocgis.base import raise_if_empty, AbstractOcgisObject
 from ocgis.collection.field import Field
 from ocgis.constants import WrappedState
+from ocgis.spatial.geom_cabinet import update_selection_crs
 from ocgis.variable.crs import CFRotatedPole, CFSpherical, Spherical
 from ocgis.variable.geom import GeometryVariable
 
@@ -22,11 +26,14 @@ class SpatialSubsetOperation(AbstractOcgisObject):
      ``False``, unwrap the coordinates. A "wrapped" spherical coordinate system has a longitudinal domain from -180 to
      180 degrees.
     :type wrap: bool
+    :param grid_index: An optional index over the target field's grid cells. If provided, subsets are performed on the
+     window of cells that may intersect the selection geometry.
+    :type grid_index: :class:`~ocgis.spatial.spatial_subset.GridSubsetIndex`
     """
 
     _rotated_pole_destination_crs = env.DEFAULT_COORDSYS
 
-    def __init__(self, field, output_crs='input', wrap=None):
+    def __init__(self, field, output_crs='input', wrap=None, grid_index=None):
         if not isinstance(field, Field):
             raise ValueError('"field" must be an "Field" object.')
         raise_if_empty(field)
@@ -34,7 +41,9 @@ class SpatialSubsetOperation(AbstractOcgisObject):
         self.field = field
         self.output_crs = output_crs
         self.wrap = wrap
+        self.grid_index = grid_index
 
+        self._original_field = None
         self._original_rotated_pole_state = None
         self._transformed_unwrapped_select = None
 
@@ -108,6 +117,15 @@ class SpatialSubsetOperation(AbstractOcgisObject):
         prepared = self._prepare_geometry_(geom)
         base_geometry = prepared.get_value().flatten()[0]
 
+        # Limit the target field to the window of grid cells that may intersect the selection geometry. The original
+        # target is restored when the operation is finalized.
+        self._original_field = self.field
+        window = None
+        if self.grid_index is not None:
+            window = self.grid_index.get_window(base_geometry)
+            if window is not None:
+                self.field = self.field.grid[window].parent
+
         # Prepare the target field.
         self._prepare_target_()
 
@@ -170,6 +188,9 @@ class SpatialSubsetOperation(AbstractOcgisObject):
         self._finalize_target()
 
         if return_slice:
+            # Slices are relative to the window of grid cells. Offset them to index the original target.
+            if window is not None:
+                slc = tuple([slice(s.start + w.start, s.stop + w.start) for s, w in zip(slc, window)])
             ret = (ret, slc)
 
         return ret
@@ -241,7 +262,7 @@ class SpatialSubsetOperation(AbstractOcgisObject):
                       "CRS to continue."
                 raise ValueError(msg)
             if prepared.crs is not None and self.field.crs is not None and prepared.crs != self.field.crs:
-                prepared.update_crs(self.field.crs)
+                update_selection_crs(prepared, self.field.crs)
 
         # Update the subset geometry's spatial wrapping to match the target field.
         field_wrapped_state = self.field.wrapped_state
@@ -260,6 +281,9 @@ class SpatialSubsetOperation(AbstractOcgisObject):
         if self._transformed_unwrapped_select is not None:
             self.field.grid.x.v()[self._transformed_unwrapped_select] -= 360
             self._transformed_unwrapped_select = None
+        if self._original_field is not None:
+            self.field = self._original_field
+            self._original_field = None
 
     def _prepare_target_(self):
         """Perform any transformations on the target field in preparation for spatial subsetting."""
@@ -275,3 +299,50 @@ class SpatialSubsetOperation(AbstractOcgisObject):
             if select.any():
                 xval[select] += 360
                 self._transformed_unwrapped_select = select
+
+
+class GridSubsetIndex(AbstractOcgisObject):
+    """
+    Spatial index over the cells of a structured grid. The cell extents and the index are built once and reused for
+    every selection geometry subsetting the grid. Each subset is then limited to the window of cells whose extents
+    intersect the selection geometry's bounds, so per-geometry work scales with the window and not the grid.
+
+    :param grid: The grid to index. Cell extents are taken from the bounds if the grid has a polygon abstraction and
+     from the cell centers otherwise. The grid should not be distributed.
+    :type grid: :class:`~ocgis.Grid`
+    """
+
+    def __init__(self, grid):
+        self.shape = tuple(grid.shape)
+
+        if grid.abstraction == 'polygon' and grid.has_bounds:
+            x_bounds = grid.x.bounds.get_value()
+            y_bounds = grid.y.bounds.get_value()
+            xmin, xmax = x_bounds.min(axis=-1), x_bounds.max(axis=-1)
+            ymin, ymax = y_bounds.min(axis=-1), y_bounds.max(axis=-1)
+            if grid.is_vectorized:
+                xmin, ymin = np.meshgrid(xmin, ymin)
+                xmax, ymax = np.meshgrid(xmax, ymax)
+            geoms = shapely.box(xmin.ravel(), ymin.ravel(), xmax.ravel(), ymax.ravel())
+        else:
+            stacked = grid.get_value_stacked()
+            geoms = shapely.points(stacked[1].ravel(), stacked[0].ravel())
+        self._tree = shapely.STRtree(geoms)
+
+    def get_window(self, geometry):
+        """
+        :param geometry: The selection geometry in the coordinate system and wrapped state of the grid.
+        :type geometry: :class:`shapely.geometry.base.BaseGeometry`
+        :return: Slices for the row and column dimensions bounding the cells whose extents intersect the geometry's
+         bounds. The window is padded by one cell. ``None`` is returned if no cell extents intersect.
+        :rtype: tuple
+        """
+
+        indices = self._tree.query(geometry)
+        if indices.shape[0] == 0:
+            return None
+        rows, cols = np.unravel_index(indices, self.shape)
+        ret = []
+        for index, size in zip([rows, cols], self.shape):
+            ret.append(slice(max(int(index.min()) - 1, 0), min(int(index.max()) + 2, size)))
+        return tuple(ret)
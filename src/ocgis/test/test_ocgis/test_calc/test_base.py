@@ -7,7 +7,10 @@ from ocgis import RequestDataset
 from ocgis import env
 from ocgis.base import get_variable_names
 from ocgis.calc.base import AbstractUnivariateFunction, AbstractUnivariateSetFunction, AbstractFunction, \
-    AbstractMultivariateFunction, AbstractParameterizedFunction, AbstractFieldFunction
+    AbstractMultivariateFunction, AbstractParameterizedFunction, AbstractFieldFunction, get_grouped_index, \
+    get_grouped_reduction
+from ocgis.calc.library.statistics import Min, Max
+from ocgis.calc.library.thresholds import Threshold, Between
 from ocgis.collection.field import Field
 from ocgis.driver.request.multi_request import MultiRequestDataset
 from ocgis.exc import UnitsValidationError, DefinitionValidationError
@@ -18,6 +21,30 @@ from ocgis.util.units import get_units_object
 from ocgis.variable.base import Variable
 
 
+class Test(TestBase):
+    def test_get_grouped_index(self):
+        dgroups = [np.array([True, False, True, False]), np.array([False, True, False, True])]
+        indices, starts = get_grouped_index(dgroups, 4)
+        self.assertEqual(indices.tolist(), [0, 2, 1, 3])
+        self.assertEqual(starts.tolist(), [0, 2])
+
+        # Test with a slice selecting all elements.
+        indices, starts = get_grouped_index([slice(None)], 3)
+        self.assertEqual(indices.tolist(), [0, 1, 2])
+        self.assertEqual(starts.tolist(), [0])
+
+        # Test an empty group may not be indexed.
+        self.assertIsNone(get_grouped_index([np.array([True, True]), np.array([False, False])], 2))
+
+    def test_get_grouped_reduction(self):
+        values = np.ma.array([1., 2., 3., 4., 5.], mask=[False, True, False, False, False])
+        starts = np.array([0, 3])
+        actual = get_grouped_reduction(np.add, values, starts, 0, axis=0)
+        self.assertEqual(actual.tolist(), [4., 9.])
+        actual = get_grouped_reduction(np.maximum, values, starts, np.ma.maximum_fill_value(values), axis=0)
+        self.assertEqual(actual.tolist(), [3., 5.])
+
+
 class MockNeedsUnits(AbstractUnivariateFunction):
     description = 'calculation with units'
     key = 'fnu'
@@ -91,6 +118,26 @@ class TestAbstractFunction(AbstractTestField):
         fb.execute()
         self.assertDictEqual(fb.field.attrs, {'hoover': 'dam'})
 
+    def test_execute_grouped(self):
+        """Test grouped calculations match the temporal group loop."""
+
+        field = self.get_field(with_value=True, month_count=2)
+        mask = field['tmax'].get_mask(create=True).copy()
+        mask[:, 3:40, :, 0, 0] = True
+        field['tmax'].set_mask(mask)
+        keywords = {Min: {}, Max: {}, Threshold: {'threshold': 0.5, 'operation': 'gte'},
+                    Between: {'lower': 0.2, 'upper': 0.7}}
+        for grouping in [['month'], ['day'], 'all', [[1, 2]]]:
+            tgd = field.temporal.get_grouping(grouping)
+            for klass, parms in keywords.items():
+                actual = []
+                for has_calculate_grouped in [True, False]:
+                    func = klass(field=field, tgd=tgd, alias='calc', parms=parms, calc_sample_size=True)
+                    func.has_calculate_grouped = has_calculate_grouped
+                    actual.append(func.execute())
+                for key in ['calc', 'n_calc']:
+                    self.assertNumpyAll(actual[0][key].get_masked_value(), actual[1][key].get_masked_value())
+
 
 class MockFieldFunction(AbstractFieldFunction):
     key = 'mff'
@@ -1,11 +1,37 @@
 import numpy as np
 
-from ocgis.calc.library.index.duration import Duration, FrequencyDuration
+from ocgis.calc.library.index.duration import Duration, FrequencyDuration, get_spells, get_spell_summary
 from ocgis.exc import DefinitionValidationError
-from ocgis.test.base import attr
+from ocgis.test.base import attr, TestBase
 from ocgis.test.test_ocgis.test_calc.test_calc_general import AbstractCalcBase
 
 
+class Test(TestBase):
+    def test_get_spells(self):
+        arr = np.array([[1, 0, 1], [1, 1, 0], [0, 1, 1], [1, 1, 0]], dtype=bool)
+        cells, starts, lengths = get_spells(arr)
+        self.assertEqual(cells.tolist(), [0, 0, 1, 2, 2])
+        self.assertEqual(starts.tolist(), [0, 3, 1, 0, 2])
+        self.assertEqual(lengths.tolist(), [2, 1, 3, 1, 1])
+
+        # Test with trailing dimensions and no spells.
+        cells, starts, lengths = get_spells(np.zeros((4, 2, 3), dtype=bool))
+        self.assertEqual(cells.shape, (0,))
+
+    def test_get_spell_summary(self):
+        cells = np.array([0, 0, 0, 2, 3, 3])
+        lengths = np.array([4, 1, 2, 5, 2, 3])
+        for summary in ['count', 'sum', 'mean', 'median', 'std', 'max', 'min', 'ptp']:
+            actual = get_spell_summary(cells, lengths, 5, summary)
+            if summary == 'count':
+                desired = [3, 0, 1, 2, 0]
+            else:
+                summary_operation = getattr(np, summary)
+                desired = [summary_operation(lengths[cells == cell]) if (cells == cell).any() else 0
+                           for cell in range(5)]
+            self.assertNumpyAllClose(actual, np.array(desired, dtype=float))
+
+
 class TestDuration(AbstractCalcBase):
     def test_calculate(self):
         duration = Duration()
@@ -49,6 +75,12 @@ class TestDuration(AbstractCalcBase):
         ret = duration.calculate(values, 4, operation='gte', summary='mean')
         self.assertNumpyAll(np.ma.array([4., 2., 1.5, 1.5], dtype=ret.dtype), ret.flatten())
 
+        # A single spell is not summarized and cells with only single time step spells have one spell.
+        values = np.array([[5, 1, 5, 1, 5, 1, 5, 1], [1, 5, 5, 5, 1, 1, 1, 1]], dtype=float)
+        values = np.ma.array(values.T.reshape(-1, 1, 2), mask=False)
+        ret = duration.calculate(values, 4, operation='gte', summary='std')
+        self.assertNumpyAll(np.ma.array([1., 3.], dtype=ret.dtype), ret.flatten())
+
     @attr('data')
     def test_system_standard_operations(self):
         ret = self.run_standard_operations(
@@ -77,3 +109,14 @@ class TestFrequencyDuration(AbstractCalcBase):
         self.assertEqual(ret.flatten()[0].dtype.names, ('duration', 'count'))
         self.assertNumpyAll(np.array([2, 3, 5]), ret.flatten()[0]['duration'])
         self.assertNumpyAll(np.array([2, 1, 1]), ret.flatten()[0]['count'])
+
+    def test_calculate_matrix(self):
+        fduration = FrequencyDuration()
+        values = np.array([[3, 1, 0], [1, 3, 0], [3, 3, 3], [3, 0, 0]], dtype=float).reshape(4, 1, 3)
+        values = np.ma.array(values, mask=False)
+        ret = fduration.calculate(values, threshold=2, operation='gt').flatten()
+        self.assertEqual(ret[0]['duration'].tolist(), [1, 2])
+        self.assertEqual(ret[0]['count'].tolist(), [1, 1])
+        self.assertEqual(ret[1]['duration'].tolist(), [2])
+        self.assertEqual(ret[2]['duration'].tolist(), [1])
+        self.assertEqual(ret[2]['count'].tolist(), [1])
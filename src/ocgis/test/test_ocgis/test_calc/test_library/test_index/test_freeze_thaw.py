@@ -1,7 +1,7 @@
 import numpy as np
 
 import ocgis
-from ocgis.calc.library.index.freeze_thaw import FreezeThaw, freezethaw1d
+from ocgis.calc.library.index.freeze_thaw import FreezeThaw, freezethaw1d, freezethawnd
 from ocgis.exc import UnitsValidationError
 from ocgis.test.base import AbstractTestField
 
@@ -48,6 +48,30 @@ class TestFreezeThawCycles(AbstractTestField):
         x = np.array([3, 4, 4, 4, 4, 4, 4, 4])
         self.assertEquals(freezethaw1d(x, 2), 0)
 
+    def test_freezethawnd(self):
+        x = np.array([[3, 4, 5, 2, 3, -3, 4, 5, -5, -6, -3, 0, -1, 4, 5, 2, -3, -5, 6],
+                      [0, 1, 2, 3, 0, -1, 0, 1, -2, -3, 3, 0, 0, 0, 0, 0, 0, 0, 0],
+                      [3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
+                      [0, -2, 0, -2, 0, -2, 2, 0, 2, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0]], dtype=float).T
+        x = np.ma.array(x.reshape(-1, 2, 2), mask=False)
+        x.mask[3, 0, 1] = True
+        x.mask[:, 1, 0] = True
+
+        # Test with blocks of different sizes.
+        for max_elements in [1, 40, 2 ** 22]:
+            actual = freezethawnd(x, 2, max_elements=max_elements)
+            self.assertEqual(actual.shape, (2, 2))
+            for idx in [(0, 0), (0, 1), (1, 1)]:
+                desired = freezethaw1d(x[:, idx[0], idx[1]], 2)
+                self.assertEqual(actual[idx], desired)
+            self.assertTrue(np.isnan(actual[1, 0]))
+
+        np.random.seed(1)
+        x = np.random.randn(100, 3, 4) * 5
+        actual = freezethawnd(x, 15)
+        for idx in np.ndindex(3, 4):
+            self.assertEqual(actual[idx], freezethaw1d(x[:, idx[0], idx[1]], 15))
+
     def test_execute(self):
         # Just a smoke test for the class.
         field = self.get_field(with_value=True, month_count=23, name='tas', units='K')
@@ -1,3 +1,6 @@
+import datetime
+import itertools
+
 import numpy as np
 
 import ocgis
@@ -15,6 +18,11 @@ from ocgis.variable.base import Variable
 
 
 class TestDailyPercentile(AbstractTestField):
+    def get_daily_percentile_function(self):
+        field = self.get_field(with_value=True, month_count=2)
+        field = field.get_field_slice({'realization': 0, 'level': 0})
+        return DailyPercentile(field=field, parms={'percentile': 90, 'window_width': 5})
+
     @attr('data', 'slow')
     def test_system_compute(self):
         rd = self.test_data.get_rd('cancm4_tas')
@@ -51,6 +59,26 @@ class TestDailyPercentile(AbstractTestField):
 
         self.assertAlmostEqual(vc['daily_perc'].get_value().mean(), 0.76756388346354165)
 
+    def test_get_daily_percentile(self):
+        dt_arr = np.array([datetime.datetime(2000, 1, 1, 12) + datetime.timedelta(days=ii) for ii in range(366 * 3)])
+        np.random.seed(1)
+        arr = np.ma.array(np.random.rand(dt_arr.shape[0], 2, 2), mask=False)
+        func = self.get_daily_percentile_function()
+        dp = func.get_daily_percentile(arr, dt_arr, 90, 5)
+        self.assertEqual(len(dp), 366)
+        self.assertEqual(list(dp.keys())[:2], [(1, 1), (1, 2)])
+        window = np.invert(func.get_mask_dt_arr(dt_arr, 5, 15, 12, 5, False))
+        self.assertNumpyAll(np.asarray(dp[(5, 15)]), np.percentile(arr.data[window], 90, axis=0))
+
+        # Test masked values are excluded from the percentile basis.
+        arr.mask[window.nonzero()[0][:3], 0, 0] = True
+        arr.mask[:, 1, 1] = True
+        dp = func.get_daily_percentile(arr, dt_arr, 90, 5)
+        actual = dp[(5, 15)]
+        self.assertAlmostEqual(actual[0, 0], np.percentile(arr[window, 0, 0].compressed(), 90))
+        self.assertTrue(actual.mask[1, 1])
+        self.assertFalse(actual.mask[0, 0])
+
     @attr('data')
     def test_get_daily_percentile_from_request_dataset(self):
         rd = self.test_data.get_rd('cancm4_tas')
@@ -66,6 +94,18 @@ class TestDailyPercentile(AbstractTestField):
             self.assertEqual(len(list(dp.keys())), 365)
             self.assertAlmostEqual(dp[(4, 15)].mean(), 281.68076869419644)
 
+    def test_get_window_index(self):
+        dt_arr = np.array([datetime.datetime(1999, 12, 1, 6) + datetime.timedelta(hours=6 * ii) for ii in range(2000)])
+        dp = self.get_daily_percentile_function()
+        for window_width, only_leap_years in itertools.product([5, 11], [True, False]):
+            caldays, windows = dp.get_window_index(dt_arr, window_width, only_leap_years)
+            self.assertEqual(caldays[0], (12, 1))
+            self.assertIn((2, 29), caldays)
+            self.assertEqual(windows.shape, (len(caldays), dt_arr.shape[0]))
+            for calday, window in zip(caldays, windows):
+                desired = dp.get_mask_dt_arr(dt_arr, calday[0], calday[1], 6, window_width, only_leap_years)
+                self.assertNumpyAll(window, np.invert(desired))
+
 
 class TestMovingWindow(AbstractTestField):
     def test_calculate(self):
@@ -86,6 +126,33 @@ class TestMovingWindow(AbstractTestField):
         values = values.squeeze()
         self.assertEqual(ret[4], np.mean(values[2:7]))
 
+    def test_calculate_masked(self):
+        ma = MovingWindow()
+        np.random.seed(2)
+        values = np.ma.array(np.random.rand(2, 20, 1, 2, 3), mask=False)
+        values.mask[:, :, :, 1, 1] = True
+        values.mask[0, 3:6, 0, 0, 0] = True
+
+        for k, mode, operation in itertools.product([3, 9], ['same', 'valid'], MovingWindow._potential_operations):
+            ret = ma.calculate(values, k=k, mode=mode, operation=operation)
+            self.assertEqual(ret.shape, values.shape)
+            ret_mask = ret.mask
+
+            shift = int((k - 1) / 2)
+            for ie in range(values.shape[0]):
+                for origin, values_kernel in ma._iter_kernel_values_(values[ie, :, 0, :, :], k, mode=mode):
+                    desired = getattr(np.ma, operation)(values_kernel, axis=0)
+                    actual = ret[ie, origin, 0, :, :]
+                    select = np.invert(np.ma.getmaskarray(desired))
+                    self.assertNumpyAllClose(actual.data[select], desired.data[select])
+                    if mode == 'same':
+                        self.assertNumpyAll(ret_mask[ie, origin, 0, :, :], np.ma.getmaskarray(desired))
+
+            if mode == 'valid':
+                self.assertTrue(ret_mask[:, :shift].all())
+                self.assertTrue(ret_mask[:, -shift:].all())
+                self.assertFalse(ret_mask[:, shift:-shift].any())
+
     def test_execute(self):
         field = self.get_field(month_count=1, with_value=True)
         field = field.get_field_slice({'time': slice(0, 4)})
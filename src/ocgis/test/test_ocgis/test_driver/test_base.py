@@ -1,9 +1,11 @@
+import os
 from copy import deepcopy
 
 import numpy as np
 from mock import mock
 from ocgis import OcgOperations
-from ocgis.driver.base import AbstractDriver, driver_scope
+from ocgis import env
+from ocgis.driver.base import AbstractDriver, driver_scope, MetadataCache, METADATA_CACHE, get_metadata_cache_key
 from ocgis.driver.nc import DriverNetcdf
 from ocgis.driver.request.core import RequestDataset
 from ocgis.exc import DefinitionValidationError
@@ -134,3 +136,76 @@ class TestAbstractDriver(TestBase, FixtureAbstractDriver):
             FakeAbstractDriver.validate_ops(ops)
         finally:
             FakeAbstractDriver.output_formats = prev
+
+
+class TestMetadataCache(TestBase):
+
+    def test(self):
+        env.METADATA_CACHE_DIR = self.get_temporary_file_path('cache')
+        cache = MetadataCache()
+        self.assertIsNone(cache.get(('foo',)))
+        cache.set(('foo',), {'bar': 1})
+        self.assertEqual(cache.get(('foo',)), {'bar': 1})
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'misses': 1})
+
+        # Test values that may not be pickled are not cached.
+        cache.set(('lambda',), lambda x: x)
+        self.assertIsNone(cache.get(('lambda',)))
+
+        cache.clear()
+        self.assertIsNone(cache.get(('foo',)))
+
+        # Test entries are not read from a directory writable by others.
+        cache.set(('foo',), {'bar': 1})
+        os.chmod(env.METADATA_CACHE_DIR, 0o777)
+        self.assertFalse(cache.is_trusted())
+        self.assertIsNone(cache.get(('foo',)))
+        os.chmod(env.METADATA_CACHE_DIR, 0o700)
+        self.assertEqual(cache.get(('foo',)), {'bar': 1})
+
+        # Test a failed write does not raise.
+        with mock.patch('tempfile.mkstemp', side_effect=OSError):
+            cache.set(('failed',), {'bar': 1})
+        self.assertIsNone(cache.get(('failed',)))
+
+        # Test the cache is disabled without a directory.
+        env.METADATA_CACHE_DIR = None
+        cache.set(('foo',), {'bar': 1})
+        self.assertIsNone(cache.get(('foo',)))
+        env.reset()
+
+    def test_system_request_dataset(self):
+        path = self.get_temporary_file_path('foo.nc')
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time')
+            time = ds.createVariable('time', float, ('time',))
+            time.axis = 'T'
+            time.units = 'days since 2000-01-01'
+            time[:] = [1, 2]
+            ds.createVariable('tas', float, ('time',))
+
+        env.METADATA_CACHE_DIR = self.get_temporary_file_path('cache')
+        METADATA_CACHE.clear()
+        for _ in range(2):
+            rd = RequestDataset(path)
+            self.assertEqual(rd.dimension_map.get_variable('time'), 'time')
+            self.assertEqual(rd.metadata['dimensions']['time']['size'], 2)
+        self.assertEqual(METADATA_CACHE.get_stats(), {'hits': 2, 'misses': 2})
+
+        # Test entries are invalidated when the source changes.
+        key = get_metadata_cache_key(RequestDataset(path).driver, 'metadata')
+        with self.nc_scope(path, 'a') as ds:
+            ds.variables['time'][2] = 3
+        self.assertNotEqual(get_metadata_cache_key(RequestDataset(path).driver, 'metadata'), key)
+        self.assertEqual(RequestDataset(path).metadata['dimensions']['time']['size'], 3)
+
+        # Test dimension maps depend on the rotated pole priority and are not cached for rotated pole sources.
+        key = RequestDataset(path).driver._get_dimension_map_cache_key_()
+        self.assertNotEqual(RequestDataset(path, rotated_pole_priority=True).driver._get_dimension_map_cache_key_(), key)
+        with self.nc_scope(path, 'a') as ds:
+            rotated_pole = ds.createVariable('rotated_pole', 'c')
+            rotated_pole.grid_mapping_name = 'rotated_latitude_longitude'
+            rotated_pole.grid_north_pole_latitude = 39.25
+            rotated_pole.grid_north_pole_longitude = -162.0
+        self.assertIsNone(RequestDataset(path).driver._get_dimension_map_cache_key_())
+        env.reset()
@@ -1,16 +1,49 @@
 import csv
 
 import numpy as np
+from mock import mock
 from ocgis import RequestDataset, vm
 from ocgis.collection.field import Field
-from ocgis.constants import HeaderName
-from ocgis.driver.csv_ import DriverCSV
+from ocgis.constants import HeaderName, KeywordArgument
+from ocgis.driver.csv_ import DriverCSV, get_csv_row_offsets, get_csv_rows, get_inferred_dtype, CSV_ROW_OFFSETS
 from ocgis.test.base import TestBase, attr
 from ocgis.variable.base import Variable, VariableCollection
 from ocgis.variable.temporal import TemporalVariable
 from ocgis.vmachine.mpi import MPI_RANK, MPI_COMM, OcgDist, variable_collection_scatter
 
 
+class Test(TestBase):
+
+    def test_get_csv_row_offsets(self):
+        path = self.get_temporary_file_path('foo.csv')
+        with open(path, 'w') as f:
+            f.write('a,b\n1,2\n\n3,4\n5,6')
+        actual = get_csv_row_offsets(path)
+        self.assertEqual(actual.tolist(), [4, 9, 13, 16])
+
+        # Test reading rows using the offsets.
+        self.assertEqual(get_csv_rows(path, actual, slice(0, 3)), [['1', '2'], ['3', '4'], ['5', '6']])
+        self.assertEqual(get_csv_rows(path, actual, slice(1, 2)), [['3', '4']])
+        self.assertEqual(get_csv_rows(path, actual, np.array([2, 0])), [['5', '6'], ['1', '2']])
+        self.assertEqual(get_csv_rows(path, actual, slice(2, 2)), [])
+
+        # Test quoted values with line breaks.
+        with open(path, 'w') as f:
+            f.write('a,b\n1,"x\ny"\n"2 ""q""",3\n\n4,5\n')
+        actual = get_csv_row_offsets(path)
+        self.assertEqual(actual.tolist(), [4, 12, 25, 29])
+        self.assertEqual(get_csv_rows(path, actual, np.array([2, 0])), [['4', '5'], ['1', 'x\ny']])
+
+    def test_get_inferred_dtype(self):
+        self.assertEqual(get_inferred_dtype(['1', '-2']), np.int64)
+        self.assertEqual(get_inferred_dtype(['1', '2.5', '1e3']), np.float64)
+        self.assertEqual(get_inferred_dtype(['1', 'a']), object)
+        self.assertEqual(get_inferred_dtype(['1', '']), object)
+        self.assertEqual(get_inferred_dtype([]), object)
+        # Leading zeros are preserved by using an object type.
+        self.assertEqual(get_inferred_dtype(['01', '10']), object)
+
+
 class TestDriverCSV(TestBase):
     def assertCSVFilesEqual(self, path1, path2):
         with open(path1) as one:
@@ -47,6 +80,51 @@ class TestDriverCSV(TestBase):
 
         self.assertCSVFilesEqual(path, path_out)
 
+    def test_get_metadata(self):
+        path = self.get_path_to_template_csv()
+        rd = RequestDataset(path)
+        meta = rd.metadata
+        self.assertEqual(meta['dimensions']['n_records']['size'], 2)
+        actual = [meta['variables'][k]['dtype'] for k in [HeaderName.DATASET_IDENTIFER, 'ONE', 'two', 'THREE']]
+        self.assertEqual(actual, [object, np.int64, object, np.float64])
+
+    def test_get_variable_value(self):
+        path = self.get_path_to_template_csv()
+        rd = RequestDataset(path)
+        field = rd.get()
+        sub = field['ONE'][1:2]
+        self.assertEqual(sub.get_value().tolist(), [2])
+        self.assertEqual(sub.parent['two'].get_value().tolist(), ['letter'])
+        self.assertEqual(field['x'].get_value().tolist(), [10.3, 11.3])
+
+        # Test values not matching the type inferred from the sampled rows fall back to an object type.
+        path = self.get_temporary_file_path('sampled.csv')
+        with open(path, 'w') as f:
+            f.write('a,b\n1,2\nx,3\n')
+        rd = RequestDataset(path)
+        rd.driver.dtype_sample_size = 1
+        self.assertEqual(rd.metadata['variables']['a']['dtype'], np.int64)
+        self.assertEqual(rd.get()['a'].get_value().tolist(), ['1', 'x'])
+
+    def test_row_offsets(self):
+        path = self.get_temporary_file_path('offsets.csv')
+        with open(path, 'w') as f:
+            f.write('a,b\n1,2\n3,4\n')
+        CSV_ROW_OFFSETS.clear()
+        self.addCleanup(CSV_ROW_OFFSETS.clear)
+
+        # Test the offsets are indexed once and shared by drivers.
+        with mock.patch('ocgis.driver.csv_.get_csv_row_offsets', wraps=get_csv_row_offsets) as m_offsets:
+            for _ in range(2):
+                self.assertEqual(RequestDataset(path).driver.row_offsets.tolist(), [4, 8, 12])
+            self.assertEqual(m_offsets.call_count, 1)
+
+            # Test the offsets are indexed again if the file changes.
+            with open(path, 'a') as f:
+                f.write('5,6\n')
+            self.assertEqual(RequestDataset(path).driver.row_offsets.tolist(), [4, 8, 12, 16])
+            self.assertEqual(m_offsets.call_count, 2)
+
     def test_get_dump_report(self):
         path = self.get_path_to_template_csv()
         rd = RequestDataset(path)
@@ -121,3 +199,23 @@ class TestDriverCSV(TestBase):
             with open(path, 'r') as f:
                 lines = f.readlines()
             self.assertEqual(len(lines), desired)
+
+    def test_write_variable_collection_columnar(self):
+        t = TemporalVariable(name='time', value=[1, 2, 3], dtype=float, dimensions='time')
+        t.set_extrapolated_bounds('the_time_bounds', 'bounds')
+        x = Variable(name='x', value=[9, 10, 11, 12], dimensions='x', dtype=float)
+        mask = np.zeros((3, 4), dtype=bool)
+        mask[1, 2] = True
+        data = Variable(name='data', value=np.random.rand(3, 4), dimensions=['time', 'x'], mask=mask)
+        field = Field(variables=[t, x, data], time=t, is_data=data)
+
+        # Test writing by column and by record produce the same file.
+        paths = []
+        for columnar in [True, False]:
+            path = self.get_temporary_file_path('foo_{}.csv'.format(columnar))
+            iter_kwargs = {KeywordArgument.COLUMNAR: columnar, KeywordArgument.BLOCK_SIZE: 5}
+            field.write(path, driver=DriverCSV, iter_kwargs=iter_kwargs)
+            paths.append(path)
+        self.assertCSVFilesEqual(*paths)
+        with open(paths[0]) as f:
+            self.assertEqual(len(f.readlines()), 12)
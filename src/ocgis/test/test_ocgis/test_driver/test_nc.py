@@ -14,7 +14,10 @@ from ocgis.collection.field import Field
 from ocgis.constants import DimensionMapKey, DMK, KeywordArgument, MPIWriteMode
 from ocgis.driver.base import iter_all_group_keys, driver_scope
 from ocgis.driver.dimension_map import DimensionMap
-from ocgis.driver.nc import DriverNetcdf, DriverNetcdfCF, remove_netcdf_attribute, get_crs_variable
+from ocgis.driver.nc import DriverNetcdf, DriverNetcdfCF, remove_netcdf_attribute, get_crs_variable, \
+    get_read_plan, get_coalesced_variable_value, create_slices_for_dimension, get_chunked_variable_value, \
+    NetcdfChunkCache, NETCDF_CHUNK_CACHE, NetcdfMultiFileIndex, get_multifile_index, NETCDF_MULTIFILE_INDEXES, \
+    get_preset_chunk_sizes, write_variable_slabs
 from ocgis.exc import OcgWarning, CannotFormatTimeError, \
     NoDataVariablesFound
 from ocgis.ops.core import OcgOperations
@@ -52,6 +55,148 @@ class Test(TestBase):
         var = get_crs_variable(metadata, False)
         self.assertIsInstance(var, CFRotatedPole)
 
+    def test_create_slices_for_dimension(self):
+        self.assertEqual(create_slices_for_dimension(10, 3), [(0, 4), (4, 7), (7, 10)])
+
+        # Test slices are aligned with storage chunks.
+        self.assertEqual(create_slices_for_dimension(10, 3, chunksize=2), [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(create_slices_for_dimension(10, 3, chunksize=5), [(0, 4), (4, 7), (7, 10)])
+
+    def test_get_chunked_variable_value(self):
+        NETCDF_CHUNK_CACHE.clear()
+        path = self.get_temporary_file_path('foo.nc')
+        desired = np.arange(4 * 20 * 30, dtype=np.float32).reshape(4, 20, 30)
+        desired[1, 2, 3] = -1.
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time', 4)
+            ds.createDimension('y', 20)
+            ds.createDimension('x', 30)
+            var = ds.createVariable('foo', np.float32, ('time', 'y', 'x'), chunksizes=(1, 20, 30), fill_value=-1.)
+            var[:] = desired
+
+        slc = (slice(0, 4), slice(1, 3), slice(2, 25))
+        for _ in range(2):
+            with self.nc_scope(path) as ds:
+                actual = get_chunked_variable_value(ds.variables['foo'], slc)
+            self.assertEqual(actual.filled().tolist(), desired[slc].tolist())
+            self.assertEqual(actual.mask.sum(), 1)
+        self.assertEqual((NETCDF_CHUNK_CACHE.hits, NETCDF_CHUNK_CACHE.misses), (4, 4))
+
+        # Test a masked chunk following unmasked chunks.
+        NETCDF_CHUNK_CACHE.clear()
+        with self.nc_scope(path) as ds:
+            ds.set_always_mask(False)
+            actual = get_chunked_variable_value(ds.variables['foo'], slc)
+        self.assertEqual(actual.filled().tolist(), desired[slc].tolist())
+        self.assertEqual(actual.mask.sum(), 1)
+
+        # Test the chunk cache is used when loading variable values.
+        NETCDF_CHUNK_CACHE.clear()
+        field = RequestDataset(path).create_field()
+        self.assertEqual(field['foo'].chunking, (1, 20, 30))
+        sub = field['foo'][:, 5, 6:8]
+        self.assertEqual(sub.get_value().tolist(), desired[:, 5:6, 6:8].tolist())
+        self.assertEqual(NETCDF_CHUNK_CACHE.misses, 4)
+
+        # Test the chunk cache may be disabled.
+        env.NETCDF_CHUNK_CACHE_SIZE = 0
+        NETCDF_CHUNK_CACHE.clear()
+        field = RequestDataset(path).create_field()
+        self.assertEqual(field['foo'][:, 5, 6:8].get_value().tolist(), desired[:, 5:6, 6:8].tolist())
+        self.assertEqual(len(NETCDF_CHUNK_CACHE), 0)
+        env.reset()
+
+    def test_get_coalesced_variable_value(self):
+        path = self.get_temporary_file_path('foo.nc')
+        desired = np.arange(4 * 20 * 30, dtype=np.float32).reshape(4, 20, 30)
+        desired[0, 2, 3] = -1.
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time', 4)
+            ds.createDimension('y', 20)
+            ds.createDimension('x', 30)
+            var = ds.createVariable('foo', np.float32, ('time', 'y', 'x'), chunksizes=(1, 10, 10), fill_value=-1.)
+            var[:] = desired
+            bar = ds.createVariable('bar', np.int32, ('x',))
+            bar[:] = np.arange(30)
+
+        idx_y = np.array([15, 2, 3, 2, 19])
+        idx_x = np.zeros(30, dtype=bool)
+        idx_x[[0, 3, 5, 29]] = True
+        with self.nc_scope(path) as ds:
+            for overread in [1., 2., 100.]:
+                actual = get_coalesced_variable_value(ds.variables['foo'], (slice(0, 2), idx_y, idx_x), overread)
+                self.assertEqual(actual.filled().tolist(), desired[0:2][:, idx_y][:, :, idx_x].tolist())
+                self.assertEqual(actual.mask.sum(), 2)
+
+            # Test a one-dimensional variable indexed with a single array.
+            actual = get_coalesced_variable_value(ds.variables['bar'], np.array([29, 3, 4]), 2.)
+            self.assertEqual(actual.tolist(), [29, 3, 4])
+
+            # Test a masked slab following unmasked slabs.
+            NETCDF_CHUNK_CACHE.clear()
+            ds.set_always_mask(False)
+            actual = get_coalesced_variable_value(ds.variables['foo'], (slice(0, 2), idx_y, idx_x), 1.)
+            self.assertEqual(actual.filled().tolist(), desired[0:2][:, idx_y][:, :, idx_x].tolist())
+            self.assertEqual(actual.mask.sum(), 2)
+
+    def test_get_multifile_variable_value(self):
+        paths = []
+        desired_tas = []
+        for idx in range(3):
+            path = self.get_temporary_file_path('foo{}.nc'.format(idx))
+            with self.nc_scope(path, 'w', format='NETCDF4_CLASSIC') as ds:
+                ds.createDimension('time')
+                ds.createDimension('x', 4)
+                time = ds.createVariable('time', float, ('time',))
+                time.axis = 'T'
+                time.units = 'days since 200{}-01-01'.format(idx)
+                time.calendar = 'noleap'
+                time[:] = np.arange(5)
+                tas = ds.createVariable('tas', np.float32, ('time', 'x'))
+                value = np.random.rand(5, 4).astype(np.float32)
+                tas[:] = value
+                desired_tas.append(value)
+                x = ds.createVariable('x', np.int32, ('x',))
+                x[:] = np.arange(4)
+            paths.append(path)
+        desired_tas = np.concatenate(desired_tas)
+
+        NETCDF_MULTIFILE_INDEXES.clear()
+        actual = []
+        for use_index in [True, False]:
+            env.USE_NETCDF_MULTIFILE_INDEX = use_index
+            field = RequestDataset(paths).create_field()
+            sub = field.get_field_slice({'time': np.array([13, 1, 7, 8]), 'x': slice(1, 3)})
+            self.assertEqual(sub['tas'].get_value().tolist(), desired_tas[[13, 1, 7, 8], 1:3].tolist())
+            self.assertEqual(sub['x'].get_value().tolist(), [1, 2])
+            actual.append(sub.time.get_value().tolist())
+        env.reset()
+        # Test time values are converted to the units of the first member file.
+        self.assertEqual(actual[0], [733., 1., 367., 368.])
+        self.assertEqual(actual[0], actual[1])
+        self.assertEqual(len(NETCDF_MULTIFILE_INDEXES), 1)
+
+    def test_get_preset_chunk_sizes(self):
+        self.assertEqual(get_preset_chunk_sizes([3650, 180, 360], 4, 1024 ** 2), [4, 180, 360])
+        self.assertEqual(get_preset_chunk_sizes([10, 2000, 2000], 8, 1024 ** 2), [1, 65, 2000])
+        # Test an empty unlimited dimension.
+        self.assertEqual(get_preset_chunk_sizes([0, 5], 8, 1024 ** 2), [1, 5])
+
+    def test_get_read_plan(self):
+        unique, inverse, groups = get_read_plan(np.array([5, 1, 2, 3, 9, 30, 31]), 2.)
+        self.assertEqual(unique.tolist(), [1, 2, 3, 5, 9, 30, 31])
+        self.assertEqual(unique[inverse].tolist(), [5, 1, 2, 3, 9, 30, 31])
+        self.assertEqual(groups, [(1, 10, slice(0, 5)), (30, 32, slice(5, 7))])
+
+        # Test only contiguous runs are merged without over-reading.
+        _, inverse, groups = get_read_plan(np.array([1, 2, 3, 5]), 1.)
+        self.assertIsNone(inverse)
+        self.assertEqual(groups, [(1, 4, slice(0, 3)), (5, 6, slice(3, 4))])
+
+        # Test gaps inside a storage chunk are merged.
+        _, _, groups = get_read_plan(np.array([1, 3, 5]), 1., chunksize=4)
+        self.assertEqual(groups, [(1, 4, slice(0, 2)), (5, 6, slice(2, 3))])
+
     def test_get_variable_value(self):
         path1 = self.get_temporary_file_path('f1.nc')
         path2 = self.get_temporary_file_path('f2.nc')
@@ -79,6 +224,84 @@ class Test(TestBase):
             actual = ds.variables[var.name]
             self.assertFalse(hasattr(actual, 'remove_me'))
 
+    def test_write_variable_slabs(self):
+        path = self.get_temporary_file_path('foo.nc')
+        value = np.ma.array(np.arange(200.).reshape(20, 10), mask=np.arange(200).reshape(20, 10) % 7 == 0)
+        env.NETCDF_WRITE_SLAB_SIZE = 1000
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time')
+            ds.createDimension('x', 10)
+            var = ds.createVariable('foo', float, ('time', 'x'), fill_value=-1., chunksizes=(3, 10))
+            write_variable_slabs(var, [slice(0, 20), slice(0, 10)], value)
+        env.reset()
+
+        with self.nc_scope(path) as ds:
+            actual = ds.variables['foo'][:]
+        self.assertEqual(actual.filled().tolist(), value.filled(-1.).tolist())
+
+        # Test slabs are aligned with storage chunks.
+        calls = []
+        m_ncvar = mock.MagicMock()
+        m_ncvar.chunking.return_value = [3, 10]
+        m_ncvar.__setitem__.side_effect = lambda key, slab: calls.append((key[0], slab.shape[0]))
+        env.NETCDF_WRITE_SLAB_SIZE = 1000
+        write_variable_slabs(m_ncvar, [slice(5, 25), slice(0, 10)], value)
+        env.reset()
+        self.assertEqual(calls, [(slice(5, 17), 12), (slice(17, 25), 8)])
+
+
+class TestNetcdfChunkCache(TestBase):
+
+    def test(self):
+        cache = NetcdfChunkCache(maxbytes=16)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', np.zeros(1))
+        cache.set('b', np.zeros(1))
+        self.assertIsNotNone(cache.get('a'))
+        cache.set('c', np.zeros(1))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'misses': 2, 'evictions': 1, 'nbytes': 16, 'maxbytes': 16})
+
+        # Test chunks larger than the cache are not added.
+        cache.set('d', np.zeros(3))
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
+
+
+class TestNetcdfMultiFileIndex(TestBase):
+
+    def test_iter_pieces(self):
+        paths = []
+        for size in [3, 4]:
+            path = self.get_temporary_file_path('foo{}.nc'.format(size))
+            with self.nc_scope(path, 'w') as ds:
+                ds.createDimension('time')
+                ds.createDimension('x', 2)
+                time = ds.createVariable('time', float, ('time',))
+                time.units = 'days since 2000-01-01'
+                time[:] = np.arange(size)
+                ds.createVariable('x', float, ('x',))
+            paths.append(path)
+
+        index = NetcdfMultiFileIndex(paths)
+        self.assertEqual(index.aggdim, 'time')
+        self.assertEqual(index.size, 7)
+        self.assertEqual(index.variables, ('time',))
+        self.assertEqual(index.attributes['time'][1]['units'], 'days since 2000-01-01')
+
+        actual = list(index.iter_pieces(slice(2, 6)))
+        self.assertEqual(actual, [(0, slice(2, 3)), (1, slice(0, 3))])
+        actual = [(file_index, local.tolist()) for file_index, local in index.iter_pieces(np.array([6, 4, 1, 0]))]
+        self.assertEqual(actual, [(1, [3, 1]), (0, [1, 0])])
+
+        # Test the index is rebuilt when a member file changes.
+        NETCDF_MULTIFILE_INDEXES.clear()
+        self.assertIs(get_multifile_index(paths), get_multifile_index(paths))
+        with self.nc_scope(paths[0], 'a') as ds:
+            ds.variables['time'][3] = 3.
+        self.assertEqual(get_multifile_index(paths).size, 8)
+
 
 class TestDriverNetcdf(TestBase):
     def create_rank_valued_netcdf(self):
@@ -542,6 +765,28 @@ class TestDriverNetcdf(TestBase):
         if MPI_RANK == 0:
             self.assertNcEqual(path_actual, path_desired)
 
+    def test_write_variable_collection_preset(self):
+        path = self.get_temporary_file_path('foo.nc')
+        mask = np.zeros((30, 4, 5), dtype=bool)
+        mask[0, 0, 0] = True
+        field = Field()
+        field.add_variable(Variable(name='tas', value=np.random.rand(30, 4, 5), mask=mask,
+                                    dimensions=['time', 'y', 'x']))
+        field.add_variable(Variable(name='x', value=np.arange(5.), dimensions='x'))
+
+        # Test explicit variable creation arguments take precedence over the preset.
+        field.write(path, variable_kwargs={'preset': 'balanced', 'complevel': 2})
+
+        with self.nc_scope(path) as ds:
+            var = ds.variables['tas']
+            self.assertEqual(var.chunking(), [30, 4, 5])
+            self.assertEqual(var.filters()['complevel'], 2)
+            self.assertTrue(var.filters()['shuffle'])
+            self.assertEqual(var[:].mask.sum(), 1)
+
+        with self.assertRaises(ValueError):
+            field.write(self.get_temporary_file_path('bad.nc'), variable_kwargs={'preset': 'unknown'})
+
 
 class TestDriverNetcdfCF(TestBase):
     @property
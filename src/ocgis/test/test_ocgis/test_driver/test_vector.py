@@ -1,15 +1,17 @@
 import os
+from unittest import SkipTest
 
 import fiona
 import numpy as np
 import six
 from mock import mock
-from ocgis import RequestDataset, vm
+from ocgis import RequestDataset, vm, env
 from ocgis import constants
 from ocgis.collection.field import Field
 from ocgis.constants import MPIWriteMode, DimensionName, VariableName, DMK
 from ocgis.driver.base import AbstractDriver, driver_scope
-from ocgis.driver.vector import DriverVector, get_fiona_crs, get_fiona_schema
+from ocgis.driver.vector import DriverVector, get_fiona_crs, get_fiona_schema, read_vector_columns, \
+    get_typed_vector_column
 from ocgis.ops.core import OcgOperations
 from ocgis.spatial.geom_cabinet import GeomCabinetIterator, GeomCabinet
 from ocgis.test.base import TestBase, attr, create_exact_field, create_gridxy_global
@@ -23,6 +25,51 @@ from shapely.geometry import Point
 from shapely.ops import cascaded_union
 
 
+class Test(TestBase):
+
+    def test_get_typed_vector_column(self):
+        actual = get_typed_vector_column([1, None, 3], np.int32)
+        self.assertEqual(actual.dtype, np.int32)
+        self.assertEqual(actual.mask.tolist(), [False, True, False])
+        self.assertEqual(actual[2], 3)
+
+        actual = get_typed_vector_column(np.array([1.5, np.nan]), float)
+        self.assertEqual(actual.mask.tolist(), [False, True])
+
+        # Test null values from either reader are masked.
+        actual = get_typed_vector_column([1.5, None, float('nan')], float)
+        self.assertEqual(actual.mask.tolist(), [False, True, True])
+
+        actual = get_typed_vector_column(['a', None], object)
+        self.assertEqual(actual.mask.tolist(), [False, True])
+        self.assertEqual(actual[0], 'a')
+
+    def test_read_vector_columns(self):
+        if not env.USE_PYOGRIO:
+            raise SkipTest('pyogrio is required')
+
+        path = os.path.join(self.path_bin, 'shp', 'state_boundaries', 'state_boundaries.shp')
+        desired = list(GeomCabinetIterator(path=path))
+
+        columns, geoms = read_vector_columns(path, ['UGID', 'STATE_NAME'], slc=slice(3, 6))
+        self.assertEqual(list(columns['STATE_NAME']), [d['properties']['STATE_NAME'] for d in desired[3:6]])
+        for actual_geom, d in zip(geoms, desired[3:6]):
+            self.assertTrue(actual_geom.equals(d['geom']))
+
+        columns, geoms = read_vector_columns(path, ['UGID'], slc=np.array([7, 2]), load_geoms=False)
+        self.assertEqual(list(columns['UGID']), [desired[ii]['properties']['UGID'] for ii in [7, 2]])
+        self.assertIsNone(geoms)
+
+        # Test an empty selection returns empty columns.
+        columns, geoms = read_vector_columns(path, ['UGID'], slc=np.array([], dtype=int))
+        self.assertEqual(len(columns['UGID']), 0)
+        self.assertEqual(len(geoms), 0)
+
+        # Test attribute names not in the data source raise an error.
+        with self.assertRaises(ValueError):
+            read_vector_columns(path, ['UGID', 'NOT_A_COLUMN'], slc=slice(0, 2))
+
+
 class TestDriverVector(TestBase):
     def assertOGRFileLength(self, path, desired):
         with fiona.open(path) as source:
@@ -254,6 +301,26 @@ class TestDriverVector(TestBase):
 
         self.assertEqual(actual, desired)
 
+    def test_get_variable_value(self):
+        rd = self.get_request_dataset()
+        desired = list(GeomCabinetIterator(path=rd.uri))[10:13]
+        field = rd.get()[{DimensionName.GEOMETRY_DIMENSION: slice(10, 13)}]
+        self.assertEqual(field['STATE_NAME'].get_value().tolist(), [d['properties']['STATE_NAME'] for d in desired])
+        for actual, d in zip(field.geom.get_value(), desired):
+            self.assertTrue(actual.equals(d['geom']))
+
+        # Test driver keyword arguments other than the feature class are passed to the OGR iterator.
+        self.addCleanup(env.reset)
+        env.USE_PYOGRIO = True
+        rd = RequestDataset(uri=rd.uri, driver='vector', driver_kwargs={'uid': 'UGID'})
+        with mock.patch('ocgis.driver.vector.read_vector_columns') as m_read_vector_columns:
+            field = rd.get()[{DimensionName.GEOMETRY_DIMENSION: slice(10, 13)}]
+            self.assertEqual(field['STATE_NAME'].get_value().tolist(),
+                             [d['properties']['STATE_NAME'] for d in desired])
+            for actual, d in zip(field.geom.get_value(), desired):
+                self.assertTrue(actual.equals(d['geom']))
+        m_read_vector_columns.assert_not_called()
+
     def test_get_dump_report(self):
         driver = self.get_driver()
         lines = driver.get_dump_report()
@@ -85,6 +85,8 @@ class TestEnvironment(TestBase):
             self.assertEqual(env.USE_CFUNITS, self.get_is_available('cfunits'))
 
         self.assertEqual(env.USE_SPATIAL_INDEX, self.get_is_available('rtree'))
+        self.assertEqual(env.USE_VECTORIZED_GEOMETRY, self.get_is_available('shapely.creation'))
+        self.assertEqual(env.USE_PYOGRIO, self.get_is_available('pyogrio'))
 
         # Turn off the spatial index.
         env.USE_SPATIAL_INDEX = False
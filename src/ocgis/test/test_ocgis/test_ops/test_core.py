@@ -288,6 +288,46 @@ class TestOcgOperations(TestBase):
         size = ops.get_base_request_size()
         self.assertEqual(size['field']['tas']['time']['shape'][0], 3650)
 
+    def test_get_memory_plan(self):
+        x = Variable('x', np.arange(5, dtype=float), dimensions='x')
+        y = Variable('y', np.arange(4, dtype=float), dimensions='y')
+        data = Variable('data', np.ones((2, 4, 5), dtype=float), dimensions=['time', 'y', 'x'])
+        field = Field(grid=Grid(x, y), is_data=data, crs=Spherical())
+        calc = [{'func': 'ln', 'name': 'ln'}]
+
+        # Test there is no plan without a memory limit.
+        plan = OcgOperations(dataset=field, calc=calc).get_memory_plan()
+        self.assertFalse(plan['tiled'])
+        self.assertIsNone(plan['working_set'])
+
+        # Test the working set is the raw data, the data mask, and the calculation output.
+        plan = OcgOperations(dataset=field, calc=calc, memory_limit=1).get_memory_plan()
+        self.assertFalse(plan['tiled'])
+        self.assertAlmostEqual(plan['working_set'], 40 * 9 * 2 / 1024.0)
+        self.assertAlmostEqual(plan['field'][field.name]['raw'], 40 * 9 / 1024.0)
+        self.assertAlmostEqual(plan['memory_limit'], 1024.0)
+        self.assertIn('within the memory limit of 1024.0 KB', plan['description'])
+
+        # Test fields are tiled if the working set exceeds the memory limit.
+        ops = OcgOperations(dataset=field, calc=calc, memory_limit=0.0005)
+        plan = ops.get_memory_plan()
+        self.assertTrue(plan['tiled'])
+        self.assertAlmostEqual(plan['tile_budget'], 0.512)
+        self.assertIn('== Memory Plan ==', ops.get_meta())
+
+        # Test the plan is cached until a parameter is set.
+        self.assertIs(ops.get_memory_plan(), plan)
+        ops.memory_limit = 1
+        self.assertFalse(ops.get_memory_plan()['tiled'])
+
+        # Test the memory limit default is read from the environment.
+        env.MEMORY_LIMIT = 2
+        self.assertEqual(OcgOperations(dataset=field).memory_limit, 2)
+
+        # Test a memory limit of zero is validated and not replaced by the environment default.
+        with self.assertRaises(DefinitionValidationError):
+            OcgOperations(dataset=field, memory_limit=0)
+
     @attr('data')
     def test_get_meta(self):
         ops = OcgOperations(dataset=self.datasets)
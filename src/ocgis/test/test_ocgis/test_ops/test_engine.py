@@ -1,21 +1,23 @@
 import itertools
 from copy import deepcopy
 
+from mock import mock
 import numpy as np
 import ocgis
 from ocgis import SpatialCollection, Variable
-from ocgis import env
+from ocgis import env, constants
 from ocgis.collection.field import Field
 from ocgis.constants import TagName, DimensionMapKey
 from ocgis.conv.numpy_ import NumpyConverter
 from ocgis.ops.core import OcgOperations
-from ocgis.ops.engine import OperationsEngine
+from ocgis.ops.engine import OperationsEngine, ProcessPoolOperationsEngine
 from ocgis.spatial.grid import Grid
 from ocgis.test.base import attr, AbstractTestInterface, get_geometry_dictionaries
 from ocgis.util.itester import itr_products_keywords
 from ocgis.util.logging_ocgis import ProgressOcgOperations
 from ocgis.variable.crs import Spherical, WGS84, CoordinateReferenceSystem
 from shapely import wkt
+from shapely.geometry import box
 
 
 class TestOperationsEngine(AbstractTestInterface):
@@ -110,6 +112,78 @@ class TestOperationsEngine(AbstractTestInterface):
             self.assertAlmostEqual(field.grid.get_value_stacked().mean(),
                                    expected[container.geom.ugid.get_value()[0]])
 
+    def test_system_prefetch(self):
+        """Test collections are the same when read ahead by a background thread."""
+
+        geom = [{'geom': box(-104.5 + ii, 37.5, -103.5 + ii, 39.5), 'properties': {'UGID': ugid}}
+                for ii, ugid in enumerate([4, 2, 7])]
+        x = Variable('x', [-105.0, -104.0, -103.0, -102.0], dimensions='lon')
+        y = Variable('y', [37.0, 38.0, 39.0, 40.0], dimensions='lat')
+        data = Variable('data', np.arange(16, dtype=float).reshape(4, 4), dimensions=['lat', 'lon'])
+        field = Field(grid=Grid(x, y), is_data=data, crs=Spherical())
+
+        desired = list(OperationsEngine(OcgOperations(dataset=field, geom=geom)))
+
+        env.OPERATIONS_PREFETCH_DEPTH = 1
+        engine = OperationsEngine(OcgOperations(dataset=field, geom=geom))
+        actual = list(engine)
+        self.assertEqual(list(engine.stage_timing.keys()), list(constants.OPERATIONS_STAGES))
+        self.assertEqual(len(actual), len(desired))
+        for a, d in zip(actual, desired):
+            self.assertEqual(list(a.children.keys()), list(d.children.keys()))
+            self.assertNumpyAll(a.get_element(variable_name='data').get_masked_value(),
+                                d.get_element(variable_name='data').get_masked_value())
+
+        # Test exceptions are raised in the consuming thread and stopping early does not hang.
+        engine = OperationsEngine(OcgOperations(dataset=field, geom=geom))
+        for coll in engine:
+            break
+        engine = OperationsEngine(OcgOperations(dataset=field, geom=geom))
+        with mock.patch.object(engine, '_get_calculated_collection_', side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                list(engine)
+
+    def test_system_tiling(self):
+        """Test fields are tiled out-of-core and tiles are written to their location in the output."""
+
+        x = Variable('x', np.arange(5, dtype=float) - 105.0, dimensions='lon')
+        y = Variable('y', np.arange(4, dtype=float) + 37.0, dimensions='lat')
+        data = Variable('data', np.arange(40, dtype=float).reshape(2, 4, 5), dimensions=['time', 'lat', 'lon'])
+        field = Field(grid=Grid(x, y), is_data=data, crs=Spherical())
+
+        ops = OcgOperations(dataset=field, output_format='nc', optimizations={'tile_dimension': (3, 2)},
+                            dir_output=self.current_dir_output)
+        engine = OperationsEngine(ops)
+        colls = list(engine)
+        self.assertEqual(len(colls), 6)
+        tile_field = colls[-1].get_element()
+        self.assertTrue(tile_field.is_tile)
+        self.assertEqual(tile_field.dimensions['lat'].bounds_local, (3, 4))
+        self.assertEqual(tile_field.dimensions['lon'].bounds_local, (4, 5))
+        self.assertEqual(tile_field.dimensions['lon'].bounds_global, (0, 5))
+
+        # Test tiling is disabled for output formats holding collections in memory.
+        ops = OcgOperations(dataset=field, optimizations={'tile_dimension': 2})
+        self.assertEqual(len(list(OperationsEngine(ops))), 1)
+
+        # Test the tiled netCDF output matches the untiled output.
+        path = OcgOperations(dataset=field, output_format='nc', optimizations={'tile_dimension': (3, 2)},
+                             dir_output=self.current_dir_output, prefix='tiled').execute()
+        desired = OcgOperations(dataset=field, output_format='nc', dir_output=self.current_dir_output,
+                                prefix='untiled').execute()
+        self.assertNcEqual(path, desired, ignore_attributes={'global': ['history']})
+
+        # Test fields are tiled when the working set exceeds the memory limit.
+        ops = OcgOperations(dataset=field, output_format='nc', memory_limit=0.0002, dir_output=self.current_dir_output)
+        self.assertEqual(len(list(OperationsEngine(ops))), 8)
+
+        # Test there is no warning for an unsupported output format if the memory plan does not tile.
+        ops = OcgOperations(dataset=field, memory_limit=1)
+        with mock.patch('ocgis.ops.engine.ocgis_lh') as m_ocgis_lh:
+            OperationsEngine(ops)
+        for call in m_ocgis_lh.call_args_list:
+            self.assertNotIn('Tiling is not supported', str(call))
+
     @attr('data', 'esmf')
     def test_system_regridding_bounding_box_wrapped(self):
         """Test subsetting with a wrapped bounding box with the target as a 0-360 global grid."""
@@ -269,3 +343,48 @@ class TestOperationsEngine(AbstractTestInterface):
             actual = actual.get_value()
             diff = np.abs(actual - desired)
             self.assertTrue(diff.max() < 1e-5)
+
+
+class TestProcessPoolOperationsEngine(AbstractTestInterface):
+
+    def test_init(self):
+        field = self.get_field(ntime=2, nlevel=None)
+        ops = OcgOperations(dataset=field, backend='process')
+        engine = ProcessPoolOperationsEngine(ops, workers=3)
+        self.assertEqual(engine.workers, 3)
+        self.assertEqual(engine.queue_depth, 6)
+
+        with self.assertRaises(ValueError):
+            ProcessPoolOperationsEngine(ops, workers=2, queue_depth=0)
+
+    def test_iter(self):
+        # Test workers are not forked from a prefetch thread.
+        env.OPERATIONS_PREFETCH_DEPTH = 2
+        field = self.get_field(ntime=2, nlevel=None)
+        engine = ProcessPoolOperationsEngine(OcgOperations(dataset=field, backend='process'), workers=1)
+        with mock.patch.object(engine, '_iter_prefetched_collections_') as m:
+            self.assertEqual(len(list(engine)), 1)
+        self.assertFalse(m.called)
+
+    def test_system_process_geometries(self):
+        """Test collections are yielded in selection geometry order."""
+
+        geom = [{'geom': box(-104.5 + ii, 37.5, -103.5 + ii, 39.5), 'properties': {'UGID': ugid}}
+                for ii, ugid in enumerate([4, 2, 7])]
+        x = Variable('x', [-105.0, -104.0, -103.0, -102.0], dimensions='lon')
+        y = Variable('y', [37.0, 38.0, 39.0, 40.0], dimensions='lat')
+        data = Variable('data', np.arange(16, dtype=float).reshape(4, 4), dimensions=['lat', 'lon'])
+        field = Field(grid=Grid(x, y), is_data=data, crs=Spherical())
+
+        ops = OcgOperations(dataset=field, geom=geom, backend='ocg')
+        desired = list(OperationsEngine(ops))
+
+        for queue_depth in [1, 2, 5]:
+            ops = OcgOperations(dataset=field, geom=geom, backend='process')
+            actual = list(ProcessPoolOperationsEngine(ops, workers=2, queue_depth=queue_depth))
+            self.assertEqual(len(actual), len(desired))
+            for a, d in zip(actual, desired):
+                self.assertEqual(list(a.children.keys()), list(d.children.keys()))
+                a = a.get_element(variable_name='data')
+                d = d.get_element(variable_name='data')
+                self.assertNumpyAll(a.get_masked_value(), d.get_masked_value())
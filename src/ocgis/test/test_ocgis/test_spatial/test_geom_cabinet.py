@@ -8,10 +8,12 @@ from ocgis import env
 from ocgis.base import get_variable_names
 from ocgis.collection.field import Field
 from ocgis.environment import ogr
-from ocgis.spatial.geom_cabinet import GeomCabinet, GeomCabinetIterator, get_uid_from_properties
+from ocgis.spatial.geom_cabinet import GeomCabinet, GeomCabinetIterator, get_uid_from_properties, GeomCabinetIndex, \
+    GeometrySelectionCache, GEOM_SELECTION_CACHE, update_selection_crs, GEOMCABINET_MEMORY_INDEXES
 from ocgis.test.base import TestBase
 from ocgis.test.base import attr
-from ocgis.variable.crs import WGS84
+from ocgis.variable.crs import WGS84, CoordinateReferenceSystem
+from shapely.geometry import box
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon
 
@@ -34,6 +36,137 @@ class Test(TestBase):
         with self.assertRaises(ValueError):
             get_uid_from_properties(properties, 'name')
 
+    def test_update_selection_crs(self):
+        GEOM_SELECTION_CACHE.clear()
+        to_crs = CoordinateReferenceSystem(epsg=2163)
+        desired = list(GeomCabinetIterator(key='state_boundaries', select_uid=[13]))[0]['geom']
+        gvars = [list(GeomCabinetIterator(key='state_boundaries', select_uid=[13], as_field=True))[0].geom
+                 for _ in range(2)]
+
+        for gvar in gvars:
+            update_selection_crs(gvar, to_crs)
+            self.assertEqual(gvar.crs, to_crs)
+            self.assertFalse(gvar.get_value()[0].almost_equals(desired))
+        self.assertTrue(gvars[0].get_value()[0].equals(gvars[1].get_value()[0]))
+        self.assertEqual(GEOM_SELECTION_CACHE.get_stats()['hits'], 2)
+
+        # Test the transformation is performed if the cache is disabled.
+        env.GEOM_SELECTION_CACHE_SIZE = 0
+        gvar = list(GeomCabinetIterator(key='state_boundaries', select_uid=[13], as_field=True))[0].geom
+        update_selection_crs(gvar, to_crs)
+        self.assertTrue(gvar.get_value()[0].equals(gvars[0].get_value()[0]))
+        env.reset()
+        GEOM_SELECTION_CACHE.clear()
+
+
+@attr('rtree')
+class TestGeomCabinetIndex(TestBase):
+
+    def get_shapefile_copy(self):
+        src = os.path.join(self.path_bin, 'shp', 'state_boundaries')
+        dst = os.path.join(self.current_dir_output, 'state_boundaries')
+        shutil.copytree(src, dst)
+        return os.path.join(dst, 'state_boundaries.shp')
+
+    def test_init(self):
+        path = self.get_shapefile_copy()
+        index = GeomCabinetIndex(path)
+        self.assertTrue(os.path.exists(index.index_path + '.npz'))
+        self.assertEqual(len(index.get_fids()), 51)
+
+        # Test the index files are reused.
+        with mock.patch.object(GeomCabinetIndex, '_build_') as m_build:
+            GeomCabinetIndex(path)
+            m_build.assert_not_called()
+
+        # Test the index is rebuilt if the data source changes.
+        os.utime(path, (1, 1))
+        with mock.patch.object(GeomCabinetIndex, '_build_') as m_build:
+            GeomCabinetIndex(path)
+            m_build.assert_called_once_with()
+
+        # Test the index is rebuilt if a sidecar file changes.
+        GeomCabinetIndex(path)
+        os.utime(os.path.splitext(path)[0] + '.dbf', (1, 1))
+        with mock.patch.object(GeomCabinetIndex, '_build_') as m_build:
+            GeomCabinetIndex(path)
+            m_build.assert_called_once_with()
+
+        # Test an index directory.
+        index = GeomCabinetIndex(path, directory=self.current_dir_output)
+        self.assertEqual(os.path.dirname(index.index_path), self.current_dir_output)
+
+        # Test an empty index is written for a data source without geometries.
+        path = os.path.join(self.current_dir_output, 'no_geometries.shp')
+        schema = {'geometry': 'Point', 'properties': {'UGID': 'int'}}
+        with fiona.open(path, 'w', driver='ESRI Shapefile', schema=schema) as sink:
+            sink.write({'geometry': None, 'properties': {'UGID': 1}})
+        index = GeomCabinetIndex(path)
+        self.assertTrue(os.path.exists(index.index_path + '.npz'))
+        self.assertEqual(index.get_fids(select_uid=[1]).tolist(), [0])
+        self.assertEqual(index.get_fids(bbox=[-180., -90., 180., 90.]).tolist(), [])
+
+    def test_init_in_memory(self):
+        path = self.get_shapefile_copy()
+        directory = os.path.join(self.current_dir_output, 'read_only')
+        os.mkdir(directory)
+
+        # Test the index is held in memory and reused if the index files may not be written.
+        with mock.patch('ocgis.spatial.geom_cabinet.os.rename', side_effect=OSError('read-only')):
+            index = GeomCabinetIndex(path, directory=directory)
+            self.addCleanup(GEOMCABINET_MEMORY_INDEXES.pop, index.index_path, None)
+            self.assertFalse(os.path.exists(index.index_path + '.npz'))
+            self.assertEqual(len(index.get_fids()), 51)
+            with mock.patch.object(GeomCabinetIndex, '_build_') as m_build:
+                index = GeomCabinetIndex(path, directory=directory)
+                m_build.assert_not_called()
+            self.assertEqual(len(index.get_fids(bbox=[-180., -90., 180., 90.])), 51)
+
+            # Test the in-memory index is rebuilt if the data source changes.
+            os.utime(path, (1, 1))
+            with mock.patch.object(GeomCabinetIndex, '_build_') as m_build:
+                GeomCabinetIndex(path, directory=directory)
+                m_build.assert_called_once_with()
+
+    def test_get_fids(self):
+        path = self.get_shapefile_copy()
+        index = GeomCabinetIndex(path)
+        records = list(GeomCabinetIterator(path=path))
+
+        actual = index.get_fids(select_uid=[48, 1, 9999])
+        desired = [ii for ii, r in enumerate(records) if r['properties']['UGID'] in (1, 48)]
+        self.assertEqual(actual.tolist(), desired)
+
+        bbox = [-105., 38., -103., 40.]
+        actual = index.get_fids(bbox=bbox)
+        desired = [ii for ii, r in enumerate(records) if r['geom'].envelope.intersects(box(*bbox))]
+        self.assertEqual(actual.tolist(), desired)
+
+        self.assertEqual(index.get_fids(select_uid=[1], bbox=bbox).tolist(), [])
+
+
+class TestGeometrySelectionCache(TestBase):
+
+    def test(self):
+        cache = GeometrySelectionCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.get_stats(), {'hits': 2, 'misses': 2, 'evictions': 1, 'size': 2, 'maxsize': 2})
+        cache.clear()
+        self.assertEqual(cache.get_stats(), {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 2})
+
+        # Test the maximum size is read from the environment.
+        env.GEOM_SELECTION_CACHE_SIZE = 0
+        cache = GeometrySelectionCache()
+        cache.set('a', 1)
+        self.assertEqual(len(cache), 0)
+        env.reset()
+
 
 class TestGeomCabinetIterator(TestBase):
     def get_shapefile_path_no_default_unique_identifier(self):
@@ -334,6 +467,54 @@ class TestGeomCabinet(TestBase):
         self.assertEqual(len(records), 2)
         self.assertEqual([r['properties']['ID'] for r in records], geom_select_uid)
 
+    def test_iter_geoms_cache(self):
+        GEOM_SELECTION_CACHE.clear()
+        sc = GeomCabinet()
+        kwds = dict(key='state_boundaries', select_uid=[13, 8])
+        desired = list(sc.iter_geoms(**kwds))
+        self.assertEqual(GEOM_SELECTION_CACHE.get_stats()['size'], 1)
+
+        # Test repeated selections are not read from the data source.
+        with mock.patch('ocgis.spatial.geom_cabinet.ogr.Open') as m_Open:
+            actual = list(sc.iter_geoms(**kwds))
+            fields = list(sc.iter_geoms(as_field=True, **kwds))
+            m_Open.assert_not_called()
+        self.assertEqual(GEOM_SELECTION_CACHE.hits, 2)
+        self.assertEqual([r['properties'] for r in actual], [r['properties'] for r in desired])
+        for a, d in zip(actual, desired):
+            self.assertTrue(a['geom'].equals(d['geom']))
+        self.assertEqual([f.geom.ugid.get_value()[0] for f in fields], [13, 8])
+
+        # Test cached records are not affected by modifications to yielded records.
+        actual[0]['properties']['UGID'] = 100
+        self.assertEqual(list(sc.iter_geoms(**kwds))[0]['properties']['UGID'], 13)
+
+        # Test full layer scans and slices are not cached.
+        GEOM_SELECTION_CACHE.clear()
+        list(sc.iter_geoms(key='state_boundaries'))
+        list(sc.iter_geoms(key='state_boundaries', slc=[0, 1]))
+        self.assertEqual(GEOM_SELECTION_CACHE.get_stats()['size'], 0)
+        GEOM_SELECTION_CACHE.clear()
+
+    @attr('rtree')
+    def test_iter_geoms_index(self):
+        env.GEOM_SELECTION_CACHE_SIZE = 0
+        sc = GeomCabinet()
+        bbox = [-105., 38., -103., 40.]
+        desired = [list(sc.iter_geoms('state_boundaries', select_uid=[13, 8])),
+                   list(sc.iter_geoms('state_boundaries', bbox=bbox))]
+
+        env.USE_GEOMCABINET_INDEX = True
+        env.DIR_GEOMCABINET_INDEX = self.current_dir_output
+        actual = [list(sc.iter_geoms('state_boundaries', select_uid=[13, 8])),
+                  list(sc.iter_geoms('state_boundaries', bbox=bbox))]
+        self.assertEqual(len(os.listdir(self.current_dir_output)), 3)
+        for a, d in zip(actual, desired):
+            self.assertGreater(len(d), 0)
+            self.assertEqual([r['properties'] for r in a], [r['properties'] for r in d])
+        self.assertEqual(len(GeomCabinetIterator(key='state_boundaries', bbox=bbox)), len(desired[1]))
+        env.reset()
+
     def test_iter_geoms_select_sql_where(self):
         sc = GeomCabinet()
         sql = "STATE_NAME = 'New Hampshire'"
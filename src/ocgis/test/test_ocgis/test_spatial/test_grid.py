@@ -18,10 +18,11 @@ from ocgis.constants import KeywordArgument, GridAbstraction, DMK, VariableName,
 from ocgis.driver.dimension_map import DimensionMap
 from ocgis.driver.nc import DriverNetcdfCF
 from ocgis.driver.nc_ugrid import DriverNetcdfUGRID
-from ocgis.exc import EmptySubsetError, BoundsAlreadyAvailableError
+from ocgis.exc import EmptySubsetError, BoundsAlreadyAvailableError, GridDeficientError
 from ocgis.spatial.base import create_spatial_mask_variable
 from ocgis.spatial.geomc import AbstractGeometryCoordinates, PointGC, PolygonGC
-from ocgis.spatial.grid import Grid, expand_grid, GridGeometryProcessor, GridUnstruct, arr_intersects_bounds
+from ocgis.spatial.grid import Grid, expand_grid, GridGeometryProcessor, GridUnstruct, arr_intersects_bounds, \
+    get_point_geometry_array, get_polygon_geometry_array
 from ocgis.test.base import attr, AbstractTestInterface, create_gridxy_global, TestBase
 from ocgis.test.test_ocgis.test_spatial.test_geomc import FixturePointGC, FixturePolygonGC
 from ocgis.util.helpers import make_poly, iter_array
@@ -51,6 +52,55 @@ class Test(AbstractTestInterface):
         for variable in [vx, vy]:
             self.assertEqual(grid.parent[variable.name].ndim, 2)
 
+    def test_get_point_geometry_array(self):
+        for with_2d_variables in [False, True]:
+            grid = self.get_gridxy(with_2d_variables=with_2d_variables)
+            hint_mask = np.zeros(grid.shape, dtype=bool)
+            hint_mask[1, 2] = True
+
+            # Test bulk construction is equivalent to constructing geometries one at a time.
+            actual = {}
+            for use_vectorized in [False, True]:
+                env.USE_VECTORIZED_GEOMETRY = use_vectorized
+                actual[use_vectorized] = get_point_geometry_array(grid, np.empty(grid.shape, dtype=object),
+                                                                  hint_mask=hint_mask)
+            env.reset()
+
+            y, x = grid.get_value_stacked()
+            for idx in itertools.product(*[list(range(ii)) for ii in grid.shape]):
+                for fill in actual.values():
+                    if hint_mask[idx]:
+                        self.assertIsNone(fill[idx])
+                    else:
+                        self.assertTrue(fill[idx].equals_exact(Point(x[idx], y[idx]), 0))
+
+    def test_get_polygon_geometry_array(self):
+        for with_2d_variables in [False, True]:
+            grid = self.get_gridxy(with_2d_variables=with_2d_variables, with_xy_bounds=True)
+            hint_mask = np.zeros(grid.shape, dtype=bool)
+            hint_mask[0, 1] = True
+
+            # Test bulk construction is equivalent to constructing geometries one at a time.
+            actual = {}
+            for use_vectorized in [False, True]:
+                env.USE_VECTORIZED_GEOMETRY = use_vectorized
+                actual[use_vectorized] = get_polygon_geometry_array(grid, np.empty(grid.shape, dtype=object),
+                                                                    hint_mask=hint_mask)
+            env.reset()
+
+            for idx in itertools.product(*[list(range(ii)) for ii in grid.shape]):
+                if hint_mask[idx]:
+                    self.assertIsNone(actual[False][idx])
+                    self.assertIsNone(actual[True][idx])
+                else:
+                    self.assertIsInstance(actual[True][idx], Polygon)
+                    self.assertTrue(actual[True][idx].equals_exact(actual[False][idx], 0))
+
+        # Test bounds are required.
+        grid = self.get_gridxy()
+        with self.assertRaises(GridDeficientError):
+            get_polygon_geometry_array(grid, np.empty(grid.shape, dtype=object))
+
 
 class TestGridGeometryProcessor(AbstractTestInterface):
     def test(self):
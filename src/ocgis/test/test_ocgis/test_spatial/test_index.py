@@ -1,10 +1,12 @@
 import itertools
+import os
 
 import numpy as np
 from ocgis import env
 from ocgis.test.base import TestBase, attr
 from shapely import wkt
 from shapely.geometry.geo import mapping
+from shapely.geometry import MultiPoint
 from shapely.geometry.point import Point
 
 if env.USE_SPATIAL_INDEX:
@@ -32,6 +34,19 @@ class TestSpatialIndex(TestBase):
     def test_constructor(self):
         SpatialIndex()
 
+        # Test a file-based index is bulk loaded and reused.
+        path = os.path.join(self.current_dir_output, 'index')
+        points = self.geom_michigan_point_grid
+        si = SpatialIndex(path=path)
+        si.add(list(points.keys()), list(points.values()))
+        si._index.close()
+        si = SpatialIndex(path=path)
+        actual = set(si._index.intersection(self.geom_michigan.bounds))
+        desired = SpatialIndex()
+        desired.add(list(points.keys()), list(points.values()))
+        self.assertEqual(actual, set(desired._index.intersection(self.geom_michigan.bounds)))
+        self.assertEqual(len(actual), 48)
+
     def test_add_polygon(self):
         si = SpatialIndex()
         si.add(1, self.geom_michigan)
@@ -51,6 +66,16 @@ class TestSpatialIndex(TestBase):
         ids = list(si._index.intersection(self.geom_michigan.bounds))
         self.assertEqual([1, 2], ids)
 
+        # Test adding to a bulk loaded index.
+        points = self.geom_michigan_point_grid
+        si = SpatialIndex()
+        si.add(list(range(50)), [points[ii] for ii in range(50)])
+        si.add(list(range(50, 100)), [points[ii] for ii in range(50, 100)])
+        si.add(100, self.geom_michigan)
+        self.assertEqual(tuple(si._index.bounds), MultiPoint(list(points.values())).bounds)
+        ids = list(si._index.intersection(self.geom_michigan.bounds))
+        self.assertEqual(len(ids), 49)
+
     def test_get_intersection_rtree(self):
         points = self.geom_michigan_point_grid
         si = SpatialIndex()
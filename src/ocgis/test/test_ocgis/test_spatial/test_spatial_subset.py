@@ -7,8 +7,8 @@ from ocgis import env
 from ocgis.collection.field import Field
 from ocgis.constants import WrappedState, DimensionMapKey, KeywordArgument
 from ocgis.exc import EmptySubsetError
-from ocgis.spatial.spatial_subset import SpatialSubsetOperation
-from ocgis.test.base import TestBase, attr, get_geometry_dictionaries
+from ocgis.spatial.spatial_subset import SpatialSubsetOperation, GridSubsetIndex
+from ocgis.test.base import TestBase, attr, get_geometry_dictionaries, create_gridxy_global
 from ocgis.test.strings import GERMANY_WKT, NEBRASKA_WKT
 from ocgis.util.helpers import make_poly
 from ocgis.util.itester import itr_products_keywords
@@ -16,6 +16,7 @@ from ocgis.variable.crs import CFRotatedPole, WGS84, CFSpherical
 from ocgis.variable.geom import GeometryVariable
 from ocgis.vmachine.mpi import MPI_COMM, MPI_RANK
 from shapely import wkt
+from shapely.geometry import box, Point
 
 
 class TestSpatialSubsetOperation(TestBase):
@@ -214,6 +215,32 @@ class TestSpatialSubsetOperation(TestBase):
             ret = ss.get_spatial_subset('intersects', gvar)
             self.assertTrue(np.all(ret.grid.x.get_value() >= 0))
 
+    def test_get_spatial_subset_grid_index(self):
+        """Test subsetting the window of grid cells selected by a grid subset index."""
+
+        if vm.size > 1:
+            raise SkipTest('vm.size > 1')
+
+        geoms = [box(-97.3, 39.2, -93.1, 41.7), Point(10.2, -5.3).buffer(3.0), box(-180., -90., -170., -85.)]
+        for abstraction in ['polygon', 'point']:
+            grid = create_gridxy_global(resolution=2.0, crs=WGS84())
+            grid.abstraction = abstraction
+            grid_index = GridSubsetIndex(grid)
+            for geom in geoms:
+                gvar = GeometryVariable(value=geom, dimensions='ngeom', crs=WGS84())
+                actual = SpatialSubsetOperation(grid.parent, grid_index=grid_index).get_spatial_subset(
+                    'intersects', gvar)
+                desired = SpatialSubsetOperation(grid.parent).get_spatial_subset('intersects', gvar)
+                self.assertNumpyAll(actual.grid.get_value_stacked(), desired.grid.get_value_stacked())
+                self.assertNumpyAll(actual.grid.get_mask(create=True), desired.grid.get_mask(create=True))
+
+                # Test returned slices index the original grid.
+                _, actual_slc = SpatialSubsetOperation(grid.parent, grid_index=grid_index).get_spatial_subset(
+                    'intersects', gvar, return_slice=True)
+                _, desired_slc = SpatialSubsetOperation(grid.parent).get_spatial_subset('intersects', gvar,
+                                                                                        return_slice=True)
+                self.assertEqual(actual_slc, desired_slc)
+
     @attr('data')
     def test_get_spatial_subset_output_crs(self):
         """Test subsetting with an output CRS."""
@@ -327,3 +354,18 @@ class TestSpatialSubsetOperation(TestBase):
         # same output crs as input
         ss = SpatialSubsetOperation(target, output_crs=ss.field.crs)
         self.assertFalse(ss.should_update_crs)
+
+
+class TestGridSubsetIndex(TestBase):
+
+    def test_get_window(self):
+        grid = create_gridxy_global(resolution=10.0, dist=False)
+        grid_index = GridSubsetIndex(grid)
+        self.assertEqual(grid_index.get_window(box(-45., 5., -25., 15.)), (slice(8, 12), slice(12, 17)))
+        self.assertEqual(grid_index.get_window(Point(-179., -89.)), (slice(0, 2), slice(0, 2)))
+        self.assertIsNone(grid_index.get_window(box(500., 500., 510., 510.)))
+
+        # Test a point abstraction uses cell centers.
+        grid.abstraction = 'point'
+        grid_index = GridSubsetIndex(grid)
+        self.assertEqual(grid_index.get_window(box(-44., 1., -26., 14.)), (slice(8, 11), slice(13, 16)))
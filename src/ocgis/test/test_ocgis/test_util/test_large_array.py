@@ -7,7 +7,7 @@ from ocgis import Variable
 from ocgis.calc import tile
 from ocgis.test import create_gridxy_global, create_exact_field
 from ocgis.test.base import TestBase, attr
-from ocgis.util.large_array import compute, set_variable_spatial_mask
+from ocgis.util.large_array import compute, set_variable_spatial_mask, get_aligned_tile_dimensions
 
 
 class Test(TestBase):
@@ -181,6 +181,14 @@ class Test(TestBase):
         self.assertNcEqual(ret_compute, ret_ocgis, check_fill_value=False, check_types=False,
                            ignore_attributes={'global': ['history'], 'mean': ['_FillValue']})
 
+    def test_get_aligned_tile_dimensions(self):
+        grid = create_gridxy_global(resolution=10.0)
+        field = create_exact_field(grid, 'exact', ntime=2)
+        field['exact']._chunking = (1, 3, 5)
+        ops = ocgis.OcgOperations(dataset=field, output_format='nc')
+        self.assertEqual(get_aligned_tile_dimensions(ops, 7), (6, 5))
+        self.assertEqual(get_aligned_tile_dimensions(ops, 2), (2, 2))
+
     def test_set_variable_spatial_mask(self):
         value = np.random.rand(10, 3, 4)
         value = np.ma.array(value, mask=False)
@@ -208,6 +216,22 @@ class Test(TestBase):
         schema = tile.get_tile_schema(25, 1, 2)
         self.assertEqual(len(schema), 13)
 
+        # Test different row and column tile dimensions.
+        schema = tile.get_tile_schema(5, 6, (2, 3))
+        self.assertEqual(len(schema), 6)
+        self.assertEqual(schema[1], {'row': [0, 2], 'col': [3, 6]})
+
+    def test_tile_get_tile_shape(self):
+        # Test tiles span whole rows if the budget allows.
+        self.assertEqual(tile.get_tile_shape((100, 200), 8, 8000), (5, 200))
+        self.assertEqual(tile.get_tile_shape((10, 20), 8, 10 ** 6), (10, 20))
+
+        # Test a single row is split into columns aligned with storage chunks.
+        self.assertEqual(tile.get_tile_shape((100, 200), 8, 8 * 150, chunks=(10, 64)), (1, 128))
+
+        # Test a budget smaller than a single cell.
+        self.assertEqual(tile.get_tile_shape((100, 200), 8, 1), (1, 1))
+
     def test_tile_sum(self):
         ntests = 1000
         for ii in range(ntests):
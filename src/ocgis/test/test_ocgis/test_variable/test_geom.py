@@ -25,7 +25,7 @@ from ocgis.variable.base import Variable, VariableCollection
 from ocgis.variable.crs import WGS84, Spherical, Cartesian
 from ocgis.variable.dimension import Dimension
 from ocgis.variable.geom import GeometryVariable, GeometryProcessor, get_split_polygon_by_node_threshold, \
-    GeometrySplitter, do_remove_self_intersects_multi
+    GeometrySplitter, do_remove_self_intersects_multi, get_intersects_select
 from ocgis.vmachine.mpi import OcgDist, MPI_RANK, variable_scatter, MPI_SIZE, variable_gather, MPI_COMM
 
 
@@ -63,6 +63,16 @@ class TestGeom(TestBase, FixtureSelfIntersectingPolygon):
     def test_do_remove_self_intersects_first(self):
         self.run_do_remove_self_intersects(self.fixture_self_intersecting_polygon_coords_first, debug=False)
 
+    def test_get_intersects_select(self):
+        if not env.USE_VECTORIZED_GEOMETRY:
+            raise SkipTest('vectorized geometry operations not available')
+
+        targets = np.array([Point(0.5, 0.5), Point(1, 0.5), Point(3, 3), box(0.5, 0.5, 2, 2)], dtype=object)
+        geometry = box(0, 0, 1, 1)
+        for keep_touches in [False, True]:
+            actual = get_intersects_select(geometry, targets, keep_touches=keep_touches)
+            self.assertNumpyAll(actual, np.array([True, keep_touches, False, True]))
+
 
 class TestGeometryProcessor(AbstractTestInterface):
     def test_iter_intersection(self):
@@ -665,9 +675,13 @@ class TestGeometryVariable(AbstractTestInterface, FixturePolygonWithHole, Fixtur
         usi = [False]
         if env.USE_SPATIAL_INDEX:
             usi.append(True)
+        uvg = [False]
+        if env.USE_VECTORIZED_GEOMETRY:
+            uvg.append(True)
 
-        keywords = dict(use_spatial_index=usi)
+        keywords = dict(use_spatial_index=usi, use_vectorized_geometry=uvg)
         for k in self.iter_product_keywords(keywords):
+            env.USE_VECTORIZED_GEOMETRY = k.use_vectorized_geometry
             ret = pa.get_mask_from_intersects(poly, use_spatial_index=k.use_spatial_index)
             desired_mask_local = desired_mask[slice(*ydim.bounds_local), slice(*xdim.bounds_local)]
             if MPI_RANK > 1:
@@ -685,6 +699,16 @@ class TestGeometryVariable(AbstractTestInterface, FixturePolygonWithHole, Fixtur
                 res = pa2.get_mask_from_intersects(b, use_spatial_index=k.use_spatial_index)
                 self.assertNumpyAll(res, value.mask)
 
+                # Test touching geometries are only kept if requested.
+                value = [box(0, 0, 1, 1), box(1, 0, 2, 1), box(2, 0, 3, 1)]
+                pa3 = GeometryVariable(value=value, dimensions='ngeom')
+                b = box(1.5, 0.5, 2, 2)
+                for keep_touches in [False, True]:
+                    res = pa3.get_mask_from_intersects(b, use_spatial_index=k.use_spatial_index,
+                                                       keep_touches=keep_touches)
+                    self.assertNumpyAll(res, np.array([True, False, not keep_touches]))
+        env.reset()
+
     def test_get_nearest(self):
         target1 = Point(0.5, 0.75)
         target2 = box(0.5, 0.75, 0.55, 0.755)
@@ -904,15 +928,38 @@ class TestGeometryVariable(AbstractTestInterface, FixturePolygonWithHole, Fixtur
         self.assertEqual(gvar.get_value()[0].bounds, (195.0, -40.0, 225.0, -30.0))
 
     def test_update_crs(self):
-        from_crs = WGS84()
-        pa = self.get_geometryvariable(crs=from_crs, name='g', dimensions='gg')
-        to_crs = CoordinateReferenceSystem(epsg=2136)
-        pa.update_crs(to_crs)
-        self.assertEqual(pa.crs, to_crs)
-        v0 = [1629871.494956261, -967769.9070825744]
-        v1 = [2358072.3857447207, -239270.87548993886]
-        np.testing.assert_almost_equal(pa.get_value()[0], v0, decimal=3)
-        np.testing.assert_almost_equal(pa.get_value()[1], v1, decimal=3)
+        uvg = [False]
+        if env.USE_VECTORIZED_GEOMETRY:
+            uvg.append(True)
+
+        for use_vectorized_geometry in uvg:
+            env.USE_VECTORIZED_GEOMETRY = use_vectorized_geometry
+
+            from_crs = WGS84()
+            pa = self.get_geometryvariable(crs=from_crs, name='g', dimensions='gg')
+            to_crs = CoordinateReferenceSystem(epsg=2136)
+            pa.update_crs(to_crs)
+            self.assertEqual(pa.crs, to_crs)
+            v0 = [1629871.494956261, -967769.9070825744]
+            v1 = [2358072.3857447207, -239270.87548993886]
+            np.testing.assert_almost_equal(pa.get_value()[0].coords[0], v0, decimal=3)
+            np.testing.assert_almost_equal(pa.get_value()[1].coords[0], v1, decimal=3)
+
+            # Test masked elements are not required to be geometries and masked geometries are transformed.
+            value = np.ma.array([Point(1, 2), None, Point(3, 4)], mask=[False, True, True], dtype=object)
+            pa = GeometryVariable(name='g', value=value, dimensions='gg', crs=from_crs)
+            pa.update_crs(to_crs)
+            np.testing.assert_almost_equal(pa.get_value()[0].coords[0], v0, decimal=3)
+            self.assertIsNone(pa.get_value()[1])
+            np.testing.assert_almost_equal(pa.get_value()[2].coords[0], v1, decimal=3)
+
+            # Test polygons keep their structure.
+            pa = GeometryVariable(name='g', value=[box(1, 2, 3, 4)], dimensions='gg', crs=from_crs)
+            pa.update_crs(to_crs)
+            actual = pa.get_value()[0]
+            self.assertIsInstance(actual, Polygon)
+            np.testing.assert_almost_equal(actual.exterior.coords[1], v1, decimal=3)
+        env.reset()
 
     def test_update_crs_to_cartesian(self):
         """Test a spherical to cartesian CRS update."""
@@ -44,6 +44,61 @@ class TestIterator(TestBase):
             self.assertIsInstance(as_list[0], OrderedDict)
             self.assertEqual(len(as_list[0]), 1)
 
+    def test_iter_columns(self):
+
+        def _formatter_(name, value, mask):
+            if value is None:
+                year = None
+            else:
+                year = int(value) + 2000
+            return [(name, value), ('year', year)]
+
+        def _create_iterators_():
+            data = Variable(name='data', value=np.arange(12).reshape(4, 3) * 1.5, dimensions=['y', 'x'],
+                            repeat_record=[('source', 'one')])
+            mask = data.get_mask(create=True)
+            mask[1, 2] = True
+            mask[3, 0] = True
+            data.set_mask(mask)
+            data2 = Variable(name='data2', value=np.arange(12).reshape(4, 3), dimensions=['y', 'x'])
+            x = Variable(name='x', value=[30., 40., 50.], dimensions='x')
+            x_bounds = Variable(name='x_bounds', value=[25., 35., 45.], dimensions='x')
+            y = Variable(name='y', value=[1, 2, 3, 4], dimensions='y', mask=[False, True, False, False])
+            yield Iterator(data)
+            yield Iterator(data, followers=[x, y])
+            yield Iterator(data, followers=[x, y], allow_masked=False)
+            yield Iterator(data, followers=[Iterator(x, followers=[x_bounds]), Iterator(y, formatter=_formatter_)])
+            yield Iterator(data, followers=[x, Iterator(y, formatter=_formatter_, clobber_masked=False)],
+                           allow_masked=False)
+            yield Iterator(data, followers=[x, y, data2], melted=[data, data2])
+            yield Iterator(data, followers=[x, y, data2], melted=[data, data2], allow_masked=False,
+                           repeaters=[('i_am', 'a_repeater')])
+
+        # Test concatenated blocks are equivalent to the records.
+        for block_size in [None, 1, 5, 12, 100]:
+            for itr in _create_iterators_():
+                desired = list(itr)
+                actual = []
+                for block in itr.iter_columns(block_size=block_size):
+                    self.assertIsInstance(block, OrderedDict)
+                    for row in zip(*list(block.values())):
+                        actual.append(OrderedDict(list(zip(list(block.keys()), row))))
+                self.assertEqual(actual, desired)
+                self.assertEqual([list(a.keys()) for a in actual], [list(d.keys()) for d in desired])
+
+        # Test a scalar variable.
+        var = Variable(name='scalar', value=5.5, dimensions=[])
+        actual = list(Iterator(var).iter_columns())
+        self.assertEqual(actual, [OrderedDict([('scalar', [5.5])])])
+
+        # Test formatted records must share keys.
+        def _bad_formatter_(name, value, mask):
+            return [('key{}'.format(value), value)]
+
+        var = Variable(name='data', value=[1, 2], dimensions='dim')
+        with self.assertRaises(ValueError):
+            list(Iterator(var, formatter=_bad_formatter_).iter_columns())
+
     def test_iter_followers(self):
         base_var = self.create_base_variable()
         follower_var = Variable(name='follower', value=np.random.rand(base_var.shape[1]),
@@ -8,6 +8,7 @@ import numpy as np
 from ocgis import Dimension
 from ocgis import RequestDataset
 from ocgis import constants
+from ocgis import env
 from ocgis import netcdftime
 from ocgis.constants import HeaderName, KeywordArgument, DimensionMapKey
 from ocgis.exc import CannotFormatTimeError, IncompleteSeasonError
@@ -19,7 +20,8 @@ from ocgis.util.units import get_units_object, get_are_units_equal, get_are_unit
 from ocgis.variable.temporal import get_datetime_conversion_state, get_datetime_from_months_time_units, \
     get_datetime_from_template_time_units, get_difference_in_months, get_is_interannual, get_num_from_months_time_units, \
     get_origin_datetime_from_months_units, get_sorted_seasons, TemporalVariable, iter_boolean_groups_from_time_regions, \
-    TemporalGroupVariable, get_time_regions, get_datetime_or_netcdftime
+    TemporalGroupVariable, get_time_regions, get_datetime_or_netcdftime, get_date_parts_from_numtime, \
+    TemporalGroupIndex, TemporalGroupCache, TEMPORAL_GROUP_CACHE
 from ocgis.variable.temporal import get_datetime_or_netcdftime as dt
 
 try:
@@ -81,6 +83,26 @@ class Test(AbstractTestTemporal):
         self.assertEqual(ret.shape, self.value_template_units_no_decimal.shape)
         self.assertEqual(ret[2], datetime.datetime(2000, 1, 3))
 
+    def test_get_date_parts_from_numtime(self):
+        units = 'days since 1899-12-30 12:00:00'
+        value = np.arange(-20000, 70000, 0.25)
+        calendars = ['standard', 'gregorian', 'proleptic_gregorian', 'julian', 'noleap', '365_day', 'all_leap',
+                     '366_day', '360_day']
+        for calendar in calendars:
+            parts = get_date_parts_from_numtime(value, units, calendar)
+            dts = num2date(value, units, calendar=calendar)
+            actual = [[getattr(d, attr) for attr in TemporalVariable._date_parts] for d in dts]
+            self.assertEqual(parts.tolist(), actual)
+
+        # Fractional hourly intervals are rounded to the nearest millisecond.
+        parts = get_date_parts_from_numtime(np.array([1. / 3, 2. / 3]) * 24 * 11, 'hours since 2000-01-01', 'standard')
+        self.assertEqual(parts.tolist(), [[2000, 1, 4, 16, 0, 0], [2000, 1, 8, 8, 0, 0]])
+
+        # Unsupported units, calendars, and values return None.
+        self.assertIsNone(get_date_parts_from_numtime(value, 'months since 2000-01-01', 'standard'))
+        self.assertIsNone(get_date_parts_from_numtime(value, units, 'unknown'))
+        self.assertIsNone(get_date_parts_from_numtime(np.array([np.nan]), units, 'standard'))
+
     def test_get_difference_in_months(self):
         distance = get_difference_in_months(datetime.datetime(1978, 12, 1), datetime.datetime(1979, 3, 1))
         self.assertEqual(distance, 3)
@@ -534,6 +556,36 @@ class TestTemporalVariable(AbstractTestTemporal):
                 desired = [[693232.5, 694326.5]]
             self.assertNumpyAllClose(np.array(actual), np.array(desired))
 
+    def test_get_grouping_cache(self):
+        TEMPORAL_GROUP_CACHE.clear()
+        tv = self.get_temporalvariable()
+        grouping = [[12, 1, 2], [3, 4, 5], 'year']
+        tgv1 = tv.get_grouping(grouping)
+        self.assertEqual((TEMPORAL_GROUP_CACHE.hits, TEMPORAL_GROUP_CACHE.misses), (0, 1))
+
+        # A time variable with the same values is a cache hit.
+        tgv2 = self.get_temporalvariable().get_grouping(grouping)
+        self.assertEqual((TEMPORAL_GROUP_CACHE.hits, TEMPORAL_GROUP_CACHE.misses), (1, 1))
+        self.assertNumpyAll(tgv1.get_value(), tgv2.get_value())
+        self.assertNumpyAll(tgv1.bounds.get_value(), tgv2.bounds.get_value())
+        self.assertNumpyAll(tgv1.date_parts, tgv2.date_parts)
+        self.assertEqual([dgroup.tolist() for dgroup in tgv1.dgroups], [dgroup.tolist() for dgroup in tgv2.dgroups])
+        self.assertFalse(np.may_share_memory(tgv1.get_value(), tgv2.get_value()))
+
+        # Changes to the grouping, calendar, or values are cache misses.
+        tv.get_grouping(['month'])
+        tv2 = self.get_temporalvariable()
+        tv2.calendar = 'noleap'
+        tv2.get_grouping(grouping)
+        tv.get_between(datetime.datetime(1900, 1, 1), datetime.datetime(1900, 12, 31, 23, 59)).get_grouping(grouping)
+        self.assertEqual((TEMPORAL_GROUP_CACHE.hits, TEMPORAL_GROUP_CACHE.misses), (1, 4))
+
+        # Test the cache may be disabled.
+        env.TEMPORAL_GROUP_CACHE_SIZE = 0
+        TEMPORAL_GROUP_CACHE.clear()
+        tv.get_grouping(grouping)
+        self.assertEqual((TEMPORAL_GROUP_CACHE.hits, TEMPORAL_GROUP_CACHE.misses, len(TEMPORAL_GROUP_CACHE)), (0, 0, 0))
+
     def test_get_grouping_other(self):
         tdim = self.get_temporalvariable()
         grouping = [[12, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11], 'year']
@@ -1112,6 +1164,47 @@ class TestTemporalVariable(AbstractTestTemporal):
         self.assertNcEqual(path, path2)
 
 
+class TestTemporalGroupCache(AbstractTestInterface):
+    def test(self):
+        cache = TemporalGroupCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        # The least recently used entry is evicted.
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.get_stats(), {'hits': 2, 'misses': 2, 'size': 2, 'maxsize': 2})
+        cache.clear()
+        self.assertEqual(cache.get_stats(), {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2})
+
+        # Test the maximum size is read from the environment.
+        env.TEMPORAL_GROUP_CACHE_SIZE = 1
+        cache = TemporalGroupCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(len(cache), 1)
+
+
+class TestTemporalGroupIndex(AbstractTestInterface):
+    def test_init(self):
+        tgi = TemporalGroupIndex.from_group_ids(np.array([1, 0, 1, 2, 0]), 4)
+        self.assertNumpyAll(tgi.indices, np.array([1, 4, 0, 2, 3]))
+        self.assertNumpyAll(tgi.starts, np.array([0, 2, 4, 5]))
+        self.assertEqual(len(tgi), 4)
+        self.assertNumpyAll(tgi.get_counts(), np.array([2, 2, 1, 0]))
+        self.assertNumpyAll(tgi.get_group(1), np.array([0, 2]))
+        self.assertNumpyAll(tgi[0], np.array([False, True, False, False, True]))
+        self.assertNumpyAll(tgi[-1], np.zeros(5, dtype=bool))
+        self.assertEqual(len(list(tgi)), 4)
+
+        # Test with explicit time indices.
+        tgi = TemporalGroupIndex.from_group_ids(np.array([1, 0]), 2, indices=np.array([3, 5]), size=7)
+        self.assertNumpyAll(tgi[0], np.array([False, False, False, False, False, True, False]))
+        self.assertNumpyAll(tgi.get_group(1), np.array([3]))
+
+
 class TestTemporalGroupVariable(AbstractTestInterface):
     def get_tgv(self):
         rd = self.get_request_dataset()
@@ -679,11 +679,18 @@ def get_sorted_uris_by_time_dimension(uris, variable=None):
     """
 
     from ocgis import RequestDataset
+    from ocgis.driver.base import METADATA_CACHE, get_metadata_cache_key
 
     to_sort = {}
     for uri in uris:
         rd = RequestDataset(uri=uri, variable=variable)
-        to_sort[rd.get().temporal.extent_datetime[1]] = rd.uri
+        # Time extents are kept in the metadata cache to avoid creating fields for unchanged sources.
+        key = get_metadata_cache_key(rd.driver, ('time_extent', variable))
+        extent = METADATA_CACHE.get(key)
+        if extent is None:
+            extent = rd.get().temporal.extent_datetime[1]
+            METADATA_CACHE.set(key, extent)
+        to_sort[extent] = rd.uri
     sorted_keys = sorted(to_sort)
     ret = [to_sort[sk] for sk in sorted_keys]
     return ret
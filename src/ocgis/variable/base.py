@@ -289,6 +289,8 @@ class Variable(AbstractContainer, Attributes):
         self._mask = None
         self._bounds_name = None
         self._name_ugid = None
+        # Storage chunk sizes of the variable's source data if the source is chunked.
+        self._chunking = None
 
         self.dtype = dtype
 
@@ -391,6 +393,16 @@ class Variable(AbstractContainer, Attributes):
 
         return get_units_object(self.units)
 
+    @property
+    def chunking(self):
+        """
+        :return: The storage chunk sizes for each dimension of the variable's source data or ``None`` if the source is
+         not chunked.
+        :rtype: :class:`tuple` of :class:`int` | ``None``
+        """
+
+        return self._chunking
+
     @property
     def dtype(self):
         """
@@ -1085,13 +1097,23 @@ class Variable(AbstractContainer, Attributes):
 
     def create_ugid_global(self, name, start=1):
         """
-        Same as :meth:`~ocgis.Variable.create_ugid` but collective across the current :class:`~ocgis.OcgVM`.
+        Same as :meth:`~ocgis.Variable.create_ugid` but collective across the current :class:`~ocgis.OcgVM`. If the
+        variable's parent is a tile of a larger field (see :attr:`ocgis.Field.is_tile`), the identifiers are the element
+        positions in the larger field.
 
         :raises: :class:`~ocgis.exc.EmptyObjectError`
         """
 
         raise_if_empty(self)
 
+        if vm.size == 1 and self.ndim > 0 and getattr(self.parent, 'is_tile', False):
+            index = np.ix_(*[np.arange(*d.bounds_local) for d in self.dimensions])
+            global_shape = [d.size_global for d in self.dimensions]
+            value = np.ravel_multi_index(index, global_shape) + start
+            ret = Variable(name=name, value=value, dimensions=self.dimensions)
+            self.set_ugid(ret)
+            return ret
+
         sizes = vm.gather(self.size)
         if vm.rank == 0:
             for idx, n in enumerate(vm.ranks):
@@ -2052,7 +2074,9 @@ class VariableCollection(AbstractCollection, AbstractContainer, Attributes):
 
     def iter(self, **kwargs):
         """
-        :return: Yield record dictionaries for variables in the collection.
+        :return: Yield record dictionaries for variables in the collection. If ``columnar`` is ``True``, yield blocks
+         of records as dictionaries mapping record keys to lists of values. The geometry value is then a list of
+         geometries for the block.
         :rtype: dict
         """
 
@@ -2073,6 +2097,8 @@ class VariableCollection(AbstractCollection, AbstractContainer, Attributes):
         geom = kwargs.pop(KeywordArgument.GEOM, None)
         variable = kwargs.pop(KeywordArgument.VARIABLE, None)
         followers = kwargs.pop(KeywordArgument.FOLLOWERS, None)
+        columnar = kwargs.pop(KeywordArgument.COLUMNAR, False)
+        block_size = kwargs.pop(KeywordArgument.BLOCK_SIZE, None)
 
         if geom is None:
             geom_name = None
@@ -2106,6 +2132,9 @@ class VariableCollection(AbstractCollection, AbstractContainer, Attributes):
         else:
             header_map_keys = list(header_map.keys())
 
+        if columnar:
+            itr = itr.iter_columns(block_size=block_size)
+
         for yld in itr:
             if geom_name is None:
                 geom_value = None
@@ -2394,6 +2423,24 @@ def get_default_fill_value_from_dtype(dtype):
     return ret
 
 
+def get_dimension_chunk_sizes(variables):
+    """
+    :param variables: Variables to search for source storage chunking. The first chunk size found for a dimension is
+     used.
+    :type variables: sequence of :class:`~ocgis.Variable`
+    :return: Mapping of dimension names to storage chunk sizes.
+    :rtype: dict
+    """
+    ret = {}
+    for variable in variables:
+        chunking = variable.chunking
+        if chunking is None:
+            continue
+        for name, size in zip(variable.dimension_names, chunking):
+            ret.setdefault(name, size)
+    return ret
+
+
 def get_dimension_lengths(dimensions):
     ret = [len(d) for d in dimensions]
     return tuple(ret)
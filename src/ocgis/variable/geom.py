@@ -4,6 +4,7 @@ from copy import deepcopy
 from itertools import product
 
 import numpy as np
+import shapely
 from numpy.core.multiarray import ndarray
 from shapely import wkb
 from shapely.geometry import Point, Polygon, MultiPolygon, mapping, MultiPoint, box
@@ -19,7 +20,7 @@ from ocgis.base import AbstractOcgisObject
 from ocgis.base import get_dimension_names, get_variable_names, raise_if_empty
 from ocgis.constants import KeywordArgument, HeaderName, VariableName, DimensionName, ConversionTarget, DriverKey, \
     WrappedState, AttributeName, WrapAction
-from ocgis.environment import ogr
+from ocgis.environment import ogr, osr
 from ocgis.exc import EmptySubsetError, RequestableFeature, NoInteriorsError, SelfIntersectsRemovalError
 from ocgis.spatial.base import AbstractSpatialVariable, create_split_polygons
 from ocgis.util.addict import Dict
@@ -851,10 +852,8 @@ class GeometryVariable(AbstractSpatialVariable):
         # Use compressed masked values if target is not available.
         if target is None:
             target = self.get_masked_value().compressed()
-        # Add the geometries to the index.
-        r_add = si.add
-        for idx, geom in iter_array(target, return_value=True):
-            r_add(idx[0], geom)
+        # Add the geometries to the index. Adding a sequence allows the index to be bulk loaded.
+        si.add(np.arange(target.shape[0]), target)
 
         return si
 
@@ -1153,8 +1152,6 @@ class GeometryVariable(AbstractSpatialVariable):
         elif from_crs != to_crs:
             # Be sure and project masked geometries to maintain underlying geometries.
             r_value = self.get_value().reshape(-1)
-            r_loads = wkb.loads
-            r_create = ogr.CreateGeometryFromWkb
             to_sr = to_crs.sr
             from_sr = from_crs.sr
 
@@ -1162,22 +1159,27 @@ class GeometryVariable(AbstractSpatialVariable):
             if the_mask is not None:
                 the_mask = the_mask.flatten()
 
-            for idx, geom in enumerate(r_value.flat):
-                try:
-                    # Get the well known binary representation of the geometry object.
-                    geom_wkb = geom.wkb
-                except AttributeError:
-                    # The geometry may be masked in which case it has no binary whatever. Confirm the geometry is
-                    # masked or raise an exception.
-                    if the_mask is None or not the_mask[idx]:
-                        raise
-                    else:
-                        continue
+            if env.USE_VECTORIZED_GEOMETRY:
+                update_crs_with_coordinate_buffer(r_value, from_sr, to_sr, mask=the_mask)
+            else:
+                r_loads = wkb.loads
+                r_create = ogr.CreateGeometryFromWkb
+                for idx, geom in enumerate(r_value.flat):
+                    try:
+                        # Get the well known binary representation of the geometry object.
+                        geom_wkb = geom.wkb
+                    except AttributeError:
+                        # The geometry may be masked in which case it has no binary whatever. Confirm the geometry is
+                        # masked or raise an exception.
+                        if the_mask is None or not the_mask[idx]:
+                            raise
+                        else:
+                            continue
 
-                ogr_geom = r_create(geom_wkb)
-                ogr_geom.AssignSpatialReference(from_sr)
-                ogr_geom.TransformTo(to_sr)
-                r_value[idx] = r_loads(ogr_geom.ExportToWkb())
+                    ogr_geom = r_create(geom_wkb)
+                    ogr_geom.AssignSpatialReference(from_sr)
+                    ogr_geom.TransformTo(to_sr)
+                    r_value[idx] = r_loads(ogr_geom.ExportToWkb())
         # Even if coordinate systems are measured equivalent, for consistency the new crs is the destination CRS.
         self.crs = to_crs
 
@@ -1414,7 +1416,19 @@ def geometryvariable_get_mask_from_intersects(gvar, geometry, use_spatial_index=
     # area for intersects operations. Useful for speeding up grid subsetting operations.
     geometry_target = np.ma.array(gvar.get_value(), mask=original_mask).compressed()
 
-    if use_spatial_index:
+    if env.USE_VECTORIZED_GEOMETRY:
+        # Evaluate the spatial predicates for all targets at once. The returned indices are relative to the geometry
+        # targets.
+        if use_spatial_index:
+            # The tree is bulk loaded and queried using a prepared geometry.
+            tree = shapely.STRtree(geometry_target)
+            indices = tree.query(geometry, predicate='intersects')
+            if not keep_touches:
+                indices = indices[np.invert(shapely.touches(geometry, geometry_target[indices]))]
+        else:
+            indices = np.flatnonzero(get_intersects_select(geometry, geometry_target, keep_touches=keep_touches))
+        ref_fill_mask[global_index[indices]] = False
+    elif use_spatial_index:
         si = gvar.get_spatial_index(target=geometry_target)
         # Return the indices of the geometries intersecting the target geometry, and update the mask accordingly.
         for idx in si.iter_intersects(geometry, geometry_target, keep_touches=keep_touches):
@@ -1435,6 +1449,63 @@ def geometryvariable_get_mask_from_intersects(gvar, geometry, use_spatial_index=
     return fill
 
 
+def get_intersects_select(geometry, targets, keep_touches=False):
+    """
+    Evaluate the intersects predicate for an array of target geometries using vectorized geometry operations. Requires
+    :attr:`ocgis.env.USE_VECTORIZED_GEOMETRY`.
+
+    :param geometry: The geometry to test against.
+    :type geometry: :class:`shapely.geometry.base.BaseGeometry`
+    :param targets: One-dimensional object array of geometries to test.
+    :type targets: :class:`numpy.ndarray`
+    :param bool keep_touches: If ``True``, geometries only touching ``geometry`` are considered intersecting.
+    :return: boolean array with ``True`` values for intersecting targets
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    # Prepare the geometry for faster spatial operations.
+    shapely.prepare(geometry)
+    ret = shapely.intersects(geometry, targets)
+    if not keep_touches:
+        ret[ret] = np.invert(shapely.touches(geometry, targets[ret]))
+    return ret
+
+
+def update_crs_with_coordinate_buffer(value, from_sr, to_sr, mask=None):
+    """
+    Update the coordinate system of a geometry array in-place. The coordinates of all geometries are gathered into a
+    single buffer and transformed with one call. Geometries are then rebuilt from the transformed buffer. Requires
+    :attr:`ocgis.env.USE_VECTORIZED_GEOMETRY`.
+
+    :param value: One-dimensional object array of geometries to transform.
+    :type value: :class:`numpy.ndarray`
+    :param from_sr: The source coordinate system.
+    :type from_sr: :class:`osgeo.osr.SpatialReference`
+    :param to_sr: The destination coordinate system.
+    :type to_sr: :class:`osgeo.osr.SpatialReference`
+    :param mask: One-dimensional mask for ``value``. Masked elements are not required to be geometries.
+    :type mask: :class:`numpy.ndarray`
+    :raises: ValueError
+    """
+
+    # Masked elements may not be geometries. Masked geometries are still transformed to maintain the underlying
+    # geometries.
+    is_geometry = shapely.is_geometry(value)
+    is_missing = np.invert(is_geometry)
+    if mask is not None:
+        is_missing = np.logical_and(is_missing, np.invert(mask))
+    if is_missing.any():
+        raise ValueError('Only masked elements may be non-geometry objects: {}'.format(value[is_missing][0]))
+
+    geoms = value[is_geometry]
+    include_z = bool(shapely.has_z(geoms).any())
+    coords = shapely.get_coordinates(geoms, include_z=include_z)
+    if coords.shape[0] > 0:
+        transform = osr.CoordinateTransformation(from_sr, to_sr)
+        transformed = np.array(transform.TransformPoints(coords.tolist()))[:, 0:coords.shape[1]]
+        value[is_geometry] = shapely.set_coordinates(geoms.copy(), transformed)
+
+
 def do_remove_self_intersects(poly, try_again=True):
     if not isinstance(poly, Polygon):
         exc = ValueError("only Polygons supported")
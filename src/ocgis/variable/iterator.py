@@ -4,7 +4,7 @@ from itertools import product
 import numpy as np
 from ocgis.base import AbstractOcgisObject
 from ocgis.base import get_dimension_names, get_variable_names
-from ocgis.constants import HeaderName
+from ocgis.constants import HeaderName, DEFAULT_ITERATOR_BLOCK_SIZE
 
 
 class Iterator(AbstractOcgisObject):
@@ -198,6 +198,88 @@ class Iterator(AbstractOcgisObject):
     def get_repeaters(self, headers_only=False, found=None):
         return get_repeaters(self, headers_only=headers_only, found=found)
 
+    def iter_columns(self, block_size=None):
+        """
+        Columnar equivalent of iterating over the object. Records are yielded in blocks as ordered dictionaries mapping
+        record keys to lists of values. Concatenating the blocks row-wise gives exactly the records yielded by
+        iteration. Follower values are formatted once per element and then broadcast to the records using index
+        arrays.
+
+        :param int block_size: The number of lead variable elements to process per block. If ``None``, use
+         :attr:`ocgis.constants.DEFAULT_ITERATOR_BLOCK_SIZE`. Melted blocks contain a multiple of this number of
+         records.
+        :rtype: :class:`collections.OrderedDict`
+        :raises: ValueError
+        """
+
+        if block_size is None:
+            block_size = DEFAULT_ITERATOR_BLOCK_SIZE
+
+        shape = self.shape
+        melted = self.melted
+        melted_repeaters = self.melted_repeaters
+        has_followers = len(self.iterators) > 1
+        should_skip = not self.allow_masked
+        formatted_cache = {}
+
+        nrecords = int(np.prod(shape))
+        for start in range(0, nrecords, block_size):
+            stop = min(start + block_size, nrecords)
+            if len(shape) == 0:
+                index = ()
+            else:
+                index = np.unravel_index(np.arange(start, stop), shape)
+
+            # Collect the columns in the same order as the record keys. Later columns replace earlier columns having
+            # the same key.
+            collected = OrderedDict()
+            skip = np.zeros(stop - start, dtype=bool)
+            for itr in self.iterators:
+                pairs, itr_skip = get_column_pairs(itr, index, formatted_cache)
+                for key, column in pairs:
+                    collected[key] = column
+                if should_skip and itr_skip is not None:
+                    skip = np.logical_or(skip, itr_skip)
+
+            if skip.any():
+                keep = np.invert(skip)
+                for key, column in list(collected.items()):
+                    collected[key] = (column[0][keep], None if column[1] is None else column[1][keep])
+            nkeep = (stop - start) - skip.sum()
+            if nkeep == 0:
+                continue
+
+            if self._is_lead and has_followers and melted is not None:
+                # Each record is repeated for each melted variable.
+                melted_values = [collected.pop(m) for m in melted]
+                snapshots = []
+                for midx, m in enumerate(melted):
+                    if melted_repeaters is not None:
+                        for mr in melted_repeaters.get(m, []):
+                            collected[mr[0]] = get_constant_column(mr[1], nkeep)
+                    collected[HeaderName.VARIABLE] = get_constant_column(m, nkeep)
+                    collected[HeaderName.VALUE] = melted_values[midx]
+                    snapshots.append(collected.copy())
+                keys = list(snapshots[0].keys())
+                if any([list(snapshot.keys()) != keys for snapshot in snapshots]):
+                    msg = 'Melted records do not share the same keys and may not be iterated by column.'
+                    raise ValueError(msg)
+
+                block = OrderedDict()
+                len_melted = len(melted)
+                converted = {}
+                for key in keys:
+                    block[key] = [None] * (nkeep * len_melted)
+                    for midx, snapshot in enumerate(snapshots):
+                        column = snapshot[key]
+                        if id(column) not in converted:
+                            converted[id(column)] = get_column_list(column)
+                        block[key][midx::len_melted] = converted[id(column)]
+            else:
+                block = OrderedDict([(key, get_column_list(column)) for key, column in collected.items()])
+
+            yield block
+
 
 def get_record(idx, value, mask):
     asscalar = np.asscalar
@@ -216,6 +298,130 @@ def get_record(idx, value, mask):
     return ret_value, ret_mask
 
 
+def get_column_list(column):
+    """
+    Convert a column to a list of values. Values are converted to Python scalars in the same way as :func:`get_record`.
+
+    :param tuple column: A column tuple composed of a value array and an optional boolean array. ``True`` values in
+     the boolean array are converted to ``None``.
+    :rtype: list
+    """
+
+    value, none_mask = column
+    ret = value.tolist()
+    if none_mask is not None:
+        for idx in np.flatnonzero(none_mask).tolist():
+            ret[idx] = None
+    return ret
+
+
+def get_column_pairs(iterator, index, formatted_cache):
+    """
+    Create the record columns for an iterator.
+
+    :param iterator: The target iterator.
+    :type iterator: :class:`~ocgis.variable.iterator.Iterator`
+    :param tuple index: Index arrays for the lead iterator's records.
+    :param dict formatted_cache: Stores formatted values for iterators using a formatter. Keys are iterator
+     identifiers.
+    :return: A tuple composed of a sequence of key/column pairs and a boolean array indicating records to skip.
+     The skip array is ``None`` if no records should be skipped because of this iterator.
+    :rtype: tuple
+    """
+
+    from ocgis.driver.base import AbstractDriver
+
+    name = iterator.variable.name
+    value = np.ma.getdata(iterator.value)
+    mask = iterator.mask
+    size = index[0].shape[0] if len(index) > 0 else 1
+
+    if iterator.slice_remap is not None:
+        index = tuple([index[ii] for ii in iterator.slice_remap])
+    if value.ndim == 0:
+        flat_index = np.zeros(size, dtype=int)
+    else:
+        flat_index = np.ravel_multi_index(index, value.shape)
+
+    if mask is None:
+        record_mask = None
+    else:
+        record_mask = mask.reshape(-1)[flat_index]
+
+    if not iterator.allow_masked and iterator.primary_mask == name and record_mask is not None:
+        skip = record_mask
+    else:
+        skip = None
+
+    formatter = iterator.formatter
+    if formatter is None or formatter is AbstractDriver.iterator_formatter:
+        if iterator.clobber_masked:
+            none_mask = record_mask
+        else:
+            none_mask = None
+        pairs = [(name, (value.reshape(-1)[flat_index], none_mask))]
+    else:
+        # Format each element of the iterator's value once.
+        key = id(iterator)
+        if key not in formatted_cache:
+            formatted_cache[key] = get_formatted_columns(name, value, mask, formatter, iterator.clobber_masked)
+        pairs = [(k, (v[flat_index], None)) for k, v in formatted_cache[key]]
+
+    if iterator.repeaters is not None:
+        pairs = [(r[0], get_constant_column(r[1], size)) for r in iterator.repeaters] + pairs
+
+    return pairs, skip
+
+
+def get_constant_column(value, size):
+    """
+    :param value: The value to repeat.
+    :param int size: The column size.
+    :return: A column tuple with ``value`` repeated ``size`` times.
+    :rtype: tuple
+    """
+    ret = np.empty(size, dtype=object)
+    ret.fill(value)
+    return ret, None
+
+
+def get_formatted_columns(name, value, mask, formatter, clobber_masked):
+    """
+    Apply a formatter to each element of an array.
+
+    :return: A sequence of key/array pairs. Arrays have the same size as ``value``.
+    :rtype: list
+    :raises: ValueError
+    """
+    flat_value = value.reshape(-1).tolist()
+    if mask is None:
+        flat_mask = [False] * len(flat_value)
+    else:
+        flat_mask = mask.reshape(-1).tolist()
+
+    keys = None
+    columns = None
+    for idx, (element_value, element_mask) in enumerate(zip(flat_value, flat_mask)):
+        if element_mask and clobber_masked:
+            element_value = None
+        formatted = formatter(name, element_value, element_mask)
+        if keys is None:
+            keys = [f[0] for f in formatted]
+            columns = [np.empty(len(flat_value), dtype=object) for _ in keys]
+        elif [f[0] for f in formatted] != keys:
+            msg = 'Formatted records for variable "{}" do not share the same keys and may not be iterated by ' \
+                  'column.'.format(name)
+            raise ValueError(msg)
+        for column, f in zip(columns, formatted):
+            column[idx] = f[1]
+
+    if keys is None:
+        ret = []
+    else:
+        ret = list(zip(keys, columns))
+    return ret
+
+
 def get_followers(followers, found=None):
     if found is None:
         found = []
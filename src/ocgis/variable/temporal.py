@@ -1,6 +1,7 @@
 import datetime
+import hashlib
 import itertools
-from collections import deque
+from collections import deque, OrderedDict
 from copy import deepcopy
 from decimal import Decimal
 
@@ -236,15 +237,28 @@ class TemporalVariable(SourcedVariable):
         :rtype: :class:`~ocgis.variable.temporal.TemporalGroupVariable`
         """
 
-        # There is no need to go through the process of breaking out datetime parts when the grouping is 'all'.
-        if grouping == 'all':
-            new_bounds, date_parts, repr_dt, dgroups = self._get_grouping_all_()
-        # The process for getting "unique" seasons is also specialized.
-        elif 'unique' in grouping:
-            new_bounds, date_parts, repr_dt, dgroups = self._get_grouping_seasonal_unique_(grouping)
-        # For standard groups ("['month']") or seasons across entire time range.
+        # Groupings are reused for time coordinates with the same fingerprint.
+        if TEMPORAL_GROUP_CACHE.maxsize > 0:
+            cache_key = self._get_grouping_cache_key_(grouping)
+            cached = TEMPORAL_GROUP_CACHE.get(cache_key)
         else:
-            new_bounds, date_parts, repr_dt, dgroups = self._get_grouping_other_(grouping)
+            cache_key = None
+            cached = None
+
+        if cached is not None:
+            new_bounds, date_parts, repr_dt, dgroups = _get_grouping_copy_(cached)
+        else:
+            # There is no need to go through the process of breaking out datetime parts when the grouping is 'all'.
+            if grouping == 'all':
+                new_bounds, date_parts, repr_dt, dgroups = self._get_grouping_all_()
+            # The process for getting "unique" seasons is also specialized.
+            elif 'unique' in grouping:
+                new_bounds, date_parts, repr_dt, dgroups = self._get_grouping_seasonal_unique_(grouping)
+            # For standard groups ("['month']") or seasons across entire time range.
+            else:
+                new_bounds, date_parts, repr_dt, dgroups = self._get_grouping_other_(grouping)
+            if cache_key is not None:
+                TEMPORAL_GROUP_CACHE.set(cache_key, _get_grouping_copy_((new_bounds, date_parts, repr_dt, dgroups)))
 
         new_name = 'climatology_bounds'
         time_dimension_name = self.dimensions[0].name
@@ -444,6 +458,29 @@ class TemporalVariable(SourcedVariable):
 
         return ret
 
+    def _get_date_parts_(self):
+        """
+        :returns: Integer array with shape ``(n, 6)`` containing the date parts (year, month, day, hour, minute, second)
+         for each time value.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        ret = None
+        if not self._has_months_units:
+            value = self.value_numtime
+            if not np.ma.is_masked(value):
+                ret = get_date_parts_from_numtime(value.data, self.units, self.calendar)
+
+        # Decoding from numeric time is not supported for the calendar or units. Extract the parts from the datetime
+        # objects.
+        if ret is None:
+            value_datetime = self.value_datetime.reshape(-1)
+            ret = np.empty((value_datetime.shape[0], len(self._date_parts)), dtype=int)
+            for idx, dp in enumerate(self._date_parts):
+                ret[:, idx] = [getattr(dt, dp) for dt in value_datetime]
+
+        return ret
+
     def _get_grouping_all_(self):
         """
         Applied when the grouping is 'all'.
@@ -464,73 +501,48 @@ class TemporalVariable(SourcedVariable):
 
         return new_bounds, date_parts, repr_dt, dgroups
 
-    def _get_grouping_other_(self, grouping):
+    def _get_grouping_cache_key_(self, grouping):
         """
-        Applied to groups other than 'all'.
+        :param grouping: See :meth:`~ocgis.TemporalVariable.get_grouping`.
+        :returns: A fingerprint of the numeric time values, units, calendar, bounds, and grouping.
+        :rtype: tuple
         """
 
-        # map date parts to index positions in date part storage array and flip
-        # they key-value pairs
-        group_map = dict(list(zip(list(range(0, len(self._date_parts))), self._date_parts, )))
-        group_map_rev = dict(list(zip(self._date_parts, list(range(0, len(self._date_parts))), )))
-
-        # this array will hold the value data constructed differently depending
-        # on if temporal bounds are present
-        value = np.empty((self.get_value().shape[0], 3), dtype=object)
-
-        # reference the value and bounds datetime object arrays
-        value_datetime = self.value_datetime
+        digest = hashlib.sha1()
+        targets = [self.value_numtime]
         if self.has_bounds:
-            value_datetime_bounds = self.bounds.value_datetime
-        else:
-            value_datetime_bounds = None
+            targets.append(self.bounds.value_numtime)
+        for target in targets:
+            digest.update(str((target.dtype.str, target.shape)).encode())
+            digest.update(np.ascontiguousarray(target.data).tobytes())
+            digest.update(np.ascontiguousarray(np.ma.getmaskarray(target)).tobytes())
+        return digest.hexdigest(), str(self.units), self.calendar, self.has_bounds, repr(grouping)
 
-        # populate the value array depending on the presence of bounds
-        if value_datetime_bounds is None:
-            value[:, :] = value_datetime.reshape(-1, 1)
-        # bounds are currently not used for the grouping mechanism
-        else:
-            value[:, 0] = value_datetime_bounds[:, 0]
-            value[:, 1] = value_datetime
-            value[:, 2] = value_datetime_bounds[:, 1]
+    def _get_grouping_other_(self, grouping):
+        """
+        Applied to groups other than 'all'.
+        """
 
-        def _get_attrs_(dt):
-            return ([dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second])
+        # map date parts to index positions in date part storage array
+        group_map_rev = dict(list(zip(self._date_parts, list(range(0, len(self._date_parts))), )))
 
         # extract the date parts
-        parts = np.empty((len(self.get_value()), len(self._date_parts)), dtype=int)
-        for row in range(parts.shape[0]):
-            parts[row, :] = _get_attrs_(value[row, 1])
+        parts = self._get_date_parts_()
+        size = parts.shape[0]
 
         # grouping is different for date part combinations v. seasonal
         # aggregation.
         if all([isinstance(ii, six.string_types) for ii in grouping]):
-            unique = deque()
-            for idx in range(parts.shape[1]):
-                if group_map[idx] in grouping:
-                    fill = np.unique(parts[:, idx])
-                else:
-                    fill = [None]
-                unique.append(fill)
-
-            select = deque()
-            idx2_seq = list(range(len(self._date_parts)))
-            for idx in itertools.product(*[list(range(len(u))) for u in unique]):
-                select.append([unique[idx2][idx[idx2]] for idx2 in idx2_seq])
-            select = np.array(select)
-            dgroups = deque()
-
-            idx_cmp = [group_map_rev[group] for group in grouping]
-
-            keep_select = []
-            for idx in range(select.shape[0]):
-                match = select[idx, idx_cmp] == parts[:, idx_cmp]
-                dgrp = match.all(axis=1)
-                if dgrp.any():
-                    keep_select.append(idx)
-                    dgroups.append(dgrp)
-            select = select[keep_select, :]
-            assert (len(dgroups) == select.shape[0])
+            # unique date part combinations are sorted in date part order (year, month, day, ...)
+            idx_cmp = sorted([group_map_rev[group] for group in grouping])
+            unique, group_ids = np.unique(parts[:, idx_cmp], axis=0, return_inverse=True)
+            group_ids = group_ids.reshape(-1)
+            ngroups = unique.shape[0]
+
+            select = np.empty((ngroups, len(self._date_parts)), dtype=object)
+            select[:, idx_cmp] = unique
+
+            dgroups = TemporalGroupIndex.from_group_ids(group_ids, ngroups)
 
             dtype = [(dp, object) for dp in self._date_parts]
         # this is for seasonal aggregations
@@ -541,40 +553,37 @@ class TemporalVariable(SourcedVariable):
             # search for a year flag, which will break the temporal groups by
             # years
             if 'year' in grouping:
-                has_year = True
                 grouping = list(grouping)
                 grouping.remove('year')
-                years = np.unique(parts[:, 0])
+                years, year_ids = np.unique(parts[:, 0], return_inverse=True)
+                year_ids = year_ids.reshape(-1)
             else:
-                has_year = False
                 years = [None]
-
-            dgroups = deque()
-            grouping_season = deque()
+                year_ids = np.zeros(size, dtype=int)
 
             # sort the arrays to ensure the ordered in ascending order
-            years.sort()
             grouping = get_sorted_seasons(grouping, method='min')
 
-            for year, season in itertools.product(years, grouping):
-                subgroup = np.zeros(value.shape[0], dtype=bool)
-                for idx in range(value.shape[0]):
-                    if has_year:
-                        if parts[idx, 1] in season and year == parts[idx, 0]:
-                            subgroup[idx] = True
-                    else:
-                        if parts[idx, 1] in season:
-                            subgroup[idx] = True
-                dgroups.append(subgroup)
-                grouping_season.append([season, year])
+            # group identifiers follow the (year, season) product order. seasons may overlap so a time index may belong
+            # to more than one group.
+            nseasons = len(grouping)
+            member_indices = []
+            member_group_ids = []
+            for idx_season, season in enumerate(grouping):
+                in_season = np.flatnonzero(np.isin(parts[:, 1], season))
+                member_indices.append(in_season)
+                member_group_ids.append(year_ids[in_season] * nseasons + idx_season)
+            dgroups = TemporalGroupIndex.from_group_ids(np.hstack(member_group_ids), len(years) * nseasons,
+                                                        indices=np.hstack(member_indices), size=size)
+
+            grouping_season = [[season, year] for year, season in itertools.product(years, grouping)]
             dtype = [('months', object), ('year', int)]
             grouping = grouping_season
 
         # init arrays to hold values and bounds for the grouped data
         new_value = np.empty((len(dgroups),), dtype=dtype)
-        new_bounds = np.empty((len(dgroups), 2), dtype=object)
 
-        for idx, dgrp in enumerate(dgroups):
+        for idx in range(len(dgroups)):
             # Tuple conversion is required for structure arrays: http://docs.scipy.org/doc/numpy/user/basics.rec.html#filling-structured-arrays
             try:
                 new_value[idx] = tuple(select[idx])
@@ -586,16 +595,42 @@ class TemporalVariable(SourcedVariable):
                 # and it is a Nonetype
                 except TypeError:
                     new_value[idx]['months'] = grouping[idx][0]
-            sel = value[dgrp][:, (0, 2)]
-            new_bounds[idx, :] = [sel.min(), sel.max()]
 
-        new_bounds = np.atleast_2d(new_bounds).reshape(-1, 2)
+        new_bounds = self._get_grouping_bounds_(dgroups)
         date_parts = np.atleast_1d(new_value)
         # This is the representative center time for the temporal group.
         repr_dt = self._get_grouping_representative_datetime_(grouping, new_bounds, date_parts)
 
         return new_bounds, date_parts, repr_dt, dgroups
 
+    def _get_grouping_bounds_(self, dgroups):
+        """
+        :param dgroups: The temporal group index.
+        :type dgroups: :class:`~ocgis.variable.temporal.TemporalGroupIndex`
+        :returns: Two-dimensional ``object`` array containing the minimum and maximum ``datetime`` for each group.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        if dgroups.get_counts().min() == 0:
+            raise ValueError('Temporal groups may not be empty.')
+
+        # bounds are chosen from the numeric value or bounds array with bounds given preference
+        value = self.value_numtime.data
+        if self.has_bounds:
+            bounds = self.bounds.value_numtime.data
+            lower = np.min(bounds, axis=1)
+            upper = np.max(bounds, axis=1)
+        else:
+            lower = upper = value
+
+        new_bounds = np.empty((len(dgroups), 2), dtype=value.dtype)
+        new_bounds[:, 0] = np.minimum.reduceat(lower[dgroups.indices], dgroups.starts)
+        new_bounds[:, 1] = np.maximum.reduceat(upper[dgroups.indices], dgroups.starts)
+
+        ret = np.empty(new_bounds.shape, dtype=object)
+        ret[:] = self.get_datetime(new_bounds)
+        return ret
+
     def _get_grouping_representative_datetime_(self, grouping, bounds, value):
         ref_value = value
         ref_bounds = bounds
@@ -750,8 +785,9 @@ class TemporalGroupVariable(TemporalVariable):
     Additional keyword arguments are:
     
     :keyword grouping: (``=None``) See :meth:`~ocgis.TemporalVariable.get_grouping`.
-    :keyword dgroups: (``=None``) Sequence of boolean arrays defining each unique temporal group.
-    :type dgroups: `sequence` of :class:`numpy.ndarray`
+    :keyword dgroups: (``=None``) Sequence of boolean arrays defining each unique temporal group. A
+     :class:`~ocgis.variable.temporal.TemporalGroupIndex` may be used for a compact representation.
+    :type dgroups: `sequence` of :class:`numpy.ndarray` | :class:`~ocgis.variable.temporal.TemporalGroupIndex`
     :keyword date_parts: (``=None``) Sequence of date part tuples.
     :type date_parts: `sequence` of :class:`tuple`
     """
@@ -765,6 +801,160 @@ class TemporalGroupVariable(TemporalVariable):
         super(TemporalGroupVariable, self).__init__(*args, **kwargs)
 
 
+class TemporalGroupIndex(object):
+    """
+    Compact storage for temporal group membership. Time indices for each group are stored in a flat array with each
+    group occupying a contiguous block. Indexing or iterating the object returns boolean selection arrays with length
+    equal to the source time dimension for compatibility with sequences of boolean groups. These arrays are created
+    when requested and are not stored.
+
+    :param indices: Flat array of time indices ordered by group.
+    :type indices: :class:`numpy.ndarray`
+    :param starts: Start index of each group in ``indices``.
+    :type starts: :class:`numpy.ndarray`
+    :param int size: The size of the source time dimension.
+    """
+
+    def __init__(self, indices, starts, size):
+        self.indices = indices
+        self.starts = starts
+        self.size = size
+
+    def __getitem__(self, idx):
+        ret = np.zeros(self.size, dtype=bool)
+        ret[self.get_group(idx)] = True
+        return ret
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __len__(self):
+        return self.starts.shape[0]
+
+    @classmethod
+    def from_group_ids(cls, group_ids, ngroups, indices=None, size=None):
+        """
+        Create a group index from group identifiers.
+
+        :param group_ids: Integer group identifier for each element of ``indices`` in ``[0, ngroups)``.
+        :type group_ids: :class:`numpy.ndarray`
+        :param int ngroups: The total number of groups.
+        :param indices: The time index associated with each group identifier. If ``None``, the group identifiers are
+         assumed to map to each time index in order.
+        :type indices: :class:`numpy.ndarray`
+        :param int size: The size of the source time dimension. Defaults to the length of ``group_ids``.
+        :rtype: :class:`~ocgis.variable.temporal.TemporalGroupIndex`
+        """
+
+        if indices is None:
+            indices = np.arange(group_ids.shape[0])
+        if size is None:
+            size = group_ids.shape[0]
+        # A stable sort maintains time order within each group.
+        order = np.argsort(group_ids, kind='mergesort')
+        counts = np.bincount(group_ids, minlength=ngroups)
+        starts = np.zeros(ngroups, dtype=int)
+        starts[1:] = np.cumsum(counts)[:-1]
+        return cls(indices[order], starts, size)
+
+    def get_counts(self):
+        """
+        :returns: The number of time indices in each group.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        return np.diff(np.append(self.starts, self.indices.shape[0]))
+
+    def get_group(self, idx):
+        """
+        :param int idx: The group index.
+        :returns: The time indices for the group.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        stops = np.append(self.starts[1:], self.indices.shape[0])
+        return self.indices[self.starts[idx]:stops[idx]]
+
+
+class TemporalGroupCache(object):
+    """
+    Bounded least-recently-used cache of temporal grouping results keyed by a time coordinate fingerprint. Hits and
+    misses are counted for each lookup.
+
+    :param int maxsize: The maximum number of cached groupings. If ``None``, use
+     :attr:`ocgis.env.TEMPORAL_GROUP_CACHE_SIZE`. A size of zero disables the cache.
+    """
+
+    def __init__(self, maxsize=None):
+        self.hits = 0
+        self.misses = 0
+
+        self._maxsize = maxsize
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def maxsize(self):
+        if self._maxsize is None:
+            ret = env.TEMPORAL_GROUP_CACHE_SIZE
+        else:
+            ret = self._maxsize
+        return ret
+
+    def clear(self):
+        """
+        Remove all cached groupings and reset the hit and miss counters.
+        """
+
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        :param key: The cache key.
+        :returns: The cached grouping or ``None`` if it is not in the cache.
+        """
+
+        try:
+            ret = self._store.pop(key)
+        except KeyError:
+            self.misses += 1
+            ret = None
+        else:
+            # Move the entry to the most recently used position.
+            self._store[key] = ret
+            self.hits += 1
+        return ret
+
+    def get_stats(self):
+        """
+        :returns: Dictionary containing the hit and miss counts, the current size, and the maximum size.
+        :rtype: dict
+        """
+
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self), 'maxsize': self.maxsize}
+
+    def set(self, key, value):
+        """
+        Add a grouping to the cache evicting the least recently used groupings if the cache is full.
+
+        :param key: The cache key.
+        :param value: The grouping to cache.
+        """
+
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        self._store.pop(key, None)
+        self._store[key] = value
+        while len(self._store) > maxsize:
+            self._store.popitem(last=False)
+
+
 def get_datetime_conversion_state(archetype):
     """
     :param archetype: The object to test for conversion to datetime.
@@ -859,6 +1049,54 @@ def get_datetime_or_netcdftime(*args, **kwargs):
     return ret
 
 
+def get_date_parts_from_numtime(value, units, calendar):
+    """
+    Decode date parts from numeric time values using vectorized calendar arithmetic.
+
+    :param value: One-dimensional array of numeric time values.
+    :type value: :class:`numpy.ndarray`
+    :param str units: The time units (i.e. ``'days since 1900-01-01'``).
+    :param str calendar: The CF calendar name.
+    :returns: Integer array with shape ``(n, 6)`` containing year, month, day, hour, minute, and second. ``None`` is
+     returned if the units or calendar are not supported.
+    :rtype: :class:`numpy.ndarray` | None
+    """
+
+    units = str(units)
+    calendar = str(calendar or constants.DEFAULT_TEMPORAL_CALENDAR).lower()
+    try:
+        interval, _ = units.split(' since ', 1)
+        interval_seconds = _NUMTIME_INTERVAL_SECONDS[interval.strip().lower()]
+        days_from_date, date_from_days = _NUMTIME_CALENDARS[calendar]
+        origin = nc.num2date(0, units, calendar=calendar)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+    value = np.asarray(value).reshape(-1)
+    if not np.issubdtype(value.dtype, np.number) or not np.all(np.isfinite(value)):
+        return None
+
+    # Work in integer microseconds to avoid accumulating floating point error for large offsets. Fractional intervals are
+    # rounded to the nearest millisecond as floating point precision is not sufficient for microseconds.
+    usec_per_day = 86400 * 10 ** 6
+    usec_per_interval = interval_seconds * 10 ** 6
+    whole = np.floor(value)
+    usec = whole.astype(np.int64) * usec_per_interval
+    usec += np.round((value - whole) * (interval_seconds * 10 ** 3)).astype(np.int64) * 10 ** 3
+    usec += ((origin.hour * 60 + origin.minute) * 60 + origin.second) * 10 ** 6 + origin.microsecond
+
+    days = days_from_date(origin.year, origin.month, origin.day) + usec // usec_per_day
+    usec_of_day = usec % usec_per_day
+
+    ret = np.empty((value.shape[0], 6), dtype=int)
+    ret[:, 0], ret[:, 1], ret[:, 2] = date_from_days(days)
+    seconds_of_day = usec_of_day // 10 ** 6
+    ret[:, 3] = seconds_of_day // 3600
+    ret[:, 4] = (seconds_of_day % 3600) // 60
+    ret[:, 5] = seconds_of_day % 60
+    return ret
+
+
 def get_difference_in_months(origin, target):
     """
     Get the integer difference in months between an origin and target datetime.
@@ -1126,3 +1364,100 @@ def iter_boolean_groups_from_time_regions(time_regions, tvar, yield_subset=False
             yld = dgroup
 
         yield yld
+
+
+def _get_grouping_copy_(grouping):
+    # Copy mutable grouping components so cached groupings are not modified by their consumers. Group index objects are
+    # not modified following creation and may be shared.
+    new_bounds, date_parts, repr_dt, dgroups = grouping
+    if isinstance(dgroups, (list, deque)):
+        dgroups = type(dgroups)(dgroups)
+    if date_parts is not None:
+        date_parts = date_parts.copy()
+    return new_bounds.copy(), date_parts, repr_dt.copy(), dgroups
+
+
+def _get_date_from_jdn_(jdn, gregorian=True):
+    # Richards' algorithm converting Julian day numbers to Gregorian or Julian calendar dates.
+    f = jdn + 1401
+    if gregorian:
+        f = f + (((4 * jdn + 274277) // 146097) * 3) // 4 - 38
+    e = 4 * f + 3
+    h = 5 * ((e % 1461) // 4) + 2
+    day = (h % 153) // 5 + 1
+    month = ((h // 153 + 2) % 12) + 1
+    year = e // 1461 - 4716 + (14 - month) // 12
+    return year, month, day
+
+
+def _get_jdn_from_date_(year, month, day, gregorian=True):
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    ret = day + (153 * m + 2) // 5 + 365 * y + y // 4
+    if gregorian:
+        ret = ret - y // 100 + y // 400 - 32045
+    else:
+        ret = ret - 32083
+    return ret
+
+
+# The Julian day number of the first day of the Gregorian calendar (1582-10-15).
+_GREGORIAN_START_JDN = 2299161
+
+
+def _get_jdn_from_date_standard_(year, month, day):
+    gregorian = (year, month, day) >= (1582, 10, 15)
+    return _get_jdn_from_date_(year, month, day, gregorian=gregorian)
+
+
+def _get_date_from_jdn_standard_(jdn):
+    ret_gregorian = _get_date_from_jdn_(jdn, gregorian=True)
+    ret_julian = _get_date_from_jdn_(jdn, gregorian=False)
+    is_gregorian = jdn >= _GREGORIAN_START_JDN
+    return tuple(np.where(is_gregorian, g, j) for g, j in zip(ret_gregorian, ret_julian))
+
+
+def _get_fixed_year_calendar_functions_(month_lengths):
+    # Conversion functions for calendars with the same number of days in every year.
+    cumulative = np.cumsum([0] + list(month_lengths))
+    days_per_year = cumulative[-1]
+
+    def _days_from_date_(year, month, day):
+        return year * days_per_year + cumulative[month - 1] + day - 1
+
+    def _date_from_days_(days):
+        year = days // days_per_year
+        day_of_year = days % days_per_year
+        month = np.searchsorted(cumulative, day_of_year, side='right')
+        day = day_of_year - cumulative[month - 1] + 1
+        return year, month, day
+
+    return _days_from_date_, _date_from_days_
+
+
+def _get_calendar_functions_():
+    ret = {}
+    ret['proleptic_gregorian'] = (_get_jdn_from_date_, _get_date_from_jdn_)
+    ret['julian'] = (lambda y, m, d: _get_jdn_from_date_(y, m, d, gregorian=False),
+                     lambda jdn: _get_date_from_jdn_(jdn, gregorian=False))
+    ret['standard'] = ret['gregorian'] = (_get_jdn_from_date_standard_, _get_date_from_jdn_standard_)
+    noleap = _get_fixed_year_calendar_functions_([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    ret['noleap'] = ret['365_day'] = noleap
+    all_leap = _get_fixed_year_calendar_functions_([31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    ret['all_leap'] = ret['366_day'] = all_leap
+    ret['360_day'] = _get_fixed_year_calendar_functions_([30] * 12)
+    return ret
+
+
+#: Maps CF calendar names to functions converting dates to day counts and day counts to dates.
+_NUMTIME_CALENDARS = _get_calendar_functions_()
+
+#: Maps time unit intervals to their length in seconds.
+_NUMTIME_INTERVAL_SECONDS = {'days': 86400, 'day': 86400, 'd': 86400,
+                             'hours': 3600, 'hour': 3600, 'hrs': 3600, 'hr': 3600, 'h': 3600,
+                             'minutes': 60, 'minute': 60, 'mins': 60, 'min': 60,
+                             'seconds': 1, 'second': 1, 'secs': 1, 'sec': 1, 's': 1}
+
+#: Process-wide cache for temporal groupings.
+TEMPORAL_GROUP_CACHE = TemporalGroupCache()